@@ -2,9 +2,16 @@
 Configuration settings for the venue specification extraction tool.
 """
 import os
+import re
+from functools import lru_cache
 from dotenv import load_dotenv
 
-load_dotenv()
+@lru_cache(maxsize=1)
+def _init_env():
+    """Load the .env file once per process."""
+    load_dotenv()
+
+_init_env()
 
 # API Keys
 OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
@@ -15,16 +22,97 @@ SERPER_API_KEY = os.getenv('SERPER_API_KEY')
 # Rate limiting
 MAX_CONCURRENT_REQUESTS = int(os.getenv('MAX_CONCURRENT_REQUESTS', 5))
 REQUEST_DELAY_SECONDS = float(os.getenv('REQUEST_DELAY_SECONDS', 0.5))
+# Serper queries in flight, and retries after a 429
+SERPER_MAX_CONCURRENT_REQUESTS = int(os.getenv('SERPER_MAX_CONCURRENT_REQUESTS', 1))
+SERPER_MAX_RETRIES = int(os.getenv('SERPER_MAX_RETRIES', 3))
+# Site crawl: links followed from the home page, and pages fetched in parallel per site
+CRAWL_MAX_DEPTH = int(os.getenv('CRAWL_MAX_DEPTH', 2))
+CRAWL_WORKERS = int(os.getenv('CRAWL_WORKERS', 8))
+# Most PDFs taken from one site, whether listed in its sitemaps or found by crawling it
+MAX_PDFS_PER_SITE = int(os.getenv('MAX_PDFS_PER_SITE', 20))
+# Bytes of a candidate website read to check it for venue keywords (the rest of the page is not downloaded)
+VALIDATION_MAX_BYTES = int(os.getenv('VALIDATION_MAX_BYTES', 128 * 1024))
+# Bytes of a crawled page read for links; anything past this is neither downloaded nor parsed
+HTML_MAX_BYTES = int(os.getenv('HTML_MAX_BYTES', 512 * 1024))
+# Crawled pages at least this large are parsed in a process pool of this many workers, off the event loop
+HTML_PARSE_POOL_MIN_BYTES = int(os.getenv('HTML_PARSE_POOL_MIN_BYTES', 128 * 1024))
+HTML_PARSE_WORKERS = int(os.getenv('HTML_PARSE_WORKERS', os.cpu_count() or 1))
+# Sitemap files (including nested ones from sitemap indexes) read per host before falling back to crawling
+SITEMAP_MAX_FILES = int(os.getenv('SITEMAP_MAX_FILES', 5))
+# Bytes read of robots.txt and of each sitemap, before and after gzip decompression
+SITEMAP_MAX_BYTES = int(os.getenv('SITEMAP_MAX_BYTES', 10 * 1024 * 1024))
+
+# PDF downloads (in-flight downloads, pooled connections in total and per host)
+MAX_CONCURRENT_DOWNLOADS = int(os.getenv('MAX_CONCURRENT_DOWNLOADS', 20))
+DOWNLOAD_CONNECTION_LIMIT = int(os.getenv('DOWNLOAD_CONNECTION_LIMIT', 100))
+DOWNLOAD_CONNECTIONS_PER_HOST = int(os.getenv('DOWNLOAD_CONNECTIONS_PER_HOST', 4))
+# Seconds an idle pooled connection is kept open for reuse (saves TCP and TLS handshakes)
+HTTP_KEEPALIVE_SECONDS = float(os.getenv('HTTP_KEEPALIVE_SECONDS', 60))
+# Downloads in flight per host, and retries after a 429 (the host's delay then grows for later requests)
+MAX_DOWNLOADS_PER_HOST = int(os.getenv('MAX_DOWNLOADS_PER_HOST', 2))
+DOWNLOAD_MAX_RETRIES = int(os.getenv('DOWNLOAD_MAX_RETRIES', 3))
+MAX_HOST_DELAY_SECONDS = float(os.getenv('MAX_HOST_DELAY_SECONDS', 60))
+# Requests started per second to any one website host (pages and downloads; 0 disables pacing)
+MAX_REQUESTS_PER_HOST_PER_SECOND = float(os.getenv('MAX_REQUESTS_PER_HOST_PER_SECOND', 10))
+
+# How worker process pools start their workers. Not plain fork: pools are created while logging,
+# executor and library threads are running, and a forked child could inherit a lock one of them holds
+PROCESS_START_METHOD = os.getenv('PROCESS_START_METHOD', 'spawn' if os.name == 'nt' else 'forkserver')
+
+# Venues buffered between pipeline stages (discovery, download, parsing, extraction, standardization)
+PIPELINE_QUEUE_SIZE = int(os.getenv('PIPELINE_QUEUE_SIZE', 4))
+# Most venues whose PDFs are sent to AI extraction together (their blocks share packed requests)
+EXTRACTION_VENUE_BATCH_SIZE = int(os.getenv('EXTRACTION_VENUE_BATCH_SIZE', 10))
+
+# OpenAI request concurrency and retries
+OPENAI_MAX_CONCURRENT_REQUESTS = int(os.getenv('OPENAI_MAX_CONCURRENT_REQUESTS', 8))
+OPENAI_MAX_RETRIES = int(os.getenv('OPENAI_MAX_RETRIES', 3))
+
+# OpenAI models (table-only requests, requests with free text, feature lookups,
+# and the model used to retry responses that are not valid JSON)
+EXTRACTION_MODEL_TABLE = os.getenv('EXTRACTION_MODEL_TABLE', 'gpt-4o-mini')
+EXTRACTION_MODEL_TEXT = os.getenv('EXTRACTION_MODEL_TEXT', 'gpt-4o-mini')
+FEATURES_MODEL = os.getenv('FEATURES_MODEL', 'gpt-4o-mini')
+EXTRACTION_FALLBACK_MODEL = os.getenv('EXTRACTION_FALLBACK_MODEL', 'gpt-4o')
+
+# Extraction request packing (estimated input tokens per request, output token cap)
+EXTRACTION_BATCH_MAX_TOKENS = int(os.getenv('EXTRACTION_BATCH_MAX_TOKENS', 8000))
+EXTRACTION_MAX_OUTPUT_TOKENS = int(os.getenv('EXTRACTION_MAX_OUTPUT_TOKENS', 8000))
+
+# OpenAI Batch API (runs with at least this many extraction requests use one batch job)
+OPENAI_BATCH_MIN_REQUESTS = int(os.getenv('OPENAI_BATCH_MIN_REQUESTS', 100))
+OPENAI_BATCH_POLL_SECONDS = float(os.getenv('OPENAI_BATCH_POLL_SECONDS', 30))
+
+# On-disk cache of OpenAI responses keyed by request, so unchanged re-runs skip the API
+RESPONSE_CACHE_ENABLED = os.getenv('RESPONSE_CACHE_ENABLED', '1').lower() in ('1', 'true', 'yes')
+RESPONSE_CACHE_DIR = os.getenv('RESPONSE_CACHE_DIR', os.path.join('.cache', 'extractor'))
 
 # PDF processing
 MAX_PDF_SIZE_MB = int(os.getenv('MAX_PDF_SIZE_MB', 50))
 PDF_TIMEOUT_SECONDS = int(os.getenv('PDF_TIMEOUT_SECONDS', 30))
 
+# Export formatting (pretty-printed JSON is larger and slower to write)
+EXPORT_PRETTY = os.getenv('EXPORT_PRETTY', '').lower() in ('1', 'true', 'yes')
+
 # File paths
 OUTPUT_DIR = 'output'
 PDF_CACHE_DIR = 'pdf_cache'
 LOGS_DIR = 'logs'
 
+# On-disk cache of extracted PDF content keyed by file hash, so unchanged PDFs are not re-extracted
+PDF_EXTRACTION_CACHE_ENABLED = os.getenv('PDF_EXTRACTION_CACHE_ENABLED', '1').lower() in ('1', 'true', 'yes')
+PDF_EXTRACTION_CACHE_DIR = os.getenv('PDF_EXTRACTION_CACHE_DIR', os.path.join(PDF_CACHE_DIR, '.extracted'))
+
+# On-disk cache of Serper results and validated venue pages, so repeat runs skip the network
+# (stale pages are revalidated with a conditional request rather than downloaded again)
+WEB_CACHE_ENABLED = os.getenv('WEB_CACHE_ENABLED', '1').lower() in ('1', 'true', 'yes')
+WEB_CACHE_DIR = os.getenv('WEB_CACHE_DIR', os.path.join('.cache', 'web'))
+WEB_CACHE_TTL_HOURS = float(os.getenv('WEB_CACHE_TTL_HOURS', 24))
+
+# Cached Wikipedia page used for venue auto-discovery, refetched once it is older than the TTL
+VENUE_DISCOVERY_CACHE_PATH = os.path.join(PDF_CACHE_DIR, 'wiki_concert_halls.html')
+VENUE_DISCOVERY_CACHE_TTL_HOURS = float(os.getenv('VENUE_DISCOVERY_CACHE_TTL_HOURS', 24))
+
 # Equipment categories and keywords
 EQUIPMENT_CATEGORIES = {
     'lighting': [
@@ -44,6 +132,18 @@ EQUIPMENT_CATEGORIES = {
     ]
 }
 
+# Lowercased keyword sets per category
+EQUIPMENT_KEYWORDS_LOWER = {
+    category: frozenset(keyword.lower() for keyword in keywords)
+    for category, keywords in EQUIPMENT_CATEGORIES.items()
+}
+
+# Precompiled keyword alternation per category, in priority order
+EQUIPMENT_CATEGORY_PATTERNS = {
+    category: re.compile('|'.join(re.escape(keyword) for keyword in sorted(keywords)))
+    for category, keywords in EQUIPMENT_KEYWORDS_LOWER.items()
+}
+
 # Common manufacturer variations
 MANUFACTURER_MAPPINGS = {
     'shure': ['shure', 'shure inc', 'shure incorporated'],
@@ -63,6 +163,14 @@ MANUFACTURER_MAPPINGS = {
     'clay paky': ['clay paky', 'claypaky', 'clay-paky']
 }
 
+# Reverse index of lowercased variation -> standard manufacturer name.
+# Built in reverse so the first listed manufacturer wins on shared variations.
+MANUFACTURER_VARIANT_TO_CANONICAL = {
+    variation.lower(): standard_name
+    for standard_name, variations in reversed(list(MANUFACTURER_MAPPINGS.items()))
+    for variation in variations
+}
+
 # PDF search keywords
 PDF_KEYWORDS = [
     'technical specifications', 'tech specs', 'equipment list', 'inventory',
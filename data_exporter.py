@@ -1,46 +1,95 @@
 """
 Data export module for generating structured JSON output and reports.
 """
-import json
+import csv
 import os
+import orjson
 import logging
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict, List, Any, Optional
-from dataclasses import asdict
+from operator import attrgetter
+from typing import Dict, List, Any, Iterable, Optional, Set, Tuple
 import pandas as pd
 from data_standardizer import StandardizedEquipment
 from data_extractor import DataExtractor
-from config import OUTPUT_DIR
+from config import OUTPUT_DIR, EXPORT_PRETTY
+
+# Buffer size for export file handles (1 MiB)
+EXPORT_BUFFER_SIZE = 1 << 20
+
+# CSV column order
+CSV_COLUMNS = (
+    'venue', 'manufacturer', 'model', 'quantity', 'equipment_type', 'category',
+    'confidence_score', 'source_documents', 'specifications', 'features',
+    'applications', 'compatibility', 'standardization_notes'
+)
 
 class DataExporter:
     """Handles data export and report generation."""
     
     def __init__(self):
         self.data_extractor = DataExtractor()
+        # Compact JSON by default; indent only when EXPORT_PRETTY is set
+        self.json_options = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if EXPORT_PRETTY else 0)
+        # Parsed equipment databases and search indexes by path, reused until the file changes
+        self._loaded_json = {}
+        
+    def _output_path(self, filename: str) -> str:
+        """Return the path of an export file, (re)creating the output directory if it is missing."""
         os.makedirs(OUTPUT_DIR, exist_ok=True)
+        return os.path.join(OUTPUT_DIR, filename)
+    
+    def _write_json(self, filepath: str, data: Any) -> None:
+        """Serialize data once and write it with a single call."""
+        payload = orjson.dumps(data, option=self.json_options)
+        with open(filepath, 'wb', buffering=EXPORT_BUFFER_SIZE) as f:
+            f.write(payload)
+    
+    def _write_json_streamed(self, filepath: str, data: Dict[str, Any], stream_key: str,
+                             entries: Iterable[Tuple[str, Any]]) -> None:
+        """
+        Write data as a JSON object with an extra stream_key member built from entries.
         
+        Each entry is serialized and written on its own, so the full document is
+        never held in memory as a single encoded payload.
+        """
+        with open(filepath, 'wb', buffering=EXPORT_BUFFER_SIZE) as f:
+            f.write(b'{')
+            for key, value in data.items():
+                f.write(orjson.dumps(key) + b':' + orjson.dumps(value, option=self.json_options) + b',\n')
+            
+            f.write(orjson.dumps(stream_key) + b':{')
+            separator = b'\n'
+            for key, value in entries:
+                f.write(separator + orjson.dumps(key) + b':' + orjson.dumps(value, option=self.json_options))
+                separator = b',\n'
+            f.write(b'\n}}')
+    
     def export_to_json(self, standardized_data: Dict[str, List[StandardizedEquipment]], 
-                      filename: Optional[str] = None) -> str:
+                      filename: Optional[str] = None, now: Optional[datetime] = None) -> str:
         """
         Export standardized data to JSON format.
         
         Args:
             standardized_data: Dictionary mapping venue names to standardized equipment
             filename: Optional custom filename
+            now: Optional export time, shared when exporting several formats
             
         Returns:
             Path to the exported JSON file
         """
+        now = now or datetime.now()
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
             filename = f"venue_equipment_data_{timestamp}.json"
         
-        filepath = os.path.join(OUTPUT_DIR, filename)
+        filepath = self._output_path(filename)
         
         # Convert to JSON-serializable format
         export_data = {
             "metadata": {
-                "export_timestamp": datetime.now().isoformat(),
+                "export_timestamp": now.isoformat(),
                 "total_venues": len(standardized_data),
                 "total_equipment_items": sum(len(items) for items in standardized_data.values()),
                 "data_version": "1.0"
@@ -55,130 +104,139 @@ class DataExporter:
                 "equipment": []
             }
             
-            for item in equipment_items:
-                item_dict = asdict(item)
-                venue_data["equipment"].append(item_dict)
+            # orjson serializes dataclasses natively, no asdict() copy needed
+            venue_data["equipment"].extend(equipment_items)
             
             export_data["venues"][venue_name] = venue_data
         
         # Write to JSON file
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
+        self._write_json(filepath, export_data)
         
         logging.info(f"Data exported to JSON: {filepath}")
         return filepath
     
     def export_to_csv(self, standardized_data: Dict[str, List[StandardizedEquipment]], 
-                     filename: Optional[str] = None) -> str:
+                     filename: Optional[str] = None, now: Optional[datetime] = None) -> str:
         """
         Export standardized data to CSV format.
         
         Args:
             standardized_data: Dictionary mapping venue names to standardized equipment
             filename: Optional custom filename
+            now: Optional export time, shared when exporting several formats
             
         Returns:
             Path to the exported CSV file
         """
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = (now or datetime.now()).strftime("%Y%m%d_%H%M%S")
             filename = f"venue_equipment_data_{timestamp}.csv"
         
-        filepath = os.path.join(OUTPUT_DIR, filename)
-        
-        # Flatten data for CSV
-        flattened_data = []
-        
-        for venue_name, equipment_items in standardized_data.items():
-            for item in equipment_items:
-                row = {
-                    'venue': item.venue,
-                    'manufacturer': item.manufacturer,
-                    'model': item.model,
-                    'quantity': item.quantity,
-                    'equipment_type': item.equipment_type,
-                    'category': item.category,
-                    'confidence_score': item.confidence_score,
-                    'source_documents': '; '.join(item.source_documents),
-                    'specifications': json.dumps(item.specifications),
-                    'features': '; '.join(item.features),
-                    'applications': '; '.join(item.applications),
-                    'compatibility': '; '.join(item.compatibility),
-                    'standardization_notes': '; '.join(item.standardization_notes)
-                }
-                flattened_data.append(row)
-        
-        # Create DataFrame and export
-        df = pd.DataFrame(flattened_data)
-        df.to_csv(filepath, index=False, encoding='utf-8')
+        filepath = self._output_path(filename)
+        
+        # Write rows straight from the items, without an intermediate DataFrame
+        with open(filepath, 'w', newline='', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
+            writer = csv.writer(f)
+            writer.writerow(CSV_COLUMNS)
+            writer.writerows(
+                (
+                    item.venue,
+                    item.manufacturer,
+                    item.model,
+                    item.quantity,
+                    item.equipment_type,
+                    item.category,
+                    item.confidence_score,
+                    '; '.join(item.source_documents),
+                    orjson.dumps(item.specifications, option=orjson.OPT_NON_STR_KEYS).decode(),
+                    '; '.join(item.features),
+                    '; '.join(item.applications),
+                    '; '.join(item.compatibility),
+                    '; '.join(item.standardization_notes)
+                )
+                for equipment_items in standardized_data.values()
+                for item in equipment_items
+            )
         
         logging.info(f"Data exported to CSV: {filepath}")
         return filepath
     
+    def _equipment_frame(self, standardized_data: Dict[str, List[StandardizedEquipment]],
+                         columns: Tuple[str, ...]) -> pd.DataFrame:
+        """Build a DataFrame of the given item attributes, one row per equipment item."""
+        data = {name: [] for name in columns}
+        appenders = [column.append for column in data.values()]
+        get_values = attrgetter(*columns)
+        
+        for equipment_items in standardized_data.values():
+            for item in equipment_items:
+                for append, value in zip(appenders, get_values(item)):
+                    append(value)
+        
+        return pd.DataFrame(data)
+    
+    def _series_to_dict(self, series: pd.Series) -> Dict:
+        """Convert an aggregated Series to a dict of plain Python values."""
+        return dict(zip(series.index, series.tolist()))
+    
     def generate_summary_report(self, standardized_data: Dict[str, List[StandardizedEquipment]], 
-                               validation_report: Dict[str, List[str]]) -> str:
+                               validation_report: Dict[str, List[str]],
+                               now: Optional[datetime] = None) -> str:
         """
         Generate a comprehensive summary report.
         
         Args:
             standardized_data: Standardized equipment data
             validation_report: Validation issues report
+            now: Optional report time, shared when exporting several formats
             
         Returns:
             Path to the generated report file
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        now = now or datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
         report_filename = f"venue_equipment_report_{timestamp}.json"
-        report_filepath = os.path.join(OUTPUT_DIR, report_filename)
+        report_filepath = self._output_path(report_filename)
         
         # Calculate statistics
         total_venues = len(standardized_data)
         total_equipment = sum(len(items) for items in standardized_data.values())
         
-        # Category breakdown
-        category_stats = {}
-        manufacturer_stats = {}
-        venue_stats = {}
+        # Aggregate with pandas groupby; sort=False keeps first-seen key order
+        df = self._equipment_frame(standardized_data, ('category', 'manufacturer', 'quantity', 'confidence_score'))
+        df.insert(0, 'venue_name', [venue_name for venue_name, items in standardized_data.items() for _ in items])
         
-        for venue_name, equipment_items in standardized_data.items():
-            venue_stats[venue_name] = {
+        # Category and manufacturer breakdown
+        category_stats = self._series_to_dict(df.groupby('category', sort=False, dropna=False)['quantity'].sum())
+        manufacturer_stats = self._series_to_dict(df.groupby('manufacturer', sort=False, dropna=False)['quantity'].sum())
+        
+        venue_stats = {
+            venue_name: {
                 'total_items': len(equipment_items),
                 'categories': {},
                 'manufacturers': {},
                 'avg_confidence': 0
             }
-            
-            confidence_scores = []
-            
-            for item in equipment_items:
-                # Category stats
-                if item.category not in category_stats:
-                    category_stats[item.category] = 0
-                category_stats[item.category] += item.quantity
-                
-                if item.category not in venue_stats[venue_name]['categories']:
-                    venue_stats[venue_name]['categories'][item.category] = 0
-                venue_stats[venue_name]['categories'][item.category] += item.quantity
-                
-                # Manufacturer stats
-                if item.manufacturer not in manufacturer_stats:
-                    manufacturer_stats[item.manufacturer] = 0
-                manufacturer_stats[item.manufacturer] += item.quantity
-                
-                if item.manufacturer not in venue_stats[venue_name]['manufacturers']:
-                    venue_stats[venue_name]['manufacturers'][item.manufacturer] = 0
-                venue_stats[venue_name]['manufacturers'][item.manufacturer] += item.quantity
-                
-                confidence_scores.append(item.confidence_score)
-            
-            # Calculate average confidence for venue
-            if confidence_scores:
-                venue_stats[venue_name]['avg_confidence'] = sum(confidence_scores) / len(confidence_scores)
+            for venue_name, equipment_items in standardized_data.items()
+        }
+        
+        venue_categories = df.groupby(['venue_name', 'category'], sort=False, dropna=False)['quantity'].sum()
+        for (venue_name, category), quantity in self._series_to_dict(venue_categories).items():
+            venue_stats[venue_name]['categories'][category] = quantity
+        
+        venue_manufacturers = df.groupby(['venue_name', 'manufacturer'], sort=False, dropna=False)['quantity'].sum()
+        for (venue_name, manufacturer), quantity in self._series_to_dict(venue_manufacturers).items():
+            venue_stats[venue_name]['manufacturers'][manufacturer] = quantity
+        
+        # Calculate average confidence per venue
+        avg_confidence = df.groupby('venue_name', sort=False)['confidence_score'].mean()
+        for venue_name, confidence in self._series_to_dict(avg_confidence).items():
+            venue_stats[venue_name]['avg_confidence'] = confidence
         
         # Generate report
         report = {
             "report_metadata": {
-                "generated_at": datetime.now().isoformat(),
+                "generated_at": now.isoformat(),
                 "report_version": "1.0"
             },
             "summary": {
@@ -198,33 +256,34 @@ class DataExporter:
         }
         
         # Write report
-        with open(report_filepath, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        self._write_json(report_filepath, report)
         
         logging.info(f"Summary report generated: {report_filepath}")
         return report_filepath
     
-    def export_equipment_database(self, standardized_data: Dict[str, List[StandardizedEquipment]]) -> str:
+    def export_equipment_database(self, standardized_data: Dict[str, List[StandardizedEquipment]],
+                                  now: Optional[datetime] = None) -> str:
         """
         Export equipment database with enhanced features for each device.
         
         Args:
             standardized_data: Standardized equipment data
+            now: Optional creation time, shared when exporting several formats
             
         Returns:
             Path to the equipment database file
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        now = now or datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
         db_filename = f"equipment_database_{timestamp}.json"
-        db_filepath = os.path.join(OUTPUT_DIR, db_filename)
+        db_filepath = self._output_path(db_filename)
         
         equipment_database = {
             "database_metadata": {
-                "created_at": datetime.now().isoformat(),
+                "created_at": now.isoformat(),
                 "version": "1.0",
                 "description": "Comprehensive equipment database with features and specifications"
-            },
-            "equipment": {}
+            }
         }
         
         # Create unique equipment entries
@@ -237,20 +296,15 @@ class DataExporter:
                 
                 if equipment_key not in unique_equipment:
                     # Get enhanced features for this equipment
-                    try:
-                        features = self.data_extractor.get_equipment_features(
-                            item.manufacturer, item.model
-                        )
-                    except Exception as e:
-                        logging.error(f"Error getting features for {item.manufacturer} {item.model}: {e}")
-                        features = {}
+                    features = self._get_equipment_features(item.manufacturer, item.model)
                     
                     unique_equipment[equipment_key] = {
                         "manufacturer": item.manufacturer,
                         "model": item.model,
                         "category": item.category,
                         "equipment_type": item.equipment_type,
-                        "specifications": item.specifications,
+                        # Copy so merging below never mutates the source item
+                        "specifications": dict(item.specifications),
                         "features": features.get('features', []),
                         "typical_applications": features.get('typical_applications', []),
                         "compatibility": features.get('compatibility', []),
@@ -271,20 +325,30 @@ class DataExporter:
                     # Update confidence score (use maximum)
                     existing["confidence_score"] = max(existing["confidence_score"], item.confidence_score)
         
-        equipment_database["equipment"] = unique_equipment
-        
-        # Write database
-        with open(db_filepath, 'w', encoding='utf-8') as f:
-            json.dump(equipment_database, f, indent=2, ensure_ascii=False)
+        # Write database, streaming equipment entries one at a time, and its search index
+        self._write_json_streamed(db_filepath, equipment_database, "equipment", unique_equipment.items())
+        self._write_json(self._index_path(db_filepath), self._build_search_index(unique_equipment))
         
         logging.info(f"Equipment database exported: {db_filepath}")
         return db_filepath
     
+    def _get_equipment_features(self, manufacturer: str, model: str) -> Dict[str, Any]:
+        """Get equipment features, or {} if the lookup fails (DataExtractor caches them per name)."""
+        try:
+            return self.data_extractor.get_equipment_features(manufacturer, model)
+        except Exception as e:
+            logging.error(f"Error getting features for {manufacturer} {model}: {e}")
+            return {}
+    
     def search_equipment_database(self, database_path: str, manufacturer: str = None, 
                                  model: str = None, category: str = None) -> List[Dict]:
         """
         Search the equipment database for specific equipment.
         
+        The database and its search index are parsed on first use and kept until the
+        files change, so repeated searches only pay for the index lookup and the
+        candidate checks.
+        
         Args:
             database_path: Path to the equipment database JSON file
             manufacturer: Manufacturer to search for
@@ -295,25 +359,26 @@ class DataExporter:
             List of matching equipment entries
         """
         try:
-            with open(database_path, 'r', encoding='utf-8') as f:
-                database = json.load(f)
-            
-            equipment = database.get('equipment', {})
+            equipment = self._load_json_cached(database_path).get('equipment', {})
             results = []
             
-            for equipment_key, equipment_data in equipment.items():
-                match = True
-                
-                if manufacturer and manufacturer.lower() not in equipment_data['manufacturer'].lower():
-                    match = False
-                
-                if model and model.lower() not in equipment_data['model'].lower():
-                    match = False
-                
-                if category and category.lower() != equipment_data['category'].lower():
-                    match = False
-                
-                if match:
+            # Narrow the candidates with the sidecar index when one exists
+            candidate_keys = self._find_candidate_keys(database_path, manufacturer, model, category)
+            if candidate_keys is None:
+                candidate_keys = equipment.keys()
+            
+            # Lowercase the filters once instead of per entry
+            manufacturer_query = manufacturer.lower() if manufacturer else None
+            model_query = model.lower() if model else None
+            category_query = category.lower() if category else None
+            
+            for equipment_key in candidate_keys:
+                equipment_data = equipment[equipment_key]
+                if (
+                    (manufacturer_query is None or manufacturer_query in equipment_data['manufacturer'].lower())
+                    and (model_query is None or model_query in equipment_data['model'].lower())
+                    and (category_query is None or category_query == equipment_data['category'].lower())
+                ):
                     results.append(equipment_data)
             
             return results
@@ -322,6 +387,75 @@ class DataExporter:
             logging.error(f"Error searching equipment database: {e}")
             return []
     
+    def _load_json_cached(self, path: str) -> Any:
+        """Load a JSON file, reusing the parsed copy while the file is unchanged."""
+        mtime = os.stat(path).st_mtime_ns
+        cached = self._loaded_json.get(path)
+        if cached is None or cached[0] != mtime:
+            with open(path, 'rb') as f:
+                cached = (mtime, orjson.loads(f.read()))
+            self._loaded_json[path] = cached
+        return cached[1]
+    
+    def _index_path(self, database_path: str) -> str:
+        """Get the path of the search index stored next to a database file."""
+        return os.path.splitext(database_path)[0] + '.idx.json'
+    
+    def _trigrams(self, text: str) -> Set[str]:
+        """Get the set of lowercase three-character substrings of text."""
+        text = text.lower()
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+    
+    def _build_search_index(self, unique_equipment: Dict[str, Dict]) -> Dict[str, Dict[str, List[str]]]:
+        """Build an inverted index of equipment keys by category and name trigrams."""
+        index = {
+            'by_category': defaultdict(list),
+            'manufacturer_trigrams': defaultdict(list),
+            'model_trigrams': defaultdict(list)
+        }
+        
+        for equipment_key, equipment_data in unique_equipment.items():
+            index['by_category'][equipment_data['category'].lower()].append(equipment_key)
+            for trigram in self._trigrams(equipment_data['manufacturer']):
+                index['manufacturer_trigrams'][trigram].append(equipment_key)
+            for trigram in self._trigrams(equipment_data['model']):
+                index['model_trigrams'][trigram].append(equipment_key)
+        
+        return {name: dict(entries) for name, entries in index.items()}
+    
+    def _find_candidate_keys(self, database_path: str, manufacturer: Optional[str],
+                             model: Optional[str], category: Optional[str]) -> Optional[List[str]]:
+        """
+        Use the search index to find equipment keys that may match the filters.
+        
+        Returns None when there is no index or no filter can be narrowed by it.
+        Candidates still need to be checked against the filters.
+        """
+        if not (category or (manufacturer and len(manufacturer) >= 3) or (model and len(model) >= 3)):
+            return None
+        try:
+            index = self._load_json_cached(self._index_path(database_path))
+        except FileNotFoundError:
+            return None
+        
+        key_lists = []
+        if category:
+            key_lists.append(index['by_category'].get(category.lower(), []))
+        
+        # Substring filters can only be narrowed when they contain a full trigram
+        for query, trigram_index in ((manufacturer, index['manufacturer_trigrams']),
+                                     (model, index['model_trigrams'])):
+            if query and len(query) >= 3:
+                key_lists.extend(trigram_index.get(trigram, []) for trigram in self._trigrams(query))
+        
+        if not key_lists:
+            return None
+        
+        # Intersect, keeping the database order of the smallest list
+        smallest = min(key_lists, key=len)
+        others = [set(keys) for keys in key_lists if keys is not smallest]
+        return [key for key in smallest if all(key in keys for keys in others)]
+    
     def _generate_recommendations(self, standardized_data: Dict[str, List[StandardizedEquipment]], 
                                  validation_report: Dict[str, List[str]]) -> List[str]:
         """Generate recommendations based on the data analysis."""
@@ -332,32 +466,32 @@ class DataExporter:
         if total_issues > 0:
             recommendations.append(f"Address {total_issues} data quality issues identified in validation report")
         
-        # Coverage recommendations
-        venues_with_no_data = [venue for venue, items in standardized_data.items() if not items]
-        if venues_with_no_data:
-            recommendations.append(f"No equipment data found for {len(venues_with_no_data)} venues: {', '.join(venues_with_no_data)}")
-        
-        # Confidence score recommendations
-        low_confidence_items = []
-        for venue_name, items in standardized_data.items():
-            for item in items:
-                if item.confidence_score < 0.5:
-                    low_confidence_items.append(f"{venue_name}: {item.manufacturer} {item.model}")
-        
-        if low_confidence_items:
-            recommendations.append(f"Review {len(low_confidence_items)} items with low confidence scores")
-        
-        # Standardization recommendations
+        # Collect coverage, confidence and standardization gaps in one pass
+        venues_with_no_data = []
+        low_confidence_count = 0
         unknown_manufacturers = set()
         unknown_models = set()
         
         for venue_name, items in standardized_data.items():
+            if not items:
+                venues_with_no_data.append(venue_name)
             for item in items:
+                if item.confidence_score < 0.5:
+                    low_confidence_count += 1
                 if item.manufacturer == "Unknown":
                     unknown_manufacturers.add(f"{venue_name}: {item.equipment_type}")
                 if item.model == "Unknown":
                     unknown_models.add(f"{venue_name}: {item.manufacturer}")
         
+        # Coverage recommendations
+        if venues_with_no_data:
+            recommendations.append(f"No equipment data found for {len(venues_with_no_data)} venues: {', '.join(venues_with_no_data)}")
+        
+        # Confidence score recommendations
+        if low_confidence_count:
+            recommendations.append(f"Review {low_confidence_count} items with low confidence scores")
+        
+        # Standardization recommendations
         if unknown_manufacturers:
             recommendations.append(f"Identify manufacturers for {len(unknown_manufacturers)} equipment items")
         
@@ -380,26 +514,29 @@ class DataExporter:
         """
         exported_files = {}
         
-        try:
-            # JSON export
-            json_path = self.export_to_json(standardized_data)
-            exported_files['json'] = json_path
-            
-            # CSV export
-            csv_path = self.export_to_csv(standardized_data)
-            exported_files['csv'] = csv_path
-            
-            # Summary report
-            report_path = self.generate_summary_report(standardized_data, validation_report)
-            exported_files['report'] = report_path
-            
-            # Equipment database
-            db_path = self.export_equipment_database(standardized_data)
-            exported_files['database'] = db_path
+        # Share one timestamp so all exported files get the same suffix
+        now = datetime.now()
+        
+        # The exports only read standardized_data, so run them concurrently
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {
+                executor.submit(self.export_to_json, standardized_data, now=now): 'json',
+                executor.submit(self.export_to_csv, standardized_data, now=now): 'csv',
+                executor.submit(self.generate_summary_report, standardized_data, validation_report, now=now): 'report',
+                executor.submit(self.export_equipment_database, standardized_data, now=now): 'database'
+            }
             
+            for future in as_completed(futures):
+                format_name = futures[future]
+                try:
+                    exported_files[format_name] = future.result()
+                except Exception as e:
+                    logging.error(f"Error during {format_name} export: {e}")
+        
+        # Keep the usual format order regardless of completion order
+        exported_files = {name: exported_files[name] for name in futures.values() if name in exported_files}
+        
+        if len(exported_files) == len(futures):
             logging.info(f"All formats exported successfully: {list(exported_files.keys())}")
-            
-        except Exception as e:
-            logging.error(f"Error during export: {e}")
         
         return exported_files
\ No newline at end of file
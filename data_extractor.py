@@ -1,17 +1,90 @@
 """
 AI-powered data extraction module for extracting equipment information from PDF content.
 """
+import asyncio
+import hashlib
 import openai
-import json
+import os
+import orjson
 import re
+import sys
 import logging
-from typing import List, Dict, Optional, Any
-from dataclasses import dataclass, asdict
-import time
+from typing import List, Dict, Optional, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, asdict
+from functools import lru_cache
 from pdf_processor import PDFContent
 from config import *
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+try:
+    import ijson  # Incremental parsing of streamed responses
+except ImportError:
+    ijson = None
 
-@dataclass
+# Equipment-related keywords and manufacturer names, compiled into one
+# alternation so a chunk is scanned once regardless of keyword count
+EQUIPMENT_INDICATORS = [
+    'manufacturer', 'model', 'quantity', 'specifications',
+    'audio', 'video', 'lighting', 'sound', 'microphone', 'speaker',
+    'projector', 'screen', 'mixer', 'amplifier', 'led', 'fixture',
+    'console', 'system', 'equipment', 'device'
+] + list(MANUFACTURER_MAPPINGS.keys())
+EQUIPMENT_INDICATOR_PATTERN = re.compile('|'.join(re.escape(indicator) for indicator in EQUIPMENT_INDICATORS))
+
+WHITESPACE_PATTERN = re.compile(r'\s+')
+SENTENCE_BOUNDARY_PATTERN = re.compile(r'(?<=[.!?])\s+')
+
+# Part of every response cache key; bump when prompts or response handling change
+PROMPT_VERSION = 1
+
+# Token overlap between hard splits of oversized sentences, and the size below
+# which a trailing chunk is merged into its neighbour instead of sent on its own
+CHUNK_OVERLAP_TOKENS = 32
+MIN_CHUNK_TOKENS = 100
+
+@lru_cache(maxsize=None)
+def _get_encoding(model: str):
+    """Return the tiktoken encoding for a model, or None when tiktoken is unavailable."""
+    if not tiktoken:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("o200k_base")
+
+def _encode(text: str) -> Optional[List[int]]:
+    """Encode text with the extraction model's tokenizer."""
+    encoding = _get_encoding(EXTRACTION_MODEL_TEXT)
+    if encoding is None:
+        return None
+    return encoding.encode(text, disallowed_special=())
+
+def _count_tokens(text: str) -> int:
+    """Count tokens exactly with tiktoken, falling back to 1 token ≈ 4 characters."""
+    token_ids = _encode(text)
+    if token_ids is None:
+        return len(text) // 4
+    return len(token_ids)
+
+# Static extraction instructions, sent once per request as the system message
+EXTRACTION_SYSTEM_PROMPT = """You are an expert at extracting structured equipment data from technical documents.
+Each user message contains blocks of table data (tab-separated, first row is the header) or text.
+Return only a valid JSON object mapping each block id to a JSON array of audio-visual equipment items:
+{"manufacturer": "string", "model": "string", "quantity": number, "equipment_type": "string", "category": "lighting|sound|video", "specifications": {"key": "value"}, "confidence_score": 0.0-1.0}
+Guidelines:
+- In tables, only extract actual equipment items (not headers, totals, or non-equipment text)
+- In text, only extract clear equipment mentions with identifiable manufacturer/model
+- Normalize manufacturer names (e.g., "Shure Inc." -> "Shure")
+- Categorize equipment as lighting, sound, or video
+- Include quantity as a number (default to 1 if not specified)
+- Extract any technical specifications mentioned
+- Assign confidence score based on data completeness and clarity
+- Use an empty array for blocks without equipment"""
+
+@dataclass(slots=True)
 class EquipmentItem:
     """Structure for individual equipment items."""
     manufacturer: str
@@ -23,6 +96,19 @@ class EquipmentItem:
     specifications: Dict[str, Any]
     source_document: str
     confidence_score: float
+    dedup_key: Tuple[str, str, str] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Normalized once here so deduplication does not re-lowercase per comparison
+        self.dedup_key = (self.manufacturer.lower(), self.model.lower(), self.category.lower())
+
+@dataclass
+class ExtractionBlock:
+    """A table or text chunk queued for AI extraction."""
+    block_id: str
+    kind: str  # table, text
+    content: str
+    pdf_content: PDFContent
 
 class DataExtractor:
     """AI-powered equipment data extraction from PDF content."""
@@ -34,295 +120,493 @@ class DataExtractor:
         openai.api_key = OPENAI_API_KEY
         self.client = openai.OpenAI(api_key=OPENAI_API_KEY)
         
+        # Created per extraction run, since both are bound to the running event loop
+        self.async_client = None
+        self._request_semaphore = None
+        
+        # Equipment features by normalized (manufacturer, model), see get_equipment_features
+        self._feature_cache = {}
+        
     def extract_equipment_data(self, processed_content: Dict[str, List[PDFContent]]) -> Dict[str, List[EquipmentItem]]:
         """
         Extract equipment data from processed PDF content.
         
+        Synchronous wrapper around extract_equipment_data_async for callers
+        that are not already running an event loop.
+        
         Args:
             processed_content: Dictionary mapping venue names to PDF content
             
         Returns:
             Dictionary mapping venue names to extracted equipment items
         """
-        extracted_data = {}
+        return asyncio.run(self.extract_equipment_data_async(processed_content))
+    
+    async def extract_equipment_data_async(self, processed_content: Dict[str, List[PDFContent]]) -> Dict[str, List[EquipmentItem]]:
+        """
+        Extract equipment data from processed PDF content.
         
-        for venue_name, pdf_contents in processed_content.items():
-            logging.info(f"Extracting equipment data for venue: {venue_name}")
-            venue_equipment = []
+        Tables and text chunks from every PDF are packed into as few requests
+        as the token budget allows. Large runs are submitted as a single
+        OpenAI Batch API job; smaller ones send the requests concurrently,
+        up to OPENAI_MAX_CONCURRENT_REQUESTS at a time.
+        
+        Args:
+            processed_content: Dictionary mapping venue names to PDF content
             
-            for pdf_content in pdf_contents:
+        Returns:
+            Dictionary mapping venue names to extracted equipment items
+        """
+        self.async_client = openai.AsyncOpenAI(api_key=OPENAI_API_KEY)
+        self._request_semaphore = asyncio.Semaphore(OPENAI_MAX_CONCURRENT_REQUESTS)
+        
+        try:
+            # Phase 1: collect every table and text chunk, then pack them into requests
+            # (chunking and token counting run in a thread, so a running pipeline's other stages keep going)
+            venue_blocks = await asyncio.to_thread(self._collect_blocks, processed_content)
+            groups = await asyncio.to_thread(self._group_blocks, [
+                block for pdf_blocks in venue_blocks.values() for blocks in pdf_blocks for block in blocks
+            ])
+            
+            block_items = None
+            if len(groups) >= OPENAI_BATCH_MIN_REQUESTS:
                 try:
-                    equipment_items = self._extract_from_pdf_content(pdf_content)
-                    venue_equipment.extend(equipment_items)
-                    
-                    # Rate limiting for API calls
-                    time.sleep(1)
-                    
+                    block_items = await self._extract_with_batch_api(groups)
                 except Exception as e:
-                    logging.error(f"Error extracting data from {pdf_content.file_path}: {e}")
-                    continue
+                    logging.error(f"Batch extraction failed, falling back to per-request extraction: {e}")
             
-            extracted_data[venue_name] = venue_equipment
+            if block_items is None:
+                block_items = await self._extract_groups(groups)
             
-        return extracted_data
+            # Phase 2: route extracted items back to their PDFs and venues
+            return self._assemble_results(venue_blocks, block_items)
+        
+        finally:
+            await self.async_client.close()
     
-    def _extract_from_pdf_content(self, pdf_content: PDFContent) -> List[EquipmentItem]:
-        """Extract equipment data from a single PDF content."""
-        equipment_items = []
+    def _collect_blocks(self, processed_content: Dict[str, List[PDFContent]]) -> Dict[str, List[List[ExtractionBlock]]]:
+        """Build extraction blocks for every PDF, tables first, grouped by venue and PDF."""
+        pdf_contents = [pdf_content for contents in processed_content.values() for pdf_content in contents]
         
-        # Extract from tables first (most structured data)
-        if pdf_content.tables:
-            table_equipment = self._extract_from_tables(pdf_content)
-            equipment_items.extend(table_equipment)
+        # Chunking and tokenization are independent per PDF (tiktoken releases the GIL)
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+            prepared_contents = iter(executor.map(self._block_contents, pdf_contents))
         
-        # Extract from text content
-        text_equipment = self._extract_from_text(pdf_content)
-        equipment_items.extend(text_equipment)
+        venue_blocks = {}
+        # Ids come from block content, so the same table or chunk gets the same id (and the
+        # same prompt text, hence response cache hits) however venues were batched together
+        block_ids = set()
         
-        # Remove duplicates and merge similar items
-        equipment_items = self._deduplicate_equipment(equipment_items)
+        for venue_name, contents_for_venue in processed_content.items():
+            logging.info(f"Extracting equipment data for venue: {venue_name}")
+            pdf_blocks = []
+            
+            for pdf_content in contents_for_venue:
+                blocks = []
+                
+                for kind, content in next(prepared_contents):
+                    block_id = f"block_{hashlib.blake2b(f'{kind}:{content}'.encode('utf-8'), digest_size=6).hexdigest()}"
+                    # Identical blocks (e.g. the same PDF for two venues) still need distinct ids
+                    duplicate = 1
+                    unique_id = block_id
+                    while unique_id in block_ids:
+                        duplicate += 1
+                        unique_id = f"{block_id}_{duplicate}"
+                    block_ids.add(unique_id)
+                    blocks.append(ExtractionBlock(unique_id, kind, content, pdf_content))
+                
+                pdf_blocks.append(blocks)
+            
+            venue_blocks[venue_name] = pdf_blocks
         
-        return equipment_items
+        return venue_blocks
     
-    def _extract_from_tables(self, pdf_content: PDFContent) -> List[EquipmentItem]:
-        """Extract equipment data from tables using AI."""
-        equipment_items = []
+    def _block_contents(self, pdf_content: PDFContent) -> List[Tuple[str, str]]:
+        """Return (kind, content) pairs for a PDF: tables first (most structured data), then relevant text chunks."""
+        contents = [
+            ('table', self._table_to_text(table)) for table in pdf_content.tables
+            if self._table_contains_equipment_info(table)
+        ]
+        contents += [
+            ('text', WHITESPACE_PATTERN.sub(' ', chunk)) for _, chunk in self._equipment_text_chunks(pdf_content)
+        ]
+        return contents
+    
+    def _group_blocks(self, blocks: List[ExtractionBlock]) -> List[List[ExtractionBlock]]:
+        """Pack consecutive blocks into groups that fit the per-request token budget."""
+        groups = []
+        current_group = []
+        current_tokens = 0
+        
+        for block in blocks:
+            block_tokens = _count_tokens(block.content)
+            if current_group and current_tokens + block_tokens > EXTRACTION_BATCH_MAX_TOKENS:
+                groups.append(current_group)
+                current_group = []
+                current_tokens = 0
+            current_group.append(block)
+            current_tokens += block_tokens
+        
+        if current_group:
+            groups.append(current_group)
+        
+        return groups
+    
+    def _assemble_results(self, venue_blocks: Dict[str, List[List[ExtractionBlock]]],
+                          block_items: Dict[str, List[EquipmentItem]]) -> Dict[str, List[EquipmentItem]]:
+        """Collect items per PDF in block order, deduplicate them and group by venue."""
+        extracted_data = {}
         
-        for table_idx, table in enumerate(pdf_content.tables):
-            try:
-                # Convert table to a more readable format
-                table_text = self._table_to_text(table)
-                
-                # Use AI to extract structured data
-                extracted_items = self._ai_extract_from_table(table_text, pdf_content, table_idx)
-                equipment_items.extend(extracted_items)
+        for venue_name, pdf_blocks in venue_blocks.items():
+            venue_equipment = []
+            
+            for blocks in pdf_blocks:
+                equipment_items = [item for block in blocks for item in block_items.get(block.block_id, [])]
                 
-            except Exception as e:
-                logging.error(f"Error extracting from table {table_idx}: {e}")
-                continue
+                # Remove duplicates and merge similar items
+                venue_equipment.extend(self._deduplicate_equipment(equipment_items))
+            
+            extracted_data[venue_name] = venue_equipment
         
-        return equipment_items
+        return extracted_data
     
-    def _extract_from_text(self, pdf_content: PDFContent) -> List[EquipmentItem]:
-        """Extract equipment data from unstructured text using AI."""
-        # Split text into manageable chunks
-        text_chunks = self._split_text_into_chunks(pdf_content.text, max_tokens=3000)
-        
-        equipment_items = []
+    async def _extract_groups(self, groups: List[List[ExtractionBlock]]) -> Dict[str, List[EquipmentItem]]:
+        """Send one chat completion per group concurrently; the semaphore bounds in-flight calls."""
+        results = await asyncio.gather(*[self._ai_extract_batch(group) for group in groups], return_exceptions=True)
+        
+        block_items = {}
+        for group_idx, result in enumerate(results):
+            if isinstance(result, Exception):
+                logging.error(f"Error extracting from request {group_idx}: {result}")
+                continue
+            block_items.update(result)
         
-        for chunk_idx, chunk in enumerate(text_chunks):
+        return block_items
+    
+    async def _extract_with_batch_api(self, groups: List[List[ExtractionBlock]]) -> Dict[str, List[EquipmentItem]]:
+        """Run all extraction requests as one Batch API job."""
+        block_items = {}
+        batch_requests = []
+        pending_groups = []
+        
+        for group_idx, group in enumerate(groups):
+            body = self._batch_request_body(group)
+            cached_response = self._read_cached_response(body)
+            if cached_response is not None:
+                block_items.update(self._parse_batch_response(cached_response, group))
+                continue
+            batch_requests.append({
+                "custom_id": f"request_{group_idx}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": body
+            })
+            pending_groups.append(group)
+        
+        if not batch_requests:
+            return block_items
+        
+        logging.info(f"Submitting {len(batch_requests)} extraction requests as a batch job")
+        responses = await self._run_batch_job(batch_requests)
+        
+        for request, group in zip(batch_requests, pending_groups):
+            custom_id = request["custom_id"]
+            if custom_id not in responses:
+                continue
             try:
-                # Only process chunks that likely contain equipment information
-                if self._chunk_contains_equipment_info(chunk):
-                    extracted_items = self._ai_extract_from_text(chunk, pdf_content, chunk_idx)
-                    equipment_items.extend(extracted_items)
-                    
+                block_items.update(self._parse_batch_response(responses[custom_id], group))
+                self._write_cached_response(request["body"], responses[custom_id])
             except Exception as e:
-                logging.error(f"Error extracting from text chunk {chunk_idx}: {e}")
-                continue
+                logging.error(f"Error parsing batch response {custom_id}: {e}")
         
-        return equipment_items
+        return block_items
     
-    def _ai_extract_from_table(self, table_text: str, pdf_content: PDFContent, table_idx: int) -> List[EquipmentItem]:
-        """Use AI to extract equipment data from table text."""
-        prompt = f"""
-        Extract audio-visual equipment information from the following table data. 
-        Return a JSON array of equipment items with the following structure:
-        
-        {{
-            "manufacturer": "string",
-            "model": "string", 
-            "quantity": number,
-            "equipment_type": "string",
-            "category": "lighting|sound|video",
-            "specifications": {{"key": "value"}},
-            "confidence_score": 0.0-1.0
-        }}
-        
-        Guidelines:
-        - Only extract actual equipment items (not headers, totals, or non-equipment text)
-        - Normalize manufacturer names (e.g., "Shure Inc." -> "Shure")
-        - Categorize equipment as lighting, sound, or video
-        - Include quantity as a number (default to 1 if not specified)
-        - Extract any technical specifications mentioned
-        - Assign confidence score based on data completeness and clarity
-        
-        Table data:
-        {table_text}
-        
-        Return only valid JSON array:
+    async def _run_batch_job(self, batch_requests: List[Dict[str, Any]]) -> Dict[str, str]:
         """
+        Upload requests as a JSONL file, wait for the batch to finish and
+        return the response text keyed by custom_id.
+        """
+        payload = b"\n".join(orjson.dumps(request) for request in batch_requests)
+        input_file = await self.async_client.files.create(file=("extraction_batch.jsonl", payload), purpose="batch")
+        batch = await self.async_client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        
+        while batch.status not in ('completed', 'failed', 'expired', 'cancelled'):
+            await asyncio.sleep(OPENAI_BATCH_POLL_SECONDS)
+            batch = await self.async_client.batches.retrieve(batch.id)
+        
+        if batch.status != 'completed' or not batch.output_file_id:
+            raise Exception(f"Batch {batch.id} ended with status {batch.status}")
+        
+        responses = {}
+        output = (await self.async_client.files.content(batch.output_file_id)).text
+        
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            result = orjson.loads(line)
+            response = result.get('response') or {}
+            if response.get('status_code') == 200:
+                responses[result['custom_id']] = response['body']['choices'][0]['message']['content']
+            else:
+                logging.error(f"Batch request {result.get('custom_id')} failed: {result.get('error')}")
         
-        try:
-            response = self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are an expert at extracting structured equipment data from technical documents. Always return valid JSON."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.1,
-                max_tokens=2000
-            )
-            
-            response_text = response.choices[0].message.content.strip()
-            
-            # Clean up response to ensure valid JSON
-            response_text = self._clean_json_response(response_text)
-            
-            # Parse JSON response
-            equipment_data = json.loads(response_text)
-            
-            # Convert to EquipmentItem objects
-            equipment_items = []
-            for item_data in equipment_data:
-                equipment_item = EquipmentItem(
-                    manufacturer=item_data.get('manufacturer', ''),
-                    model=item_data.get('model', ''),
-                    quantity=item_data.get('quantity', 1),
-                    equipment_type=item_data.get('equipment_type', ''),
-                    category=item_data.get('category', ''),
-                    venue=pdf_content.venue,
-                    specifications=item_data.get('specifications', {}),
-                    source_document=pdf_content.file_path,
-                    confidence_score=item_data.get('confidence_score', 0.5)
-                )
-                equipment_items.append(equipment_item)
-            
-            return equipment_items
-            
-        except Exception as e:
-            logging.error(f"AI extraction from table failed: {e}")
-            raise Exception(f"Failed to extract equipment data from table: {e}")
+        return responses
     
-    def _ai_extract_from_text(self, text_chunk: str, pdf_content: PDFContent, chunk_idx: int) -> List[EquipmentItem]:
-        """Use AI to extract equipment data from text chunk."""
-        prompt = f"""
-        Extract audio-visual equipment information from the following text. 
-        Look for mentions of specific equipment with manufacturer, model, and quantities.
-        
-        Return a JSON array of equipment items with this structure:
-        {{
-            "manufacturer": "string",
-            "model": "string",
-            "quantity": number,
-            "equipment_type": "string", 
-            "category": "lighting|sound|video",
-            "specifications": {{"key": "value"}},
-            "confidence_score": 0.0-1.0
-        }}
-        
-        Guidelines:
-        - Only extract clear equipment mentions with identifiable manufacturer/model
-        - Normalize manufacturer names
-        - Categorize as lighting, sound, or video equipment
-        - Extract quantities mentioned in text
-        - Include any specifications or features mentioned
-        - Higher confidence for complete information
-        
-        Text:
-        {text_chunk}
+    def _equipment_text_chunks(self, pdf_content: PDFContent) -> List[Tuple[int, str]]:
+        """Split text into manageable chunks and keep those likely to mention equipment."""
+        text_chunks = self._split_text_into_chunks(pdf_content.text, max_tokens=3000)
         
-        Return only valid JSON array:
-        """
+        return [
+            (chunk_idx, chunk) for chunk_idx, chunk in enumerate(text_chunks)
+            if self._chunk_contains_equipment_info(chunk)
+        ]
+    
+    def _select_model(self, blocks: List[ExtractionBlock]) -> str:
+        """Route table-only requests and requests with free text to their configured models."""
+        if all(block.kind == 'table' for block in blocks):
+            return EXTRACTION_MODEL_TABLE
+        return EXTRACTION_MODEL_TEXT
+    
+    def _batch_request_body(self, blocks: List[ExtractionBlock], model: Optional[str] = None) -> Dict[str, Any]:
+        """Build one chat completion request extracting equipment from several blocks."""
+        sections = "\n\n".join(f"Block {block.block_id} ({block.kind}):\n{block.content}" for block in blocks)
+        
+        prompt = f"{sections}\n\nReturn a JSON object keyed by block id."
+        
+        return {
+            "model": model or self._select_model(blocks),
+            "messages": [
+                {"role": "system", "content": EXTRACTION_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": 0.1,
+            "max_tokens": EXTRACTION_MAX_OUTPUT_TOKENS,
+            "response_format": {"type": "json_object"}
+        }
+    
+    def _parse_batch_response(self, response_text: str, blocks: List[ExtractionBlock]) -> Dict[str, List[EquipmentItem]]:
+        """Parse a model response into EquipmentItem objects per block id."""
+        response_data = self._load_json_response(response_text)
+        if isinstance(response_data, list) and len(blocks) == 1:
+            response_data = {blocks[0].block_id: response_data}
+        if not isinstance(response_data, dict):
+            raise ValueError("Expected a JSON object keyed by block id")
+        
+        # Convert to EquipmentItem objects
+        return {
+            block.block_id: self._to_equipment_items(response_data.get(block.block_id), block.pdf_content)
+            for block in blocks
+        }
+    
+    def _to_equipment_items(self, items: Any, pdf_content: PDFContent) -> List[EquipmentItem]:
+        """Convert a block's extracted items, skipping anything that is not an item object."""
+        if not isinstance(items, list):
+            return []
+        return [self._to_equipment_item(item_data, pdf_content) for item_data in items if isinstance(item_data, dict)]
+    
+    def _to_equipment_item(self, item_data: Dict[str, Any], pdf_content: PDFContent) -> EquipmentItem:
+        """Convert one extracted item to an EquipmentItem for the given PDF (null text fields become empty)."""
+        return EquipmentItem(
+            manufacturer=item_data.get('manufacturer') or '',
+            model=item_data.get('model') or '',
+            quantity=item_data.get('quantity', 1),
+            equipment_type=item_data.get('equipment_type') or '',
+            category=item_data.get('category') or '',
+            venue=pdf_content.venue,
+            # Specification keys repeat across items, so share one string per key
+            specifications={sys.intern(str(key)): value for key, value in (item_data.get('specifications') or {}).items()},
+            source_document=pdf_content.file_path,
+            confidence_score=item_data.get('confidence_score', 0.5)
+        )
+    
+    async def _stream_chat_completion(self, body: Dict[str, Any]):
+        """Stream a chat completion's text deltas, holding a request semaphore slot until it ends."""
+        for attempt in range(OPENAI_MAX_RETRIES + 1):
+            started = False
+            try:
+                async with self._request_semaphore:
+                    stream = await self.async_client.chat.completions.create(**body, stream=True)
+                    async for chunk in stream:
+                        if chunk.choices and chunk.choices[0].delta.content:
+                            started = True
+                            yield chunk.choices[0].delta.content
+                return
+            except (openai.RateLimitError, openai.APIConnectionError, openai.InternalServerError) as e:
+                # Text already handed to the caller cannot be taken back, so only retry before it
+                if started or attempt == OPENAI_MAX_RETRIES:
+                    raise
+                delay = 2 ** attempt
+                logging.warning(f"OpenAI request failed ({e}), retrying in {delay}s")
+                await asyncio.sleep(delay)
+    
+    async def _stream_extraction(self, blocks: List[ExtractionBlock], model: Optional[str] = None) -> Dict[str, List[EquipmentItem]]:
+        """Stream an extraction response, converting each block's items as soon as its array is complete."""
+        body = self._batch_request_body(blocks, model=model)
+        cached_response = self._read_cached_response(body)
+        if cached_response is not None:
+            return self._parse_batch_response(cached_response, blocks)
+        
+        pdf_by_block = {block.block_id: block.pdf_content for block in blocks}
+        block_items = {}
+        text_parts = []
+        
+        events = ijson.sendable_list() if ijson else None
+        parser = ijson.kvitems_coro(events, '', use_float=True) if ijson else None
+        
+        async for text in self._stream_chat_completion(body):
+            text_parts.append(text)
+            if parser is None:
+                continue
+            try:
+                parser.send(text.encode('utf-8'))
+            except ijson.JSONError:
+                parser = None
+                continue
+            for block_id, items in events:
+                if block_id in pdf_by_block and isinstance(items, list):
+                    block_items[block_id] = self._to_equipment_items(items, pdf_by_block[block_id])
+            del events[:]
         
+        if parser is not None:
+            try:
+                parser.close()
+            except ijson.JSONError:
+                parser = None
+        
+        # Without ijson, or when the response was not a clean block-keyed object, parse the full text
+        response_text = "".join(text_parts)
+        if parser is None or not block_items:
+            result = self._parse_batch_response(response_text, blocks)
+        else:
+            result = {block.block_id: block_items.get(block.block_id, []) for block in blocks}
+        
+        self._write_cached_response(body, response_text)
+        return result
+    
+    def _response_cache_path(self, body: Dict[str, Any]) -> str:
+        """Return the cache file for a request body (model, messages and parameters)."""
+        key_source = orjson.dumps({"prompt_version": PROMPT_VERSION, "body": body}, option=orjson.OPT_SORT_KEYS)
+        return os.path.join(RESPONSE_CACHE_DIR, f"{hashlib.sha256(key_source).hexdigest()}.json")
+    
+    def _read_cached_response(self, body: Dict[str, Any]) -> Optional[str]:
+        """Return the cached raw response text for a request, if any."""
+        if not RESPONSE_CACHE_ENABLED:
+            return None
         try:
-            response = self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are an expert at extracting equipment information from technical documents. Always return valid JSON."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.1,
-                max_tokens=1500
-            )
-            
-            response_text = response.choices[0].message.content.strip()
-            response_text = self._clean_json_response(response_text)
-            
-            equipment_data = json.loads(response_text)
-            
-            equipment_items = []
-            for item_data in equipment_data:
-                equipment_item = EquipmentItem(
-                    manufacturer=item_data.get('manufacturer', ''),
-                    model=item_data.get('model', ''),
-                    quantity=item_data.get('quantity', 1),
-                    equipment_type=item_data.get('equipment_type', ''),
-                    category=item_data.get('category', ''),
-                    venue=pdf_content.venue,
-                    specifications=item_data.get('specifications', {}),
-                    source_document=pdf_content.file_path,
-                    confidence_score=item_data.get('confidence_score', 0.5)
-                )
-                equipment_items.append(equipment_item)
-            
-            return equipment_items
+            with open(self._response_cache_path(body), 'r', encoding='utf-8') as f:
+                return f.read()
+        except OSError:
+            return None
+    
+    def _write_cached_response(self, body: Dict[str, Any], response_text: str):
+        """Store a successfully parsed raw response; cache failures never fail extraction."""
+        if not RESPONSE_CACHE_ENABLED:
+            return
+        cache_path = self._response_cache_path(body)
+        try:
+            os.makedirs(RESPONSE_CACHE_DIR, exist_ok=True)
+            temp_path = f"{cache_path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                f.write(response_text)
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            logging.warning(f"Could not write response cache {cache_path}: {e}")
+    
+    async def _ai_extract_batch(self, blocks: List[ExtractionBlock]) -> Dict[str, List[EquipmentItem]]:
+        """Use AI to extract equipment data from a group of blocks in one call."""
+        try:
+            try:
+                return await self._stream_extraction(blocks)
+            except ValueError as e:
+                # Escalate once to the stronger model when the response is not usable JSON
+                logging.warning(f"Unparseable extraction response ({e}), retrying with {EXTRACTION_FALLBACK_MODEL}")
+                return await self._stream_extraction(blocks, model=EXTRACTION_FALLBACK_MODEL)
             
         except Exception as e:
-            logging.error(f"AI extraction from text failed: {e}")
-            raise Exception(f"Failed to extract equipment data from text: {e}")
+            logging.error(f"AI extraction from {len(blocks)} blocks failed: {e}")
+            raise Exception(f"Failed to extract equipment data from blocks: {e}")
     
     def _table_to_text(self, table: List[List[str]]) -> str:
-        """Convert table structure to readable text format."""
+        """Convert table structure to compact tab-separated text."""
         if not table:
             return ""
         
-        # Create formatted table text
-        table_text = ""
-        for row_idx, row in enumerate(table):
-            if row_idx == 0:
-                table_text += "Headers: " + " | ".join(row) + "\n"
-                table_text += "-" * 50 + "\n"
-            else:
-                table_text += "Row: " + " | ".join(row) + "\n"
-        
-        return table_text
+        # Tab-separated rows, the first row being the header; merged cells come through as None
+        return "\n".join("\t".join(cell or "" for cell in row) for row in table)
     
     def _split_text_into_chunks(self, text: str, max_tokens: int = 3000) -> List[str]:
         """Split text into chunks that fit within token limits."""
-        # Rough estimation: 1 token ≈ 4 characters
-        max_chars = max_tokens * 4
-        
-        if len(text) <= max_chars:
+        if _count_tokens(text) <= max_tokens:
             return [text]
         
+        # Split by paragraphs first, then sentences, then fixed token windows
+        pieces = []
+        for paragraph in text.split('\n\n'):
+            if _count_tokens(paragraph) <= max_tokens:
+                pieces.append((paragraph, '\n\n'))
+                continue
+            for sentence in SENTENCE_BOUNDARY_PATTERN.split(paragraph):
+                if _count_tokens(sentence) <= max_tokens:
+                    pieces.append((sentence, ' '))
+                else:
+                    pieces.extend((window, ' ') for window in self._split_by_token_window(sentence, max_tokens))
+            pieces.append(('', '\n\n'))
+        
         chunks = []
         current_chunk = ""
-        
-        # Split by paragraphs first
-        paragraphs = text.split('\n\n')
-        
-        for paragraph in paragraphs:
-            if len(current_chunk) + len(paragraph) <= max_chars:
-                current_chunk += paragraph + "\n\n"
+        current_tokens = 0
+        
+        for piece, separator in pieces:
+            piece_tokens = _count_tokens(piece)
+            if current_chunk.strip() and current_tokens + piece_tokens > max_tokens:
+                chunks.append(current_chunk.strip())
+                current_chunk = ""
+                current_tokens = 0
+            current_chunk += piece + separator
+            current_tokens += piece_tokens
+        
+        if current_chunk.strip():
+            # Merge a short tail into the previous chunk rather than sending it alone
+            if chunks and current_tokens < MIN_CHUNK_TOKENS:
+                chunks[-1] = f"{chunks[-1]} {current_chunk.strip()}"
             else:
-                if current_chunk:
-                    chunks.append(current_chunk.strip())
-                current_chunk = paragraph + "\n\n"
-        
-        if current_chunk:
-            chunks.append(current_chunk.strip())
+                chunks.append(current_chunk.strip())
         
         return chunks
     
-    def _chunk_contains_equipment_info(self, chunk: str) -> bool:
-        """Check if a text chunk likely contains equipment information."""
-        chunk_lower = chunk.lower()
-        
-        # Check for equipment-related keywords
-        equipment_indicators = [
-            'manufacturer', 'model', 'quantity', 'specifications',
-            'audio', 'video', 'lighting', 'sound', 'microphone', 'speaker',
-            'projector', 'screen', 'mixer', 'amplifier', 'led', 'fixture',
-            'console', 'system', 'equipment', 'device'
-        ]
+    def _split_by_token_window(self, text: str, max_tokens: int) -> List[str]:
+        """Split text without usable boundaries into overlapping token windows."""
+        step = max(max_tokens - CHUNK_OVERLAP_TOKENS, 1)
+        token_ids = _encode(text)
         
-        # Check for manufacturer names
-        manufacturer_indicators = list(MANUFACTURER_MAPPINGS.keys())
+        if token_ids is None:
+            # Character windows using the 1 token ≈ 4 characters estimate
+            return [text[start:start + max_tokens * 4] for start in range(0, len(text), step * 4)]
         
-        all_indicators = equipment_indicators + manufacturer_indicators
+        encoding = _get_encoding(EXTRACTION_MODEL_TEXT)
+        return [encoding.decode(token_ids[start:start + max_tokens]) for start in range(0, len(token_ids), step)]
+    
+    def _chunk_contains_equipment_info(self, chunk: str) -> bool:
+        """Check if a text chunk likely contains equipment information."""
+        return EQUIPMENT_INDICATOR_PATTERN.search(chunk.lower()) is not None
+    
+    def _table_contains_equipment_info(self, table: List[List[str]]) -> bool:
+        """Check if a table has a header and data rows, two columns, and equipment keywords."""
+        if len(table) < 2 or max(len(row) for row in table) < 2:
+            return False
         
-        return any(indicator in chunk_lower for indicator in all_indicators)
+        return self._chunk_contains_equipment_info(" ".join(cell or "" for row in table for cell in row))
+    
+    def _load_json_response(self, response_text: str) -> Any:
+        """Parse a JSON mode response, cleaning it up only if it is not valid JSON as returned."""
+        try:
+            return orjson.loads(response_text)
+        except orjson.JSONDecodeError:
+            return orjson.loads(self._clean_json_response(response_text.strip()))
     
     def _clean_json_response(self, response_text: str) -> str:
         """Clean AI response to ensure valid JSON."""
@@ -352,12 +636,10 @@ class DataExtractor:
         grouped_items = {}
         
         for item in equipment_items:
-            # Create a key for grouping similar items
-            key = f"{item.manufacturer.lower()}_{item.model.lower()}_{item.category.lower()}"
+            existing_item = grouped_items.setdefault(item.dedup_key, item)
             
-            if key in grouped_items:
+            if existing_item is not item:
                 # Merge with existing item
-                existing_item = grouped_items[key]
                 existing_item.quantity += item.quantity
                 
                 # Merge specifications
@@ -365,9 +647,6 @@ class DataExtractor:
                 
                 # Use higher confidence score
                 existing_item.confidence_score = max(existing_item.confidence_score, item.confidence_score)
-                
-            else:
-                grouped_items[key] = item
         
         return list(grouped_items.values())
     
@@ -375,6 +654,10 @@ class DataExtractor:
         """
         Get detailed features for a specific equipment model using AI.
         
+        Results are cached per extractor by (manufacturer, model), ignoring case
+        and surrounding whitespace, so repeated equipment only costs one call;
+        the model is still asked about the names as given.
+        
         Args:
             manufacturer: Equipment manufacturer
             model: Equipment model
@@ -382,6 +665,16 @@ class DataExtractor:
         Returns:
             Dictionary of equipment features and specifications
         """
+        cache_key = (manufacturer.strip().lower(), model.strip().lower())
+        features = self._feature_cache.get(cache_key)
+        if features is None:
+            # Failures raise, so they are not cached
+            features = self._fetch_equipment_features(manufacturer, model)
+            self._feature_cache[cache_key] = features
+        return features
+    
+    def _fetch_equipment_features(self, manufacturer: str, model: str) -> Dict[str, Any]:
+        """Ask the model for an equipment item's features."""
         prompt = f"""
         Provide detailed technical specifications and features for the following audio-visual equipment:
         
@@ -409,21 +702,26 @@ class DataExtractor:
         Return only valid JSON:
         """
         
+        body = {
+            "model": FEATURES_MODEL,
+            "messages": [
+                {"role": "system", "content": "You are an expert in audio-visual equipment specifications. Always return valid JSON."},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": 0.1,
+            "max_tokens": 1000,
+            "response_format": {"type": "json_object"}
+        }
+        
         try:
-            response = self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are an expert in audio-visual equipment specifications. Always return valid JSON."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.1,
-                max_tokens=1000
-            )
-            
-            response_text = response.choices[0].message.content.strip()
-            response_text = self._clean_json_response(response_text)
-            
-            features = json.loads(response_text)
+            response_text = self._read_cached_response(body)
+            if response_text is None:
+                response = self.client.chat.completions.create(**body)
+                response_text = response.choices[0].message.content
+                features = self._load_json_response(response_text)
+                self._write_cached_response(body, response_text)
+            else:
+                features = self._load_json_response(response_text)
             return features
             
         except Exception as e:
@@ -3,14 +3,125 @@ Data standardization module for normalizing and mapping equipment data.
 """
 import re
 import logging
-from typing import List, Dict, Optional, Set, Tuple
-from fuzzywuzzy import fuzz, process
-from dataclasses import dataclass, asdict
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Iterable, Iterator, Optional, Set, Tuple
+from rapidfuzz import fuzz, process
+from dataclasses import dataclass
+from functools import lru_cache
 import json
 from data_extractor import EquipmentItem
-from config import MANUFACTURER_MAPPINGS, EQUIPMENT_CATEGORIES
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc  # Column-wise string kernels for bulk normalization
+except ImportError:
+    pa = None
+    pc = None
+from config import (
+    MANUFACTURER_MAPPINGS, MANUFACTURER_VARIANT_TO_CANONICAL,
+    EQUIPMENT_CATEGORIES, EQUIPMENT_CATEGORY_PATTERNS, PROCESS_START_METHOD
+)
 
-@dataclass
+# Distinct input strings remembered per standardization function
+STANDARDIZE_CACHE_SIZE = 10000
+
+# Shared immutable stand-in for empty list fields that nothing mutates
+_EMPTY: Tuple = ()
+
+# Below this many items, worker process startup costs more than it saves
+PARALLEL_MIN_ITEMS = 1000
+
+# Standardizers memoized per instance (see DataStandardizer._init_caches)
+_CACHED_METHODS = (
+    '_standardize_manufacturer', '_standardize_model', '_standardize_category',
+    '_standardize_equipment_type', '_standardize_spec_key', '_standardize_spec_value_str'
+)
+
+# Standard specification keys and the spellings that map to them
+SPEC_KEY_VARIATIONS = {
+    'power': ['power', 'wattage', 'watts', 'power consumption', 'power draw'],
+    'dimensions': ['dimensions', 'size', 'measurements', 'dims'],
+    'weight': ['weight', 'mass'],
+    'frequency_response': ['frequency response', 'freq response', 'frequency range'],
+    'impedance': ['impedance', 'ohms'],
+    'spl': ['spl', 'sound pressure level', 'max spl'],
+    'throw_distance': ['throw distance', 'projection distance'],
+    'resolution': ['resolution', 'native resolution'],
+    'brightness': ['brightness', 'lumens', 'ansi lumens'],
+    'contrast_ratio': ['contrast ratio', 'contrast'],
+    'connectivity': ['connectivity', 'connections', 'inputs', 'outputs']
+}
+
+# Reverse index of spelling -> standard key; the first listed key wins on shared spellings
+_SPEC_KEY_LOOKUP = {
+    variation: standard_key
+    for standard_key, variations in reversed(list(SPEC_KEY_VARIATIONS.items()))
+    for variation in variations
+}
+
+# Normalization patterns, compiled once for the per-item hot path
+_CORP_SUFFIXES = frozenset(['inc', 'incorporated', 'corp', 'corporation', 'ltd', 'limited', 'llc'])
+_CORP_SUFFIX_RE = re.compile(r'\b(inc|incorporated|corp|corporation|ltd|limited|llc)\b', re.IGNORECASE)
+_NON_WORD_SPACE_RE = re.compile(r'[^\w\s]')
+_MODEL_AFFIX_RE = re.compile(r'^(?:model|mod)\s+|\s+(?:series|ser)$', re.IGNORECASE)
+_MODEL_INVALID_CHARS_RE = re.compile(r'[^\w\s\-/]')
+_GENERIC_TYPE_WORD_RE = re.compile(r'\b(system|device|unit|equipment)\b')
+_WHITESPACE_RE = re.compile(r'\s+')
+_POWER_RE = re.compile(r'(\d+(?:\.\d+)?)\s*(w|watts?|kw)', re.IGNORECASE)
+_WEIGHT_RE = re.compile(r'(\d+(?:\.\d+)?)\s*(kg|lbs?|pounds?)', re.IGNORECASE)
+_FREQ_RE = re.compile(r'(\d+)\s*hz?\s*-\s*(\d+(?:\.\d+)?)\s*(khz?|hz)', re.IGNORECASE)
+_ID_NONWORD_RE = re.compile(r'[^\w]')
+# Every ASCII non-word character maps to '_', matching _ID_NONWORD_RE on ASCII input
+_ID_TRANSLATE = str.maketrans({chr(c): '_' for c in range(128) if not (chr(c).isalnum() or chr(c) == '_')})
+_ID_UNDERSCORE_RE = re.compile(r'_+')
+
+def _format_power(power_val: float, unit: str) -> str:
+    """Format a parsed power value in watts."""
+    if unit.startswith('kw'):
+        power_val *= 1000
+    return f"{power_val}W"
+
+def _format_weight(weight_val: float, unit: str) -> str:
+    """Format a parsed weight value in kilograms."""
+    if unit.startswith('lb') or unit.startswith('pound'):
+        weight_val *= 0.453592  # Convert to kg
+    return f"{weight_val:.1f}kg"
+
+def _format_frequency_range(low_freq: int, high_freq: float, unit: str) -> str:
+    """Format a parsed frequency range in hertz."""
+    if unit.startswith('k'):
+        high_freq *= 1000
+    return f"{low_freq}Hz - {int(high_freq)}Hz"
+
+def _handle_power(value_str: str) -> str:
+    """Standardize a power value to watts."""
+    power_match = _POWER_RE.search(value_str)
+    if power_match:
+        return _format_power(float(power_match.group(1)), power_match.group(2).lower())
+    return value_str
+
+def _handle_weight(value_str: str) -> str:
+    """Standardize a weight value to kilograms."""
+    weight_match = _WEIGHT_RE.search(value_str)
+    if weight_match:
+        return _format_weight(float(weight_match.group(1)), weight_match.group(2).lower())
+    return value_str
+
+def _handle_frequency_response(value_str: str) -> str:
+    """Standardize a frequency range to hertz."""
+    freq_match = _FREQ_RE.search(value_str)
+    if freq_match:
+        return _format_frequency_range(int(freq_match.group(1)), float(freq_match.group(2)), freq_match.group(3).lower())
+    return value_str
+
+# Value standardizers for specification keys with standard units; other values pass through
+_SPEC_HANDLERS = {
+    'power': _handle_power,
+    'weight': _handle_weight,
+    'frequency_response': _handle_frequency_response
+}
+
+@dataclass(slots=True)
 class StandardizedEquipment:
     """Standardized equipment item structure."""
     id: str
@@ -36,6 +147,49 @@ class DataStandardizer:
         self.equipment_type_mappings = self._build_equipment_type_mappings()
         self.standardized_categories = set(EQUIPMENT_CATEGORIES.keys())
         
+        # Fuzzy match choices, built once; all are lowercase like the queries,
+        # so extractOne runs without a processor
+        self._mfr_choices = list(self.manufacturer_variations.keys())
+        
+        # Title-cased output names computed once (variation -> name, choice -> name)
+        self._mfr_lookup = {
+            variation: standard_name.title() for variation, standard_name in MANUFACTURER_VARIANT_TO_CANONICAL.items()
+        }
+        self._mfr_titles = {name: name.title() for name in self._mfr_choices}
+        self._cat_choices = list(self.standardized_categories)
+        
+        # Manufacturer choices bucketed by first letter; a fuzzy match at the
+        # 80% threshold almost always shares it, so only that bucket is scored
+        self._mfr_by_prefix = {}
+        for name in self._mfr_choices:
+            self._mfr_by_prefix.setdefault(name[:1], []).append(name)
+        self._type_choices = {
+            category: list(mappings.keys()) for category, mappings in self.equipment_type_mappings.items()
+        }
+        
+        # Fuzzy matches resolved in bulk for a run (query -> matched choice, or None)
+        self._mfr_fuzzy_matches = {}
+        self._cat_fuzzy_matches = {}
+        
+        self._init_caches()
+    
+    def _init_caches(self):
+        """Memoize each string-level standardizer per instance (exact hits skip fuzzy matching)."""
+        # Catalogs repeat the same spellings across items and venues
+        for method_name in _CACHED_METHODS:
+            setattr(self, method_name, lru_cache(maxsize=STANDARDIZE_CACHE_SIZE)(getattr(self, method_name)))
+    
+    def __getstate__(self):
+        # Cache wrappers hold bound methods and cannot be pickled for worker processes
+        state = self.__dict__.copy()
+        for method_name in _CACHED_METHODS:
+            state.pop(method_name, None)
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init_caches()
+        
     def standardize_equipment_data(self, extracted_data: Dict[str, List[EquipmentItem]]) -> Dict[str, List[StandardizedEquipment]]:
         """
         Standardize extracted equipment data.
@@ -46,53 +200,117 @@ class DataStandardizer:
         Returns:
             Dictionary mapping venue names to standardized equipment items
         """
-        standardized_data = {}
+        total_items = sum(len(equipment_items) for equipment_items in extracted_data.values())
+        
+        # Resolve fuzzy matches for every distinct query up front, one similarity matrix per field
+        all_items = [item for equipment_items in extracted_data.values() for item in equipment_items]
+        self._mfr_fuzzy_matches = {}
+        mfr_queries_by_prefix = {}
+        for query in (self._normalized_unique([item.manufacturer for item in all_items if item.manufacturer])
+                      - self._mfr_lookup.keys()):
+            mfr_queries_by_prefix.setdefault(query[:1], set()).add(query)
+        for prefix, queries in mfr_queries_by_prefix.items():
+            self._mfr_fuzzy_matches.update(self._bulk_fuzzy_match(queries, self._mfr_candidates(prefix), 80))
+        self._cat_fuzzy_matches = self._bulk_fuzzy_match(
+            self._normalized_unique([item.category or "" for item in all_items]) - self.standardized_categories,
+            self._cat_choices, 70, scorer=fuzz.QRatio
+        )
         
-        for venue_name, equipment_items in extracted_data.items():
-            logging.info(f"Standardizing data for venue: {venue_name}")
-            
-            standardized_items = []
-            for item in equipment_items:
-                try:
-                    standardized_item = self._standardize_single_item(item)
-                    if standardized_item:
-                        standardized_items.append(standardized_item)
-                except Exception as e:
-                    logging.error(f"Error standardizing item {item.manufacturer} {item.model}: {e}")
-                    continue
-            
-            # Merge duplicate items after standardization
-            merged_items = self._merge_duplicate_items(standardized_items)
-            standardized_data[venue_name] = merged_items
-            
-        return standardized_data
+        # Venues are independent and standardization is CPU-bound, so large
+        # multi-venue runs are spread across processes
+        if len(extracted_data) > 1 and total_items >= PARALLEL_MIN_ITEMS:
+            with ProcessPoolExecutor(mp_context=multiprocessing.get_context(PROCESS_START_METHOD)) as executor:
+                return dict(executor.map(self._standardize_one_venue, extracted_data.items()))
+        
+        return dict(map(self._standardize_one_venue, extracted_data.items()))
+    
+    def _mfr_candidates(self, query: str) -> List[str]:
+        """Return the manufacturer choices sharing the query's first letter, or all of them."""
+        return self._mfr_by_prefix.get(query[:1], self._mfr_choices)
+    
+    def _normalized_unique(self, values: List[str]) -> Set[str]:
+        """Return the distinct stripped, lowercased values of a column."""
+        if pc is None or not values:
+            return {value.strip().lower() for value in values}
+        
+        column = pc.utf8_lower(pc.utf8_trim_whitespace(pa.array(values, type=pa.string())))
+        return set(pc.unique(column).to_pylist())
+    
+    def _bulk_fuzzy_match(self, queries: Set[str], choices: List[str], score_cutoff: int,
+                          scorer=fuzz.ratio) -> Dict[str, Optional[str]]:
+        """Match all queries against choices in one cdist call; first best choice wins, like extractOne."""
+        if not queries or not choices:
+            return {}
+        
+        queries = list(queries)
+        scores = process.cdist(queries, choices, scorer=scorer, processor=None,
+                               score_cutoff=score_cutoff, workers=-1)
+        best_indices = scores.argmax(axis=1)
+        
+        return {
+            query: choices[best_idx] if scores[query_idx, best_idx] >= score_cutoff else None
+            for query_idx, (query, best_idx) in enumerate(zip(queries, best_indices))
+        }
+    
+    def _standardize_one_venue(self, venue_items: Tuple[str, List[EquipmentItem]]) -> Tuple[str, List[StandardizedEquipment]]:
+        """Standardize and merge the items of one venue."""
+        venue_name, equipment_items = venue_items
+        logging.info(f"Standardizing data for venue: {venue_name}")
+        
+        # Items are merged as they are standardized, without an intermediate list
+        return venue_name, self._merge_duplicate_items(self._standardize_items(equipment_items))
+    
+    def _standardize_items(self, equipment_items: Iterable[EquipmentItem]) -> Iterator[StandardizedEquipment]:
+        """Lazily standardize items, skipping any that fail."""
+        for item in equipment_items:
+            try:
+                standardized_item = self._standardize_single_item(item)
+                if standardized_item:
+                    yield standardized_item
+            except Exception as e:
+                logging.error(f"Error standardizing item {item.manufacturer} {item.model}: {e}")
+                continue
     
     def _standardize_single_item(self, item: EquipmentItem) -> Optional[StandardizedEquipment]:
         """Standardize a single equipment item."""
-        notes = []
+        # Allocated on the first change only; clean items share the empty sentinel
+        notes = None
+        
+        # Normalized once here and shared by the standardizers (and their caches)
+        manufacturer_clean = item.manufacturer.strip().lower() if item.manufacturer else ""
+        category_clean = item.category.strip().lower() if item.category else ""
+        type_clean = item.equipment_type.strip().lower() if item.equipment_type else ""
         
         # Standardize manufacturer
         original_manufacturer = item.manufacturer
-        standardized_manufacturer = self._standardize_manufacturer(item.manufacturer)
+        standardized_manufacturer = self._standardize_manufacturer(manufacturer_clean)
         if standardized_manufacturer != original_manufacturer:
+            if notes is None:
+                notes = []
             notes.append(f"Manufacturer normalized: {original_manufacturer} -> {standardized_manufacturer}")
         
         # Standardize model
         original_model = item.model
         standardized_model = self._standardize_model(item.model)
         if standardized_model != original_model:
+            if notes is None:
+                notes = []
             notes.append(f"Model normalized: {original_model} -> {standardized_model}")
         
         # Standardize category
         original_category = item.category
-        standardized_category = self._standardize_category(item.category, item.equipment_type)
+        standardized_category = self._standardize_category(category_clean, type_clean)
         if standardized_category != original_category:
+            if notes is None:
+                notes = []
             notes.append(f"Category normalized: {original_category} -> {standardized_category}")
         
         # Standardize equipment type
         original_type = item.equipment_type
-        standardized_type = self._standardize_equipment_type(item.equipment_type, standardized_category)
+        standardized_type = self._standardize_equipment_type(type_clean, standardized_category)
         if standardized_type != original_type:
+            if notes is None:
+                notes = []
             notes.append(f"Equipment type normalized: {original_type} -> {standardized_type}")
         
         # Generate unique ID
@@ -108,38 +326,44 @@ class DataStandardizer:
             category=standardized_category,
             venue=item.venue,
             specifications=self._standardize_specifications(item.specifications),
-            features=[],  # Will be populated later
-            applications=[],  # Will be populated later
-            compatibility=[],  # Will be populated later
+            features=_EMPTY,  # Will be populated later
+            applications=_EMPTY,  # Will be populated later
+            compatibility=_EMPTY,  # Will be populated later
             source_documents=[item.source_document],
             confidence_score=item.confidence_score,
-            standardization_notes=notes
+            standardization_notes=notes or _EMPTY
         )
         
         return standardized_item
     
-    def _standardize_manufacturer(self, manufacturer: str) -> str:
-        """Standardize manufacturer name."""
-        if not manufacturer:
+    def _standardize_manufacturer(self, manufacturer_clean: str) -> str:
+        """Standardize a stripped, lowercased manufacturer name."""
+        if not manufacturer_clean:
             return "Unknown"
         
-        manufacturer_clean = manufacturer.strip().lower()
-        
         # Direct mapping check
-        for standard_name, variations in self.manufacturer_variations.items():
-            if manufacturer_clean in variations:
-                return standard_name.title()
+        standard_name = self._mfr_lookup.get(manufacturer_clean)
+        if standard_name:
+            return standard_name
         
         # Fuzzy matching for close matches
-        all_standard_names = list(self.manufacturer_variations.keys())
-        match = process.extractOne(manufacturer_clean, all_standard_names, scorer=fuzz.ratio)
+        if manufacturer_clean in self._mfr_fuzzy_matches:
+            matched_name = self._mfr_fuzzy_matches[manufacturer_clean]
+        else:
+            match = process.extractOne(manufacturer_clean, self._mfr_candidates(manufacturer_clean), scorer=fuzz.ratio,
+                                       processor=None, score_cutoff=80)  # 80% similarity threshold
+            matched_name = match[0] if match else None
+        
+        if matched_name:
+            return self._mfr_titles[matched_name]
         
-        if match and match[1] >= 80:  # 80% similarity threshold
-            return match[0].title()
+        # A single plain word has nothing for the cleanup regexes to remove
+        if manufacturer_clean.isalpha() and manufacturer_clean not in _CORP_SUFFIXES:
+            return manufacturer_clean.title()
         
         # Clean up the original name
-        cleaned = re.sub(r'\b(inc|incorporated|corp|corporation|ltd|limited|llc)\b', '', manufacturer_clean, flags=re.IGNORECASE)
-        cleaned = re.sub(r'[^\w\s]', '', cleaned).strip()
+        cleaned = _CORP_SUFFIX_RE.sub('', manufacturer_clean)
+        cleaned = _NON_WORD_SPACE_RE.sub('', cleaned).strip()
         
         return cleaned.title() if cleaned else "Unknown"
     
@@ -150,48 +374,48 @@ class DataStandardizer:
         
         # Clean up model name
         model_clean = model.strip()
+        if model_clean.isalnum():
+            return model_clean
         
         # Remove common prefixes/suffixes
-        model_clean = re.sub(r'^(model\s+|mod\s+)', '', model_clean, flags=re.IGNORECASE)
-        model_clean = re.sub(r'\s+(series|ser)$', '', model_clean, flags=re.IGNORECASE)
+        model_clean = _MODEL_AFFIX_RE.sub('', model_clean)
         
         # Normalize spacing and special characters
-        model_clean = re.sub(r'\s+', ' ', model_clean)
-        model_clean = re.sub(r'[^\w\s\-/]', '', model_clean)
+        model_clean = _WHITESPACE_RE.sub(' ', model_clean)
+        model_clean = _MODEL_INVALID_CHARS_RE.sub('', model_clean)
         
         return model_clean.strip() if model_clean else "Unknown"
     
-    def _standardize_category(self, category: str, equipment_type: str) -> str:
-        """Standardize equipment category."""
-        if not category:
-            category = ""
-        
-        category_clean = category.strip().lower()
-        
+    def _standardize_category(self, category_clean: str, type_clean: str) -> str:
+        """Standardize a stripped, lowercased category, falling back on the equipment type."""
         # Direct match
         if category_clean in self.standardized_categories:
             return category_clean
         
         # Try to infer from equipment type
-        if equipment_type:
-            inferred_category = self._infer_category_from_type(equipment_type)
+        if type_clean:
+            inferred_category = self._infer_category_from_type(type_clean)
             if inferred_category:
                 return inferred_category
         
         # Fuzzy matching
-        match = process.extractOne(category_clean, list(self.standardized_categories), scorer=fuzz.ratio)
-        if match and match[1] >= 70:
-            return match[0]
+        if category_clean in self._cat_fuzzy_matches:
+            matched_category = self._cat_fuzzy_matches[category_clean]
+        else:
+            # Categories are short single words; QRatio short-circuits empty queries
+            match = process.extractOne(category_clean, self._cat_choices, scorer=fuzz.QRatio,
+                                       processor=None, score_cutoff=70)
+            matched_category = match[0] if match else None
+        if matched_category:
+            return matched_category
         
         return "other"
     
-    def _standardize_equipment_type(self, equipment_type: str, category: str) -> str:
-        """Standardize equipment type."""
-        if not equipment_type:
+    def _standardize_equipment_type(self, type_clean: str, category: str) -> str:
+        """Standardize a stripped, lowercased equipment type."""
+        if not type_clean:
             return "Unknown"
         
-        type_clean = equipment_type.strip().lower()
-        
         # Check predefined mappings
         if category in self.equipment_type_mappings:
             category_mappings = self.equipment_type_mappings[category]
@@ -201,14 +425,15 @@ class DataStandardizer:
                 return category_mappings[type_clean]
             
             # Fuzzy match within category
-            match = process.extractOne(type_clean, list(category_mappings.keys()), scorer=fuzz.ratio)
-            if match and match[1] >= 75:
+            match = process.extractOne(type_clean, self._type_choices[category], scorer=fuzz.QRatio,
+                                       processor=None, score_cutoff=75)
+            if match:
                 return category_mappings[match[0]]
         
         # Clean up the original type
-        type_clean = re.sub(r'\b(system|device|unit|equipment)\b', '', type_clean)
-        type_clean = re.sub(r'[^\w\s]', ' ', type_clean)
-        type_clean = re.sub(r'\s+', ' ', type_clean).strip()
+        type_clean = _GENERIC_TYPE_WORD_RE.sub('', type_clean)
+        type_clean = _NON_WORD_SPACE_RE.sub(' ', type_clean)
+        type_clean = _WHITESPACE_RE.sub(' ', type_clean).strip()
         
         return type_clean.title() if type_clean else "Unknown"
     
@@ -235,29 +460,15 @@ class DataStandardizer:
         if not key:
             return "unknown"
         
-        key_mappings = {
-            'power': ['power', 'wattage', 'watts', 'power consumption', 'power draw'],
-            'dimensions': ['dimensions', 'size', 'measurements', 'dims'],
-            'weight': ['weight', 'mass'],
-            'frequency_response': ['frequency response', 'freq response', 'frequency range'],
-            'impedance': ['impedance', 'ohms'],
-            'spl': ['spl', 'sound pressure level', 'max spl'],
-            'throw_distance': ['throw distance', 'projection distance'],
-            'resolution': ['resolution', 'native resolution'],
-            'brightness': ['brightness', 'lumens', 'ansi lumens'],
-            'contrast_ratio': ['contrast ratio', 'contrast'],
-            'connectivity': ['connectivity', 'connections', 'inputs', 'outputs']
-        }
-        
         key_clean = key.strip().lower()
         
-        for standard_key, variations in key_mappings.items():
-            if key_clean in variations:
-                return standard_key
+        standard_key = _SPEC_KEY_LOOKUP.get(key_clean)
+        if standard_key:
+            return standard_key
         
         # Clean up original key
-        key_clean = re.sub(r'[^\w\s]', '_', key_clean)
-        key_clean = re.sub(r'\s+', '_', key_clean)
+        key_clean = _NON_WORD_SPACE_RE.sub('_', key_clean)
+        key_clean = _WHITESPACE_RE.sub('_', key_clean)
         
         return key_clean
     
@@ -266,47 +477,17 @@ class DataStandardizer:
         if not value:
             return ""
         
-        value_str = str(value).strip()
-        
-        # Power standardization
-        if key == 'power':
-            power_match = re.search(r'(\d+(?:\.\d+)?)\s*(w|watts?|kw)', value_str, re.IGNORECASE)
-            if power_match:
-                power_val = float(power_match.group(1))
-                unit = power_match.group(2).lower()
-                if unit.startswith('kw'):
-                    power_val *= 1000
-                return f"{power_val}W"
-        
-        # Weight standardization
-        elif key == 'weight':
-            weight_match = re.search(r'(\d+(?:\.\d+)?)\s*(kg|lbs?|pounds?)', value_str, re.IGNORECASE)
-            if weight_match:
-                weight_val = float(weight_match.group(1))
-                unit = weight_match.group(2).lower()
-                if unit.startswith('lb') or unit.startswith('pound'):
-                    weight_val *= 0.453592  # Convert to kg
-                return f"{weight_val:.1f}kg"
-        
-        # Frequency standardization
-        elif key == 'frequency_response':
-            freq_match = re.search(r'(\d+)\s*hz?\s*-\s*(\d+(?:\.\d+)?)\s*(khz?|hz)', value_str, re.IGNORECASE)
-            if freq_match:
-                low_freq = int(freq_match.group(1))
-                high_freq = float(freq_match.group(2))
-                unit = freq_match.group(3).lower()
-                if unit.startswith('k'):
-                    high_freq *= 1000
-                return f"{low_freq}Hz - {int(high_freq)}Hz"
-        
-        return value_str
+        return self._standardize_spec_value_str(str(value).strip(), key)
     
-    def _infer_category_from_type(self, equipment_type: str) -> Optional[str]:
-        """Infer category from equipment type."""
-        type_lower = equipment_type.lower()
-        
-        for category, keywords in EQUIPMENT_CATEGORIES.items():
-            if any(keyword in type_lower for keyword in keywords):
+    def _standardize_spec_value_str(self, value_str: str, key: str) -> str:
+        """Standardize a specification value already converted to a stripped string."""
+        handler = _SPEC_HANDLERS.get(key)
+        return handler(value_str) if handler else value_str
+    
+    def _infer_category_from_type(self, type_clean: str) -> Optional[str]:
+        """Infer category from a lowercased equipment type."""
+        for category, pattern in EQUIPMENT_CATEGORY_PATTERNS.items():
+            if pattern.search(type_clean):
                 return category
         
         return None
@@ -315,42 +496,50 @@ class DataStandardizer:
         """Generate unique ID for equipment item."""
         # Create a hash-like ID from manufacturer, model, and venue
         id_string = f"{manufacturer}_{model}_{venue}".lower()
-        id_string = re.sub(r'[^\w]', '_', id_string)
-        id_string = re.sub(r'_+', '_', id_string)
+        id_string = id_string.translate(_ID_TRANSLATE)
+        if not id_string.isascii():
+            id_string = _ID_NONWORD_RE.sub('_', id_string)
+        id_string = _ID_UNDERSCORE_RE.sub('_', id_string)
         
         return id_string.strip('_')
     
-    def _merge_duplicate_items(self, items: List[StandardizedEquipment]) -> List[StandardizedEquipment]:
-        """Merge duplicate standardized items."""
-        if not items:
-            return []
-        
+    def _merge_duplicate_items(self, items: Iterable[StandardizedEquipment]) -> List[StandardizedEquipment]:
+        """Merge duplicate standardized items in a single pass over any iterable."""
         merged_items = {}
+        # Source documents per merged item, deduplicated as they arrive (in first-seen order)
+        merged_sources = {}
         
         for item in items:
-            # Create merge key
-            merge_key = f"{item.manufacturer}_{item.model}_{item.venue}".lower()
+            # Manufacturers come out of standardization title-cased and the venue is shared
+            # by every item merged here, so only the model needs case folding
+            merge_key = (item.manufacturer, item.model.lower(), item.venue)
+            existing = merged_items.get(merge_key)
             
-            if merge_key in merged_items:
+            if existing is not None:
                 # Merge with existing item
-                existing = merged_items[merge_key]
                 existing.quantity += item.quantity
                 
                 # Merge specifications
                 existing.specifications.update(item.specifications)
                 
                 # Merge source documents
-                existing.source_documents.extend(item.source_documents)
-                existing.source_documents = list(set(existing.source_documents))
+                merged_sources[merge_key].update(dict.fromkeys(item.source_documents))
                 
-                # Merge notes
-                existing.standardization_notes.extend(item.standardization_notes)
+                # Merge notes (the first item may hold the shared empty sentinel)
+                if item.standardization_notes:
+                    if not isinstance(existing.standardization_notes, list):
+                        existing.standardization_notes = list(existing.standardization_notes)
+                    existing.standardization_notes.extend(item.standardization_notes)
                 
                 # Use higher confidence score
                 existing.confidence_score = max(existing.confidence_score, item.confidence_score)
                 
             else:
                 merged_items[merge_key] = item
+                merged_sources[merge_key] = dict.fromkeys(item.source_documents)
+        
+        for merge_key, item in merged_items.items():
+            item.source_documents = list(merged_sources[merge_key])
         
         return list(merged_items.values())
     
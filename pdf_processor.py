@@ -7,13 +7,181 @@ import logging
 import re
 from typing import List, Dict, Optional, Tuple
 import os
+import asyncio
+import copy
+import hashlib
+import io
+import pickle
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from config import PDF_EXTRACTION_CACHE_ENABLED, PDF_EXTRACTION_CACHE_DIR, PROCESS_START_METHOD
 try:
     import fitz  # PyMuPDF for better text extraction
 except ImportError:
     fitz = None
 
-@dataclass
+# Plain text without ligature or whitespace preservation, which _clean_text would undo anyway
+_PYMUPDF_TEXT_FLAGS = fitz.TEXTFLAGS_TEXT & ~fitz.TEXT_PRESERVE_LIGATURES & ~fitz.TEXT_PRESERVE_WHITESPACE if fitz else 0
+
+def _pdf_stream(file_path: str, data: Optional[bytes]):
+    """Return an in-memory stream over the PDF bytes when they are loaded, otherwise the path."""
+    return io.BytesIO(data) if data is not None else file_path
+
+def _open_pymupdf(file_path: str, data: Optional[bytes]):
+    """Open a PDF with PyMuPDF from its loaded bytes, or from disk if they are not loaded."""
+    return fitz.open(stream=data, filetype="pdf") if data is not None else fitz.open(file_path)
+
+def _pymupdf_page_text(page) -> str:
+    """Extract the text of a PyMuPDF page through its fastest plain-text path."""
+    return page.get_text("text", flags=_PYMUPDF_TEXT_FLAGS, sort=False)
+
+# Text cleanup and table parsing patterns, compiled once
+_WHITESPACE_RE = re.compile(r'\s+')
+_PAGE_FOOTER_RE = re.compile(r'Page \d+ of \d+', re.IGNORECASE)
+_PAGE_NUMBER_LINE_RE = re.compile(r'^\d+\s*$', re.MULTILINE)
+_BLANK_LINES_RE = re.compile(r'\n\s*\n\s*\n+')
+_COLUMN_SEPARATOR_RE = re.compile(r'\s{2,}|\t')
+_UNUSUAL_WHITESPACE_RE = re.compile(r'[^\S \t\n]')
+_LEADING_BULLET_RE = re.compile(r'^[-•·]+\s*')
+_TRAILING_BULLET_RE = re.compile(r'\s*[-•·]+$')
+
+# Equipment keywords in document text and table headers, matched as substrings in one pass
+_EQUIP_KW_RE = re.compile(
+    r'audio|video|lighting|sound|microphone|speaker|projector|screen|mixer|amplifier|led|fixture',
+    re.IGNORECASE
+)
+_EQUIP_HDR_RE = re.compile(
+    r'equipment|model|manufacturer|quantity|type|brand|description|specs|specifications|audio|video|lighting',
+    re.IGNORECASE
+)
+
+def _has_column_separator(line: str) -> bool:
+    """Check for a tab or a run of 2+ whitespace characters without running the regex engine."""
+    if '\t' in line:
+        return True
+    tokens = line.split()
+    if not tokens:
+        return len(line) >= 2
+    # Every whitespace run is a single character exactly when the whitespace count equals the run count
+    runs = len(tokens) - 1 + line[0].isspace() + line[-1].isspace()
+    return len(line) - sum(map(len, tokens)) > runs
+
+# Fallback extractions give up when this many leading pages yield almost no text
+EARLY_EXIT_PAGES = 3
+EARLY_EXIT_MIN_LENGTH = 50
+
+def _is_weak_extraction(page_num: int, running_length: int) -> bool:
+    """Check whether the pages read so far show that a backend cannot read a document."""
+    return page_num == EARLY_EXIT_PAGES - 1 and running_length < EARLY_EXIT_MIN_LENGTH
+
+# Documents longer than this are extracted in blocks of pages across processes;
+# blocks amortize reopening the file in each worker
+PARALLEL_PAGE_THRESHOLD = 20
+PAGE_BLOCK_SIZE = 8
+
+# Spec sheets use ruled tables, so only ruling lines are used to find cells (never text clustering)
+_TABLE_SETTINGS = {
+    "vertical_strategy": "lines",
+    "horizontal_strategy": "lines",
+    "snap_tolerance": 3,
+    "join_tolerance": 3,
+}
+
+def _pdfplumber_pages(pages, abort_if_weak: bool = False) -> Optional[Tuple[List[str], List[List[List[str]]]]]:
+    """Extract text and valid tables from pdfplumber pages (None if abort_if_weak and the first pages are empty)."""
+    page_texts = []
+    tables = []
+    running_length = 0
+    
+    for page_num, page in enumerate(pages):
+        # Extract text
+        page_text = page.extract_text() or ""
+        page_texts.append(page_text)
+        if abort_if_weak:
+            running_length += len(page_text.strip())
+            if _is_weak_extraction(page_num, running_length):
+                return None
+        
+        # Extract tables
+        page_tables = page.extract_tables(table_settings=_TABLE_SETTINGS)
+        if page_tables:
+            for table in page_tables:
+                if table and len(table) > 1:  # Valid table with header and data
+                    tables.append(table)
+    
+    return page_texts, tables
+
+def _extract_pdfplumber_block(file_path: str, start: int, end: int) -> Tuple[List[str], List[List[List[str]]]]:
+    """Extract pages [start, end) of a PDF with pdfplumber (runs in worker processes)."""
+    with pdfplumber.open(file_path, pages=list(range(start + 1, end + 1))) as pdf:
+        return _pdfplumber_pages(pdf.pages)
+
+def _extract_pymupdf_block(file_path: str, start: int, end: int) -> List[str]:
+    """Extract the text of pages [start, end) of a PDF with PyMuPDF (runs in worker processes)."""
+    with fitz.open(file_path) as doc:
+        return [_pymupdf_page_text(doc[page_num]) for page_num in range(start, end)]
+
+def _map_page_blocks(block_function, file_path: str, page_count: int) -> List:
+    """Run block_function over consecutive page blocks in parallel, returning results in page order."""
+    ranges = [(start, min(start + PAGE_BLOCK_SIZE, page_count)) for start in range(0, page_count, PAGE_BLOCK_SIZE)]
+    with ProcessPoolExecutor(max_workers=min(len(ranges), os.cpu_count() or 1),
+                             mp_context=multiprocessing.get_context(PROCESS_START_METHOD)) as executor:
+        return list(executor.map(block_function, [file_path] * len(ranges),
+                                 [start for start, _ in ranges], [end for _, end in ranges]))
+
+def _use_page_parallelism(page_count: int) -> bool:
+    """Split long documents across processes, unless already running in a worker process."""
+    return page_count > PARALLEL_PAGE_THRESHOLD and multiprocessing.parent_process() is None
+
+# Bump when extraction or post-processing changes so cached content is re-extracted
+EXTRACTION_CACHE_VERSION = 4
+HASH_BLOCK_SIZE = 1024 * 1024
+
+def _file_sha1(file_path: str) -> Optional[str]:
+    """Return the SHA1 hex digest of a file's bytes, or None if it cannot be read."""
+    try:
+        with open(file_path, 'rb') as f:
+            if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+                return hashlib.file_digest(f, 'sha1').hexdigest()
+            digest = hashlib.sha1()
+            for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+                digest.update(block)
+            return digest.hexdigest()
+    except OSError:
+        return None
+
+# Backends in order of preference, and how much text counts as a usable extraction
+EXTRACTION_BACKENDS = ('pdfplumber', 'pymupdf', 'pypdf2')
+MIN_TEXT_LENGTH = 100
+PROBE_PAGES = 2
+
+def _probe_pdfplumber(file_path: str, data: Optional[bytes] = None) -> str:
+    """Extract the text of the first pages with pdfplumber."""
+    with pdfplumber.open(_pdf_stream(file_path, data), pages=list(range(1, PROBE_PAGES + 1))) as pdf:
+        return "\n".join(page.extract_text() or "" for page in pdf.pages)
+
+def _probe_pymupdf(file_path: str, data: Optional[bytes] = None) -> str:
+    """Extract the text of the first pages with PyMuPDF."""
+    if not fitz:
+        return ""
+    with _open_pymupdf(file_path, data) as doc:
+        return "\n".join(_pymupdf_page_text(page) for page in doc.pages(0, min(PROBE_PAGES, len(doc))))
+
+def _probe_pypdf2(file_path: str, data: Optional[bytes] = None) -> str:
+    """Extract the text of the first pages with PyPDF2."""
+    with io.BytesIO(data) if data is not None else open(file_path, 'rb') as file:
+        pdf_reader = PyPDF2.PdfReader(file)
+        page_count = min(PROBE_PAGES, len(pdf_reader.pages))
+        return "\n".join(pdf_reader.pages[page_num].extract_text() or "" for page_num in range(page_count))
+
+_PROBE_FUNCTIONS = {
+    'pdfplumber': _probe_pdfplumber,
+    'pymupdf': _probe_pymupdf,
+    'pypdf2': _probe_pypdf2,
+}
+
+@dataclass(slots=True)
 class PDFContent:
     """Structure to hold extracted PDF content."""
     text: str
@@ -28,6 +196,8 @@ class PDFProcessor:
     
     def __init__(self):
         self.supported_formats = ['.pdf']
+        # Backend that worked for earlier PDFs of each venue; PDFs from one source are usually produced alike
+        self.venue_backends: Dict[str, str] = {}
         
     def process_pdfs(self, venue_pdfs: Dict[str, List[Dict]]) -> Dict[str, List[PDFContent]]:
         """
@@ -39,39 +209,136 @@ class PDFProcessor:
         Returns:
             Dictionary mapping venue names to extracted PDF content
         """
+        processed_content, jobs = self._plan_pdf_jobs(venue_pdfs)
+        unique_indices, first_by_hash = self._unique_pdf_jobs(jobs)
+        unique_args = [[jobs[i][field] for i in unique_indices] for field in range(3)]
+        
+        # PDFs are independent and extraction is CPU-bound, so spread them across processes
+        if len(unique_indices) > 1:
+            workers = min(len(unique_indices), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(PROCESS_START_METHOD)) as executor:
+                unique_contents = list(executor.map(self._process_single_pdf, *unique_args,
+                                                    chunksize=max(1, len(unique_indices) // (workers * 4))))
+        else:
+            unique_contents = list(map(self._process_single_pdf, *unique_args))
+        
+        self._assign_pdf_contents(processed_content, jobs, first_by_hash, dict(zip(unique_indices, unique_contents)))
+        return processed_content
+    
+    async def process_pdfs_async(self, venue_pdfs: Dict[str, List[Dict]],
+                                 executor: Optional[ProcessPoolExecutor] = None) -> Dict[str, List[PDFContent]]:
+        """
+        Process all downloaded PDFs without blocking the event loop.
+        
+        Hashing runs in a thread and each distinct PDF is awaited from the process pool,
+        so other coroutines keep running while PDFs are read and parsed.
+        
+        Args:
+            venue_pdfs: Dictionary mapping venue names to PDF information
+            executor: Optional long-lived process pool to use instead of starting one for this call
+            
+        Returns:
+            Dictionary mapping venue names to extracted PDF content
+        """
+        processed_content, jobs = await asyncio.to_thread(self._plan_pdf_jobs, venue_pdfs)
+        unique_indices, first_by_hash = self._unique_pdf_jobs(jobs)
+        
+        if len(unique_indices) > 1:
+            loop = asyncio.get_running_loop()
+            pool = executor or ProcessPoolExecutor(max_workers=min(len(unique_indices), os.cpu_count() or 1),
+                                                   mp_context=multiprocessing.get_context(PROCESS_START_METHOD))
+            try:
+                unique_contents = await asyncio.gather(*(
+                    loop.run_in_executor(pool, self._process_single_pdf, *jobs[i]) for i in unique_indices
+                ))
+            finally:
+                if pool is not executor:
+                    pool.shutdown()
+        else:
+            unique_contents = [await asyncio.to_thread(self._process_single_pdf, *jobs[i]) for i in unique_indices]
+        
+        self._assign_pdf_contents(processed_content, jobs, first_by_hash, dict(zip(unique_indices, unique_contents)))
+        return processed_content
+    
+    def _plan_pdf_jobs(self, venue_pdfs: Dict[str, List[Dict]]) -> Tuple[Dict[str, List[PDFContent]], List[Tuple[str, str, Optional[str]]]]:
+        """Prepare an empty result per venue and a (file_path, venue_name, file_hash) job per downloaded PDF."""
         processed_content = {}
+        jobs = []
         
         for venue_name, pdfs in venue_pdfs.items():
             logging.info(f"Processing PDFs for venue: {venue_name}")
-            venue_content = []
+            processed_content[venue_name] = []
             
             for pdf_info in pdfs:
                 if pdf_info.get('downloaded', False) and pdf_info.get('local_path'):
-                    try:
-                        content = self._process_single_pdf(pdf_info['local_path'], venue_name)
-                        if content:
-                            venue_content.append(content)
-                    except Exception as e:
-                        logging.error(f"Error processing PDF {pdf_info['local_path']}: {e}")
-                        continue
-            
-            processed_content[venue_name] = venue_content
-            
-        return processed_content
+                    jobs.append((pdf_info['local_path'], venue_name, _file_sha1(pdf_info['local_path'])))
+        
+        return processed_content, jobs
+    
+    def _unique_pdf_jobs(self, jobs: List[Tuple[str, str, Optional[str]]]) -> Tuple[List[int], Dict[str, int]]:
+        """
+        Pick the jobs that need extracting; venues often share the same PDF
+        (e.g. one rider for a chain), so each distinct file is extracted once.
+        
+        Returns:
+            Indices of the jobs to run, and the first job index for each file hash
+        """
+        first_by_hash = {}
+        unique_indices = []
+        for i, (_, _, file_hash) in enumerate(jobs):
+            if file_hash is None or file_hash not in first_by_hash:
+                unique_indices.append(i)
+            if file_hash is not None:
+                first_by_hash.setdefault(file_hash, i)
+        return unique_indices, first_by_hash
     
-    def _process_single_pdf(self, file_path: str, venue_name: str) -> Optional[PDFContent]:
+    def _assign_pdf_contents(self, processed_content: Dict[str, List[PDFContent]], jobs: List[Tuple[str, str, Optional[str]]],
+                             first_by_hash: Dict[str, int], contents_by_index: Dict[int, Optional[PDFContent]]):
+        """Add extracted content to each venue in job order, copying it for venues that share a file."""
+        for i, (file_path, venue_name, file_hash) in enumerate(jobs):
+            if i in contents_by_index:
+                content = contents_by_index[i]
+            else:
+                content = contents_by_index[first_by_hash[file_hash]]
+                if content:
+                    logging.info(f"Reusing extraction of identical PDF for {venue_name}: {os.path.basename(file_path)}")
+                    content = copy.deepcopy(content)
+                    content.venue = venue_name
+                    content.file_path = file_path
+            if content:
+                processed_content[venue_name].append(content)
+    
+    def _process_single_pdf(self, file_path: str, venue_name: str, file_hash: Optional[str] = None) -> Optional[PDFContent]:
         """Process a single PDF file and extract all relevant content."""
         if not os.path.exists(file_path):
             logging.error(f"PDF file not found: {file_path}")
             return None
         
+        cache_path = self._extraction_cache_path(file_hash or _file_sha1(file_path))
+        cached_content = self._load_cached(cache_path)
+        if cached_content is not None:
+            cached_content.venue = venue_name
+            cached_content.file_path = file_path
+            logging.info(f"Loaded cached extraction for PDF: {os.path.basename(file_path)}")
+            return cached_content
+        
         try:
-            # Try multiple extraction methods for best results
-            content = self._extract_with_pdfplumber(file_path)
-            if not content or len(content.text.strip()) < 100:
-                content = self._extract_with_pymupdf(file_path)
-            if not content or len(content.text.strip()) < 100:
-                content = self._extract_with_pypdf2(file_path)
+            # Read the file once; the probe and every backend attempt parse the in-memory copy
+            with open(file_path, 'rb') as f:
+                data = f.read()
+            
+            # Run the full extraction with the backend that reads this PDF best, falling
+            # back to the others only if it still comes up short on the whole document;
+            # fallbacks give up after a few empty pages
+            backend = self.venue_backends.get(venue_name) or self._probe_backend(file_path, data)
+            content = None
+            for attempt, name in enumerate((backend,) + tuple(b for b in EXTRACTION_BACKENDS if b != backend)):
+                extracted = getattr(self, f"_extract_with_{name}")(file_path, abort_if_weak=attempt > 0, data=data)
+                if extracted:
+                    content = extracted
+                    if len(extracted.text.strip()) >= MIN_TEXT_LENGTH:
+                        self.venue_backends[venue_name] = name
+                        break
             
             if content:
                 content.venue = venue_name
@@ -79,6 +346,7 @@ class PDFProcessor:
                 
                 # Post-process the extracted content
                 content = self._post_process_content(content)
+                self._store_cached(cache_path, content)
                 
                 logging.info(f"Successfully processed PDF: {os.path.basename(file_path)}")
                 return content
@@ -90,70 +358,137 @@ class PDFProcessor:
             logging.error(f"Error processing PDF {file_path}: {e}")
             return None
     
-    def _extract_with_pdfplumber(self, file_path: str) -> Optional[PDFContent]:
+    def _extraction_cache_path(self, file_hash: Optional[str]) -> Optional[str]:
+        """Return the cache file for a PDF, keyed by the SHA1 of its bytes."""
+        if not PDF_EXTRACTION_CACHE_ENABLED or not file_hash:
+            return None
+        return os.path.join(PDF_EXTRACTION_CACHE_DIR, f"{file_hash}-v{EXTRACTION_CACHE_VERSION}.pkl")
+    
+    def _load_cached(self, cache_path: Optional[str]) -> Optional[PDFContent]:
+        """Return previously extracted content for a PDF, if any."""
+        if not cache_path:
+            return None
+        try:
+            with open(cache_path, 'rb') as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logging.warning(f"Ignoring unreadable extraction cache {cache_path}: {e}")
+            return None
+    
+    def _store_cached(self, cache_path: Optional[str], content: PDFContent):
+        """Store extracted content; cache failures never fail processing."""
+        if not cache_path:
+            return
+        try:
+            os.makedirs(PDF_EXTRACTION_CACHE_DIR, exist_ok=True)
+            temp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(temp_path, 'wb') as f:
+                pickle.dump(content, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, cache_path)
+        except Exception as e:
+            logging.warning(f"Could not write extraction cache {cache_path}: {e}")
+    
+    def _probe_backend(self, file_path: str, data: Optional[bytes] = None) -> str:
+        """
+        Pick an extraction backend by extracting only the first pages with each one.
+        
+        Args:
+            file_path: Path to the PDF file
+            data: The PDF's bytes, if already read into memory
+            
+        Returns:
+            The first backend (in order of preference) whose sample reaches the minimum
+            text length, otherwise the backend with the longest sample
+        """
+        best_backend = EXTRACTION_BACKENDS[0]
+        best_length = -1
+        
+        for backend in EXTRACTION_BACKENDS:
+            try:
+                length = len(_PROBE_FUNCTIONS[backend](file_path, data).strip())
+            except Exception as e:
+                logging.debug(f"{backend} probe failed for {file_path}: {e}")
+                continue
+            if length >= MIN_TEXT_LENGTH:
+                return backend
+            if length > best_length:
+                best_backend, best_length = backend, length
+        
+        return best_backend
+    
+    def _extract_with_pdfplumber(self, file_path: str, abort_if_weak: bool = False,
+                                 data: Optional[bytes] = None) -> Optional[PDFContent]:
         """Extract content using pdfplumber (best for tables and structured content)."""
         try:
-            with pdfplumber.open(file_path) as pdf:
+            with pdfplumber.open(_pdf_stream(file_path, data)) as pdf:
+                metadata = pdf.metadata or {}
+                page_count = len(pdf.pages)
+                parallel = _use_page_parallelism(page_count)
+                if not parallel:
+                    extracted = _pdfplumber_pages(pdf.pages, abort_if_weak)
+                    if extracted is None:
+                        logging.debug(f"pdfplumber found no text on the first pages of {file_path}")
+                        return None
+                    pages, tables = extracted
+            
+            if parallel:
                 pages = []
                 tables = []
-                full_text = ""
-                
-                for page_num, page in enumerate(pdf.pages):
-                    # Extract text
-                    page_text = page.extract_text() or ""
-                    pages.append(page_text)
-                    full_text += f"\n--- Page {page_num + 1} ---\n{page_text}\n"
-                    
-                    # Extract tables
-                    page_tables = page.extract_tables()
-                    if page_tables:
-                        for table in page_tables:
-                            if table and len(table) > 1:  # Valid table with header and data
-                                tables.append(table)
-                
-                metadata = pdf.metadata or {}
-                
-                return PDFContent(
-                    text=full_text,
-                    pages=pages,
-                    tables=tables,
-                    metadata=metadata,
-                    file_path=file_path,
-                    venue=""
-                )
+                for block_pages, block_tables in _map_page_blocks(_extract_pdfplumber_block, file_path, page_count):
+                    pages.extend(block_pages)
+                    tables.extend(block_tables)
+            
+            full_text = "".join(f"\n--- Page {page_num + 1} ---\n{page_text}\n" for page_num, page_text in enumerate(pages))
+            
+            return PDFContent(
+                text=full_text,
+                pages=pages,
+                tables=tables,
+                metadata=metadata,
+                file_path=file_path,
+                venue=""
+            )
                 
         except Exception as e:
             logging.debug(f"pdfplumber extraction failed for {file_path}: {e}")
             return None
     
-    def _extract_with_pymupdf(self, file_path: str) -> Optional[PDFContent]:
+    def _extract_with_pymupdf(self, file_path: str, abort_if_weak: bool = False,
+                              data: Optional[bytes] = None) -> Optional[PDFContent]:
         """Extract content using PyMuPDF (good for complex layouts)."""
         if not fitz:
             logging.debug("PyMuPDF not available, skipping")
             return None
             
         try:
-            doc = fitz.open(file_path)
-            pages = []
-            full_text = ""
-            tables = []
+            # The document (and MuPDF's page caches) is released as soon as the text is out
+            with _open_pymupdf(file_path, data) as doc:
+                page_count = len(doc)
+                parallel = _use_page_parallelism(page_count)
+                if not parallel:
+                    pages = []
+                    running_length = 0
+                    for page_num, page in enumerate(doc):
+                        page_text = _pymupdf_page_text(page)
+                        pages.append(page_text)
+                        if abort_if_weak:
+                            running_length += len(page_text.strip())
+                            if _is_weak_extraction(page_num, running_length):
+                                logging.debug(f"PyMuPDF found no text on the first pages of {file_path}")
+                                return None
             
-            for page_num in range(len(doc)):
-                page = doc.load_page(page_num)
-                
-                # Extract text
-                page_text = page.get_text()
-                pages.append(page_text)
-                full_text += f"\n--- Page {page_num + 1} ---\n{page_text}\n"
-                
-                # Try to extract tables (basic approach)
-                page_tables = self._extract_tables_from_text(page_text)
-                tables.extend(page_tables)
+            if parallel:
+                pages = [text for block in _map_page_blocks(_extract_pymupdf_block, file_path, page_count) for text in block]
             
-            doc.close()
+            tables = []
+            for page_text in pages:
+                # Try to extract tables (basic approach)
+                tables.extend(self._extract_tables_from_text(page_text))
             
             return PDFContent(
-                text=full_text,
+                text="".join(f"\n--- Page {page_num + 1} ---\n{page_text}\n" for page_num, page_text in enumerate(pages)),
                 pages=pages,
                 tables=tables,
                 metadata={},
@@ -165,19 +500,27 @@ class PDFProcessor:
             logging.debug(f"PyMuPDF extraction failed for {file_path}: {e}")
             return None
     
-    def _extract_with_pypdf2(self, file_path: str) -> Optional[PDFContent]:
+    def _extract_with_pypdf2(self, file_path: str, abort_if_weak: bool = False,
+                             data: Optional[bytes] = None) -> Optional[PDFContent]:
         """Extract content using PyPDF2 (fallback method)."""
         try:
-            with open(file_path, 'rb') as file:
+            with io.BytesIO(data) if data is not None else open(file_path, 'rb') as file:
                 pdf_reader = PyPDF2.PdfReader(file)
                 pages = []
-                full_text = ""
+                parts: List[str] = []
+                running_length = 0
                 
                 for page_num in range(len(pdf_reader.pages)):
                     page = pdf_reader.pages[page_num]
                     page_text = page.extract_text()
                     pages.append(page_text)
-                    full_text += f"\n--- Page {page_num + 1} ---\n{page_text}\n"
+                    parts.append(f"\n--- Page {page_num + 1} ---\n{page_text}\n")
+                    if abort_if_weak:
+                        running_length += len((page_text or "").strip())
+                        if _is_weak_extraction(page_num, running_length):
+                            logging.debug(f"PyPDF2 found no text on the first pages of {file_path}")
+                            return None
+                full_text = "".join(parts)
                 
                 metadata = pdf_reader.metadata or {}
                 
@@ -199,32 +542,29 @@ class PDFProcessor:
     
     def _extract_tables_from_text(self, text: str) -> List[List[List[str]]]:
         """Extract table-like structures from plain text."""
-        tables = []
         lines = text.split('\n')
         
+        # Pick out candidate row lines in bulk; with only spaces and tabs, a column
+        # separator needs a double space or a tab, which a substring check finds in C
+        if _UNUSUAL_WHITESPACE_RE.search(text):
+            candidates = [i for i, line in enumerate(lines) if _has_column_separator(line.strip())]
+        else:
+            candidates = [i for i, line in enumerate(lines) if '  ' in line or '\t' in line]
+        
+        tables = []
         current_table = []
-        in_table = False
+        previous_row = -2
         
-        for line in lines:
-            line = line.strip()
-            if not line:
-                if in_table and current_table:
-                    tables.append(current_table)
-                    current_table = []
-                    in_table = False
+        # Any other line (prose or blank) ends a table, so tables are runs of adjacent rows
+        for i in candidates:
+            row = self._parse_table_row(lines[i].strip())
+            if len(row) < 2:  # Separator was only leading/trailing whitespace
                 continue
-            
-            # Detect table-like patterns (multiple columns separated by spaces/tabs)
-            if self._looks_like_table_row(line):
-                row = self._parse_table_row(line)
-                if row and len(row) > 1:
-                    current_table.append(row)
-                    in_table = True
-            else:
-                if in_table and current_table:
-                    tables.append(current_table)
-                    current_table = []
-                    in_table = False
+            if i != previous_row + 1 and current_table:
+                tables.append(current_table)
+                current_table = []
+            current_table.append(row)
+            previous_row = i
         
         # Add final table if exists
         if current_table:
@@ -241,13 +581,17 @@ class PDFProcessor:
     def _looks_like_table_row(self, line: str) -> bool:
         """Check if a line looks like a table row."""
         # Look for multiple columns separated by whitespace
-        parts = re.split(r'\s{2,}|\t', line)
-        return len(parts) >= 2
+        return _has_column_separator(line)
     
     def _parse_table_row(self, line: str) -> List[str]:
         """Parse a line into table columns."""
+        # Most lines are prose with no separator; only real rows need the split
+        if not _has_column_separator(line):
+            line = line.strip()
+            return [line] if line else []
+        
         # Split by multiple spaces or tabs
-        parts = re.split(r'\s{2,}|\t', line)
+        parts = _COLUMN_SEPARATOR_RE.split(line)
         return [part.strip() for part in parts if part.strip()]
     
     def _looks_like_equipment_table(self, table: List[List[str]]) -> bool:
@@ -256,30 +600,26 @@ class PDFProcessor:
             return False
         
         # Check header row for equipment-related keywords
-        header = ' '.join(table[0]).lower()
-        equipment_keywords = [
-            'equipment', 'model', 'manufacturer', 'quantity', 'type', 'brand',
-            'description', 'specs', 'specifications', 'audio', 'video', 'lighting'
-        ]
-        
-        return any(keyword in header for keyword in equipment_keywords)
+        return bool(_EQUIP_HDR_RE.search(' '.join(table[0])))
     
     def _post_process_content(self, content: PDFContent) -> PDFContent:
         """Post-process extracted content to improve quality."""
-        # Clean up text
-        content.text = self._clean_text(content.text)
-        
-        # Clean up pages
+        # Clean up pages, then rebuild the full text from them instead of cleaning it a second time
         content.pages = [self._clean_text(page) for page in content.pages]
+        content.text = "\n\n".join(f"--- Page {page_num + 1} ---\n{page}" for page_num, page in enumerate(content.pages))
         
-        # Clean up tables
+        # Clean up tables: clean each distinct cell once in a single flat pass
+        # (quantities, brands and blanks repeat a lot), then rebuild the rows
+        cleaned_cells = {
+            cell: self._clean_cell_text(cell)
+            for cell in {cell for table in content.tables for row in table for cell in row}
+        }
         cleaned_tables = []
         for table in content.tables:
-            cleaned_table = []
-            for row in table:
-                cleaned_row = [self._clean_cell_text(cell) for cell in row]
-                if any(cell.strip() for cell in cleaned_row):  # Skip empty rows
-                    cleaned_table.append(cleaned_row)
+            cleaned_table = [
+                cleaned_row for cleaned_row in ([cleaned_cells[cell] for cell in row] for row in table)
+                if any(cell.strip() for cell in cleaned_row)  # Skip empty rows
+            ]
             if cleaned_table:
                 cleaned_tables.append(cleaned_table)
         content.tables = cleaned_tables
@@ -292,18 +632,14 @@ class PDFProcessor:
             return ""
         
         # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = _WHITESPACE_RE.sub(' ', text)
         
         # Remove page headers/footers (common patterns)
-        text = re.sub(r'Page \d+ of \d+', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'^\d+\s*$', '', text, flags=re.MULTILINE)
-        
-        # Fix common OCR errors
-        text = text.replace('|', 'I')  # Common OCR mistake
-        text = text.replace('0', 'O')  # In some contexts
+        text = _PAGE_FOOTER_RE.sub('', text)
+        text = _PAGE_NUMBER_LINE_RE.sub('', text)
         
         # Normalize line breaks
-        text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)
+        text = _BLANK_LINES_RE.sub('\n\n', text)
         
         return text.strip()
     
@@ -313,11 +649,11 @@ class PDFProcessor:
             return ""
         
         # Remove extra whitespace
-        cell = re.sub(r'\s+', ' ', cell.strip())
+        cell = _WHITESPACE_RE.sub(' ', cell.strip())
         
         # Remove common artifacts
-        cell = re.sub(r'^[-•·]+\s*', '', cell)  # Remove bullet points
-        cell = re.sub(r'\s*[-•·]+$', '', cell)  # Remove trailing bullets
+        cell = _LEADING_BULLET_RE.sub('', cell)  # Remove bullet points
+        cell = _TRAILING_BULLET_RE.sub('', cell)  # Remove trailing bullets
         
         return cell
     
@@ -335,10 +671,4 @@ class PDFProcessor:
     
     def _has_equipment_keywords(self, text: str) -> bool:
         """Check if text contains equipment-related keywords."""
-        text_lower = text.lower()
-        equipment_keywords = [
-            'audio', 'video', 'lighting', 'sound', 'microphone', 'speaker',
-            'projector', 'screen', 'mixer', 'amplifier', 'led', 'fixture'
-        ]
-        
-        return any(keyword in text_lower for keyword in equipment_keywords)
\ No newline at end of file
+        return bool(_EQUIP_KW_RE.search(text))
\ No newline at end of file
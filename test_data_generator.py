@@ -4,25 +4,87 @@ Test data generator for creating sample venue specification PDFs when real ones
 import os
 import logging
 from reportlab.lib.pagesizes import letter
+from reportlab.pdfgen import canvas
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.lib.utils import simpleSplit
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib import colors
 from reportlab.lib.units import inch
-from typing import Dict, List
+from typing import Dict, List, Tuple
+
+# Sample equipment tables (header row first), shared by every generated PDF
+_SAMPLE_AUDIO = (
+    ('Manufacturer', 'Model', 'Type', 'Quantity', 'Specifications'),
+    ('Shure', 'SM58', 'Dynamic Microphone', '12', 'Frequency Response: 50-15,000 Hz'),
+    ('Yamaha', 'QL5', 'Digital Mixing Console', '1', '32 Input Channels, 16 Mix Buses'),
+    ('QSC', 'K12.2', 'Powered Speaker', '8', '2000W, 12" Woofer, 1.75" Tweeter'),
+    ('Sennheiser', 'EW 100 G4', 'Wireless Microphone System', '6', 'UHF Band, 42 MHz Bandwidth'),
+    ('JBL', 'VTX V25', 'Line Array Speaker', '16', '3-way, Neodymium Drivers'),
+    ('Yamaha', 'DM2000', 'Digital Mixer', '1', '96 Input Channels, 24-bit/96kHz'),
+    ('Crown', 'XTi 6002', 'Power Amplifier', '4', '2100W @ 4Ω, DSP Processing'),
+    ('Shure', 'ULXD4', 'Wireless Receiver', '8', 'Digital, AES256 Encryption'),
+)
+
+_SAMPLE_VIDEO = (
+    ('Manufacturer', 'Model', 'Type', 'Quantity', 'Specifications'),
+    ('Sony', 'PXW-Z750', 'Professional Camera', '3', '4K, 3x 2/3" CMOS Sensors'),
+    ('Barco', 'UDX-4K32', 'Projector', '2', '31,000 Lumens, 4K Resolution'),
+    ('Blackmagic', 'ATEM 2 M/E', 'Video Switcher', '1', '20 Inputs, 4K Support'),
+    ('Christie', 'D13WU-H', 'Projector', '1', '13,000 Lumens, WUXGA'),
+    ('Panasonic', 'AW-UE150', 'PTZ Camera', '4', '4K, 20x Optical Zoom'),
+    ('Roland', 'V-60HD', 'Video Switcher', '1', '6 HDMI Inputs, Full HD'),
+    ('Da-Lite', 'Fast-Fold Deluxe', 'Projection Screen', '2', '16:9 Aspect Ratio, 20ft Wide'),
+    ('AJA', 'KONA 5', 'Video I/O Card', '2', '4K/UltraHD, 12G-SDI'),
+)
+
+_SAMPLE_LIGHTING = (
+    ('Manufacturer', 'Model', 'Type', 'Quantity', 'Specifications'),
+    ('ETC', 'ColorSource PAR', 'LED Par Light', '24', 'RGBA-Lime, 7-color LED Array'),
+    ('Martin', 'MAC Quantum Wash', 'Moving Head Wash', '12', 'RGBW LED, 19° - 54° Zoom'),
+    ('Chamsys', 'MagicQ MQ500', 'Lighting Console', '1', '202 Universes, Touch Screen'),
+    ('Robe', 'Pointe', 'Moving Head Spot', '8', '280W Lamp, Prism, Gobos'),
+    ('ETC', 'Ion Xe 20', 'Lighting Console', '1', '20 Faders, 40,960 Outputs'),
+    ('Clay Paky', 'Mythos 2', 'Hybrid Moving Light', '6', '470W LED, Beam/Spot/Wash'),
+    ('Avolites', 'Tiger Touch II', 'Lighting Console', '1', '20 Playback Faders'),
+    ('High End', 'SolaFrame 750', 'LED Framing Spot', '16', '26,000 Lumens, Framing System'),
+    ('MA Lighting', 'grandMA3 Light', 'Lighting Console', '1', '8,192 Parameters'),
+)
+
+# Style of the equipment tables in Platypus-built PDFs, built once at import
+_EQUIPMENT_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 12),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black)
+])
 
 class TestDataGenerator:
     """Generate sample venue specification PDFs for testing."""
     
     def __init__(self):
         self.styles = getSampleStyleSheet()
+        self.title_style = ParagraphStyle(
+            'CustomTitle',
+            parent=self.styles['Heading1'],
+            fontSize=18,
+            spaceAfter=30,
+            alignment=1  # Center alignment
+        )
         
-    def generate_sample_pdfs(self, venue_names: List[str], output_dir: str = 'pdf_cache') -> Dict[str, List[Dict]]:
+    def generate_sample_pdfs(self, venue_names: List[str], output_dir: str = 'pdf_cache',
+                             fancy: bool = False) -> Dict[str, List[Dict]]:
         """
         Generate sample PDFs for venues when real ones aren't available.
         
         Args:
             venue_names: List of venue names to generate PDFs for
             output_dir: Directory to save PDFs
+            fancy: Lay out PDFs with Platypus (slower) instead of drawing them at fixed positions
             
         Returns:
             Dictionary mapping venue names to PDF information
@@ -31,7 +93,7 @@ class TestDataGenerator:
         venue_pdfs = {}
         
         for venue_name in venue_names:
-            pdf_path = self._generate_venue_pdf(venue_name, output_dir)
+            pdf_path = self._generate_venue_pdf(venue_name, output_dir, fancy)
             if pdf_path:
                 venue_pdfs[venue_name] = [{
                     'url': f'file://{pdf_path}',
@@ -47,7 +109,7 @@ class TestDataGenerator:
                 
         return venue_pdfs
     
-    def _generate_venue_pdf(self, venue_name: str, output_dir: str) -> str:
+    def _generate_venue_pdf(self, venue_name: str, output_dir: str, fancy: bool = False) -> str:
         """Generate a sample PDF for a specific venue."""
         try:
             # Create filename
@@ -55,127 +117,132 @@ class TestDataGenerator:
             filename = f"{safe_name}_technical_specs.pdf"
             filepath = os.path.join(output_dir, filename)
             
-            # Create PDF document
-            doc = SimpleDocTemplate(filepath, pagesize=letter)
-            story = []
-            
-            # Title
-            title_style = ParagraphStyle(
-                'CustomTitle',
-                parent=self.styles['Heading1'],
-                fontSize=18,
-                spaceAfter=30,
-                alignment=1  # Center alignment
-            )
-            story.append(Paragraph(f"{venue_name} - Technical Specifications", title_style))
-            story.append(Spacer(1, 20))
-            
-            # Introduction
-            intro_text = f"""
-            This document contains the technical specifications and equipment inventory for {venue_name}.
-            The venue is equipped with state-of-the-art audio, video, and lighting systems to support
-            various types of performances and events.
-            """
-            story.append(Paragraph(intro_text, self.styles['Normal']))
-            story.append(Spacer(1, 20))
-            
-            # Audio Equipment Section
-            story.append(Paragraph("Audio Equipment", self.styles['Heading2']))
-            audio_data = self._get_sample_audio_equipment()
-            audio_table = Table(audio_data)
-            audio_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 12),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black)
-            ]))
-            story.append(audio_table)
-            story.append(Spacer(1, 20))
-            
-            # Video Equipment Section
-            story.append(Paragraph("Video Equipment", self.styles['Heading2']))
-            video_data = self._get_sample_video_equipment()
-            video_table = Table(video_data)
-            video_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 12),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black)
-            ]))
-            story.append(video_table)
-            story.append(Spacer(1, 20))
-            
-            # Lighting Equipment Section
-            story.append(Paragraph("Lighting Equipment", self.styles['Heading2']))
-            lighting_data = self._get_sample_lighting_equipment()
-            lighting_table = Table(lighting_data)
-            lighting_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 12),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black)
-            ]))
-            story.append(lighting_table)
-            
-            # Build PDF
-            doc.build(story)
+            if fancy:
+                self._build_platypus_pdf(filepath, venue_name)
+            else:
+                self._build_canvas_pdf(filepath, venue_name)
             return filepath
             
         except Exception as e:
             logging.error(f"Error generating PDF for {venue_name}: {e}")
             return None
     
-    def _get_sample_audio_equipment(self) -> List[List[str]]:
-        """Get sample audio equipment data."""
+    def _equipment_sections(self) -> List[tuple]:
+        """Get the (heading, table data) pairs included in every sample PDF."""
         return [
-            ['Manufacturer', 'Model', 'Type', 'Quantity', 'Specifications'],
-            ['Shure', 'SM58', 'Dynamic Microphone', '12', 'Frequency Response: 50-15,000 Hz'],
-            ['Yamaha', 'QL5', 'Digital Mixing Console', '1', '32 Input Channels, 16 Mix Buses'],
-            ['QSC', 'K12.2', 'Powered Speaker', '8', '2000W, 12" Woofer, 1.75" Tweeter'],
-            ['Sennheiser', 'EW 100 G4', 'Wireless Microphone System', '6', 'UHF Band, 42 MHz Bandwidth'],
-            ['JBL', 'VTX V25', 'Line Array Speaker', '16', '3-way, Neodymium Drivers'],
-            ['Yamaha', 'DM2000', 'Digital Mixer', '1', '96 Input Channels, 24-bit/96kHz'],
-            ['Crown', 'XTi 6002', 'Power Amplifier', '4', '2100W @ 4Ω, DSP Processing'],
-            ['Shure', 'ULXD4', 'Wireless Receiver', '8', 'Digital, AES256 Encryption']
+            ("Audio Equipment", self._get_sample_audio_equipment()),
+            ("Video Equipment", self._get_sample_video_equipment()),
+            ("Lighting Equipment", self._get_sample_lighting_equipment()),
         ]
     
-    def _get_sample_video_equipment(self) -> List[List[str]]:
+    def _intro_text(self, venue_name: str) -> str:
+        """Get the introduction paragraph of a sample PDF."""
+        return (
+            f"This document contains the technical specifications and equipment inventory for {venue_name}. "
+            "The venue is equipped with state-of-the-art audio, video, and lighting systems to support "
+            "various types of performances and events."
+        )
+    
+    def _build_canvas_pdf(self, filepath: str, venue_name: str):
+        """Draw a sample PDF directly on a canvas at fixed positions (no layout passes)."""
+        page_width, page_height = letter
+        margin = inch
+        row_height = 18
+        cell_padding = 6
+        
+        c = canvas.Canvas(filepath, pagesize=letter)
+        y = page_height - margin
+        
+        # Title
+        c.setFont("Helvetica-Bold", 18)
+        c.drawCentredString(page_width / 2, y - 18, f"{venue_name} - Technical Specifications")
+        y -= 18 + 30
+        
+        # Introduction
+        c.setFont("Helvetica", 10)
+        for line in simpleSplit(self._intro_text(venue_name), "Helvetica", 10, page_width - 2 * margin):
+            y -= 12
+            c.drawString(margin, y, line)
+        y -= 20
+        
+        for heading, data in self._equipment_sections():
+            # Keep the heading and its table together on one page
+            if y - 30 - len(data) * row_height < margin:
+                c.showPage()
+                y = page_height - margin
+            c.setFont("Helvetica-Bold", 14)
+            y -= 24
+            c.drawString(margin, y, heading)
+            y -= 6
+            
+            # Precompute the column grid from the widest cell of each column
+            col_widths = [
+                max(stringWidth(row[col], "Helvetica-Bold" if row_idx == 0 else "Helvetica", 10)
+                    for row_idx, row in enumerate(data)) + 2 * cell_padding
+                for col in range(len(data[0]))
+            ]
+            x_positions = [(page_width - sum(col_widths)) / 2]
+            for width in col_widths:
+                x_positions.append(x_positions[-1] + width)
+            
+            # Header and body backgrounds, then centred cell text, then the grid lines
+            y_positions = [y - row_idx * row_height for row_idx in range(len(data) + 1)]
+            table_width = x_positions[-1] - x_positions[0]
+            c.setFillColor(colors.grey)
+            c.rect(x_positions[0], y_positions[1], table_width, row_height, stroke=0, fill=1)
+            c.setFillColor(colors.beige)
+            c.rect(x_positions[0], y_positions[-1], table_width, y_positions[1] - y_positions[-1], stroke=0, fill=1)
+            
+            c.setFillColor(colors.whitesmoke)
+            c.setFont("Helvetica-Bold", 10)
+            for row_idx, row in enumerate(data):
+                if row_idx == 1:
+                    c.setFillColor(colors.black)
+                    c.setFont("Helvetica", 10)
+                for col, cell in enumerate(row):
+                    c.drawCentredString((x_positions[col] + x_positions[col + 1]) / 2, y_positions[row_idx + 1] + 5, cell)
+            c.grid(x_positions, y_positions)
+            y = y_positions[-1] - 20
+        
+        c.showPage()
+        c.save()
+    
+    def _build_platypus_pdf(self, filepath: str, venue_name: str):
+        """Lay out a sample PDF with Platypus flowables."""
+        # Create PDF document
+        doc = SimpleDocTemplate(filepath, pagesize=letter)
+        story = []
+        
+        section_style = self.styles['Heading2']
+        
+        # Title
+        story.append(Paragraph(f"{venue_name} - Technical Specifications", self.title_style))
+        story.append(Spacer(1, 20))
+        
+        # Introduction
+        story.append(Paragraph(self._intro_text(venue_name), self.styles['Normal']))
+        story.append(Spacer(1, 20))
+        
+        # Equipment sections
+        for section_idx, (heading, data) in enumerate(self._equipment_sections()):
+            if section_idx:
+                story.append(Spacer(1, 20))
+            story.append(Paragraph(heading, section_style))
+            table = Table(data)
+            table.setStyle(_EQUIPMENT_STYLE)
+            story.append(table)
+        
+        # Build PDF
+        doc.build(story)
+    
+    def _get_sample_audio_equipment(self) -> Tuple[Tuple[str, ...], ...]:
+        """Get sample audio equipment data."""
+        return _SAMPLE_AUDIO
+    
+    def _get_sample_video_equipment(self) -> Tuple[Tuple[str, ...], ...]:
         """Get sample video equipment data."""
-        return [
-            ['Manufacturer', 'Model', 'Type', 'Quantity', 'Specifications'],
-            ['Sony', 'PXW-Z750', 'Professional Camera', '3', '4K, 3x 2/3" CMOS Sensors'],
-            ['Barco', 'UDX-4K32', 'Projector', '2', '31,000 Lumens, 4K Resolution'],
-            ['Blackmagic', 'ATEM 2 M/E', 'Video Switcher', '1', '20 Inputs, 4K Support'],
-            ['Christie', 'D13WU-H', 'Projector', '1', '13,000 Lumens, WUXGA'],
-            ['Panasonic', 'AW-UE150', 'PTZ Camera', '4', '4K, 20x Optical Zoom'],
-            ['Roland', 'V-60HD', 'Video Switcher', '1', '6 HDMI Inputs, Full HD'],
-            ['Da-Lite', 'Fast-Fold Deluxe', 'Projection Screen', '2', '16:9 Aspect Ratio, 20ft Wide'],
-            ['AJA', 'KONA 5', 'Video I/O Card', '2', '4K/UltraHD, 12G-SDI']
-        ]
+        return _SAMPLE_VIDEO
     
-    def _get_sample_lighting_equipment(self) -> List[List[str]]:
+    def _get_sample_lighting_equipment(self) -> Tuple[Tuple[str, ...], ...]:
         """Get sample lighting equipment data."""
-        return [
-            ['Manufacturer', 'Model', 'Type', 'Quantity', 'Specifications'],
-            ['ETC', 'ColorSource PAR', 'LED Par Light', '24', 'RGBA-Lime, 7-color LED Array'],
-            ['Martin', 'MAC Quantum Wash', 'Moving Head Wash', '12', 'RGBW LED, 19° - 54° Zoom'],
-            ['Chamsys', 'MagicQ MQ500', 'Lighting Console', '1', '202 Universes, Touch Screen'],
-            ['Robe', 'Pointe', 'Moving Head Spot', '8', '280W Lamp, Prism, Gobos'],
-            ['ETC', 'Ion Xe 20', 'Lighting Console', '1', '20 Faders, 40,960 Outputs'],
-            ['Clay Paky', 'Mythos 2', 'Hybrid Moving Light', '6', '470W LED, Beam/Spot/Wash'],
-            ['Avolites', 'Tiger Touch II', 'Lighting Console', '1', '20 Playback Faders'],
-            ['High End', 'SolaFrame 750', 'LED Framing Spot', '16', '26,000 Lumens, Framing System'],
-            ['MA Lighting', 'grandMA3 Light', 'Lighting Console', '1', '8,192 Parameters']
-        ]
+        return _SAMPLE_LIGHTING
@@ -0,0 +1,93 @@
+"""
+Tests that equipment database searches through the search index match a linear scan.
+"""
+import os
+import random
+import shutil
+
+import pytest
+
+import data_extractor
+from data_exporter import DataExporter
+
+
+@pytest.fixture
+def exporter(monkeypatch):
+    monkeypatch.setattr(data_extractor, "OPENAI_API_KEY", "test-key")
+    return DataExporter()
+
+
+@pytest.fixture
+def equipment():
+    rng = random.Random(7)
+    manufacturers = ["Shure", "Sennheiser", "Yamaha", "ETC", "Martin", "Barco", "Panasonic", "QSC"]
+    categories = ["sound", "lighting", "video", "Sound"]
+    entries = {}
+    for i in range(300):
+        manufacturer = rng.choice(manufacturers)
+        model = f"{rng.choice(['SM', 'EW', 'QL', 'Mac ', 'UDX-', 'K'])}{rng.randint(1, 999)}"
+        entries[f"{manufacturer}_{model}_{i}".lower()] = {
+            "manufacturer": manufacturer,
+            "model": model,
+            "category": rng.choice(categories),
+        }
+    return entries
+
+
+@pytest.fixture
+def databases(exporter, equipment, tmp_path):
+    """The same database written twice: once with a search index and once without."""
+    indexed_path = str(tmp_path / "indexed.json")
+    exporter._write_json(indexed_path, {"equipment": equipment})
+    exporter._write_json(exporter._index_path(indexed_path), exporter._build_search_index(equipment))
+    
+    scan_path = str(tmp_path / "scan.json")
+    shutil.copyfile(indexed_path, scan_path)
+    assert not os.path.exists(exporter._index_path(scan_path))
+    return indexed_path, scan_path
+
+
+@pytest.mark.parametrize("manufacturer, model, category", [
+    (None, None, None),
+    ("shu", None, None),
+    ("Shure", None, None),
+    ("SEN", None, None),
+    ("e", None, None),
+    ("et", None, None),
+    (None, "SM1", None),
+    (None, "mac 1", None),
+    (None, "udx-", None),
+    (None, "9", None),
+    (None, None, "sound"),
+    (None, None, "VIDEO"),
+    ("yam", "ql", "sound"),
+    ("barco", "udx-5", "video"),
+    ("nobody", None, None),
+    (None, None, "rigging"),
+])
+def test_index_search_matches_linear_scan(exporter, databases, manufacturer, model, category):
+    indexed_path, scan_path = databases
+    assert exporter._find_candidate_keys(scan_path, manufacturer, model, category) is None
+    expected = exporter.search_equipment_database(scan_path, manufacturer, model, category)
+    assert exporter.search_equipment_database(indexed_path, manufacturer, model, category) == expected
+
+
+def test_index_narrows_candidates(exporter, databases, equipment):
+    indexed_path, _ = databases
+    candidates = exporter._find_candidate_keys(indexed_path, "Shure", "SM", None)
+    assert candidates is not None
+    assert len(candidates) < len(equipment)
+
+
+def test_search_sees_rewritten_database(exporter, databases):
+    indexed_path, _ = databases
+    assert exporter.search_equipment_database(indexed_path, manufacturer="Acme") == []
+    
+    replacement = {"acme_x1": {"manufacturer": "Acme", "model": "X1", "category": "sound"}}
+    exporter._write_json(indexed_path, {"equipment": replacement})
+    exporter._write_json(exporter._index_path(indexed_path), exporter._build_search_index(replacement))
+    stat = os.stat(indexed_path)
+    os.utime(indexed_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    os.utime(exporter._index_path(indexed_path), ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    
+    assert exporter.search_equipment_database(indexed_path, manufacturer="Acme") == [replacement["acme_x1"]]
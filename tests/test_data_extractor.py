@@ -0,0 +1,57 @@
+"""
+Tests for packing extraction blocks into token-budgeted requests.
+"""
+import pytest
+
+import data_extractor
+from data_extractor import DataExtractor, ExtractionBlock
+from pdf_processor import PDFContent
+
+
+@pytest.fixture
+def extractor(monkeypatch):
+    monkeypatch.setattr(data_extractor, "OPENAI_API_KEY", "test-key")
+    # One token per word keeps the budgets in these tests easy to follow
+    monkeypatch.setattr(data_extractor, "_count_tokens", lambda text: len(text.split()))
+    monkeypatch.setattr(data_extractor, "EXTRACTION_BATCH_MAX_TOKENS", 10)
+    return DataExtractor()
+
+
+def make_blocks(*word_counts):
+    pdf_content = PDFContent(text="", pages=[], tables=[], metadata={}, file_path="/specs.pdf", venue="Venue")
+    return [
+        ExtractionBlock(f"block_{i}", "text", " ".join(["word"] * count), pdf_content)
+        for i, count in enumerate(word_counts)
+    ]
+
+
+def group_sizes(groups):
+    return [[len(block.content.split()) for block in group] for group in groups]
+
+
+def test_group_blocks_packs_consecutive_blocks_within_budget(extractor):
+    groups = extractor._group_blocks(make_blocks(4, 3, 3, 5, 2, 6))
+    assert group_sizes(groups) == [[4, 3, 3], [5, 2], [6]]
+
+
+def test_group_blocks_keeps_block_order(extractor):
+    blocks = make_blocks(2, 9, 1, 8, 3)
+    groups = extractor._group_blocks(blocks)
+    assert [block for group in groups for block in group] == blocks
+
+
+def test_group_blocks_gives_oversized_block_its_own_group(extractor):
+    groups = extractor._group_blocks(make_blocks(3, 25, 3))
+    assert group_sizes(groups) == [[3], [25], [3]]
+
+
+def test_group_blocks_fills_each_group_greedily(extractor):
+    groups = extractor._group_blocks(make_blocks(*[1, 4, 6, 2, 2, 7, 3, 5, 5, 1]))
+    for group, next_group in zip(groups, groups[1:]):
+        tokens = sum(len(block.content.split()) for block in group)
+        assert tokens <= 10
+        assert tokens + len(next_group[0].content.split()) > 10
+
+
+def test_group_blocks_empty(extractor):
+    assert extractor._group_blocks([]) == []
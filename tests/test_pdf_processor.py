@@ -0,0 +1,110 @@
+"""
+Tests that plain-text table detection still matches the original regex-based implementation.
+"""
+import random
+import re
+
+import pytest
+
+from pdf_processor import PDFProcessor
+
+SAMPLE_TEXT = """Technical Specifications
+The venue offers the following equipment.
+
+Manufacturer  Model  Quantity
+Shure\tSM58\t12
+Yamaha   QL5   1
+This sentence ends the table.
+Brand  Type
+ETC  Source Four  24
+
+Notes  only one row here
+
+Item\tPrice
+Coffee\t2.50
+"""
+
+
+def reference_extract_tables_from_text(text):
+    """The original implementation: a regex split per line and a keyword scan of the header."""
+    def looks_like_table_row(line):
+        return len(re.split(r'\s{2,}|\t', line)) >= 2
+    
+    def parse_table_row(line):
+        return [part.strip() for part in re.split(r'\s{2,}|\t', line) if part.strip()]
+    
+    def looks_like_equipment_table(table):
+        header = ' '.join(table[0]).lower()
+        keywords = ['equipment', 'model', 'manufacturer', 'quantity', 'type', 'brand',
+                    'description', 'specs', 'specifications', 'audio', 'video', 'lighting']
+        return len(table) >= 2 and any(keyword in header for keyword in keywords)
+    
+    tables = []
+    current_table = []
+    in_table = False
+    for line in text.split('\n'):
+        line = line.strip()
+        if not line:
+            if in_table and current_table:
+                tables.append(current_table)
+                current_table = []
+                in_table = False
+            continue
+        if looks_like_table_row(line):
+            row = parse_table_row(line)
+            if row and len(row) > 1:
+                current_table.append(row)
+                in_table = True
+        elif in_table and current_table:
+            tables.append(current_table)
+            current_table = []
+            in_table = False
+    if current_table:
+        tables.append(current_table)
+    return [table for table in tables if len(table) >= 2 and looks_like_equipment_table(table)]
+
+
+@pytest.fixture
+def processor():
+    return PDFProcessor()
+
+
+def test_extract_tables_from_sample_text(processor):
+    tables = processor._extract_tables_from_text(SAMPLE_TEXT)
+    assert tables == reference_extract_tables_from_text(SAMPLE_TEXT)
+    assert tables == [
+        [['Manufacturer', 'Model', 'Quantity'], ['Shure', 'SM58', '12'], ['Yamaha', 'QL5', '1']],
+        [['Brand', 'Type'], ['ETC', 'Source Four', '24']],
+    ]
+
+
+@pytest.mark.parametrize("text", [
+    "",
+    "\n\n",
+    "Model  Qty\n",
+    "Model  Qty\nSM58  2",
+    "Model  Qty  \nSM58  2\n  trailing  \n",
+    "Model\xa0\xa0Qty\nSM58\xa0\xa02",
+    "Model \x0b Qty\r\nSM58\f\f2\r\n",
+    "  Model  Qty\n\tSM58\t2\t\n",
+])
+def test_extract_tables_matches_reference_on_edge_cases(processor, text):
+    assert processor._extract_tables_from_text(text) == reference_extract_tables_from_text(text)
+
+
+def test_extract_tables_matches_reference_on_random_text(processor):
+    rng = random.Random(20240101)
+    words = ['Model', 'Quantity', 'Shure', 'SM58', 'Brand', 'lighting', 'the', 'x', '12']
+    separators = [' ', '  ', '\t', ' \t ', '\xa0\xa0', '   ', '  ']
+    for _ in range(300):
+        lines = []
+        for _ in range(rng.randint(0, 12)):
+            if rng.random() < 0.15:
+                lines.append(rng.choice(['', ' ', '\t']))
+                continue
+            line = rng.choice(words)
+            for _ in range(rng.randint(0, 3)):
+                line += rng.choice(separators) + rng.choice(words)
+            lines.append(rng.choice(['', ' ', '  ']) + line + rng.choice(['', ' ', '  ']))
+        text = '\n'.join(lines)
+        assert processor._extract_tables_from_text(text) == reference_extract_tables_from_text(text), repr(text)
@@ -0,0 +1,83 @@
+"""
+Tests for URL canonicalization and sitemap parsing in the web scraper.
+"""
+import gzip
+
+import pytest
+
+import web_scraper
+from web_scraper import _canonical_url, _parse_sitemap
+
+URLSET = (
+    b'<?xml version="1.0" encoding="UTF-8"?>'
+    b'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+    b'<url><loc> https://venue.example/files/tech-specs.pdf </loc></url>'
+    b'<url><loc>https://venue.example/about</loc></url>'
+    b'</urlset>'
+)
+SITEMAP_INDEX = (
+    b'<?xml version="1.0" encoding="UTF-8"?>'
+    b'<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+    b'<sitemap><loc>https://venue.example/sitemap-pages.xml</loc></sitemap>'
+    b'</sitemapindex>'
+)
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("HTTP://Venue.Example/Tech/", "http://venue.example/Tech"),
+    ("https://venue.example:443/a", "https://venue.example/a"),
+    ("http://venue.example:80/a", "http://venue.example/a"),
+    ("http://venue.example:8080/a", "http://venue.example:8080/a"),
+    ("https://venue.example/specs.pdf#page=2", "https://venue.example/specs.pdf"),
+    ("https://venue.example/list?b=2&a=1&a=0", "https://venue.example/list?a=0&a=1&b=2"),
+    ("https://venue.example", "https://venue.example/"),
+    ("  https://venue.example/  ", "https://venue.example/"),
+])
+def test_canonical_url(url, expected):
+    assert _canonical_url(url) == expected
+
+
+def test_canonical_url_equates_variants():
+    variants = [
+        "https://Venue.example/docs/rider.pdf?v=1&lang=en",
+        "https://venue.example:443/docs/rider.pdf/?lang=en&v=1",
+        "https://venue.example/docs/rider.pdf?lang=en&v=1#top",
+    ]
+    assert len({_canonical_url(url) for url in variants}) == 1
+
+
+def test_canonical_url_keeps_unparsable_port():
+    assert _canonical_url("http://venue.example:notaport/a") == "http://venue.example:notaport/a"
+
+
+def test_parse_sitemap_urlset():
+    assert _parse_sitemap(URLSET) == (False, [
+        "https://venue.example/files/tech-specs.pdf",
+        "https://venue.example/about",
+    ])
+
+
+def test_parse_sitemap_index():
+    assert _parse_sitemap(SITEMAP_INDEX) == (True, ["https://venue.example/sitemap-pages.xml"])
+
+
+def test_parse_sitemap_gzipped():
+    assert _parse_sitemap(gzip.compress(URLSET)) == _parse_sitemap(URLSET)
+    assert _parse_sitemap(gzip.compress(SITEMAP_INDEX)) == _parse_sitemap(SITEMAP_INDEX)
+
+
+def test_parse_sitemap_rejects_oversized_gzip(monkeypatch):
+    monkeypatch.setattr(web_scraper, "SITEMAP_MAX_BYTES", 1024)
+    bomb = gzip.compress(URLSET[:-len(b'</urlset>')] + b' ' * 4096 + b'</urlset>')
+    with pytest.raises(Exception, match="too large"):
+        _parse_sitemap(bomb)
+
+
+def test_parse_sitemap_does_not_expand_entities():
+    content = (
+        b'<?xml version="1.0"?><!DOCTYPE urlset [<!ENTITY host "https://elsewhere.example">]>'
+        b'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"><url><loc>&host;/x.pdf</loc></url></urlset>'
+    )
+    is_index, locs = _parse_sitemap(content)
+    assert not is_index
+    assert all("elsewhere.example" not in loc for loc in locs)
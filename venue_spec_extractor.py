@@ -1,16 +1,28 @@
 import asyncio
+import atexit
 import logging
+import logging.handlers
+import multiprocessing
 import os
+import queue
+import re
 import sys
 from typing import List, Dict, Optional
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from functools import cached_property, partial
+from itertools import cycle, islice
 import argparse
+import time
+from email.utils import formatdate
+
+import aiohttp
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
-from web_scraper import VenueWebScraper
-from pdf_processor import PDFProcessor
-from data_extractor import DataExtractor
-from data_standardizer import DataStandardizer
-from data_exporter import DataExporter
 from config import *
 
 class VenueSpecExtractor:
@@ -21,24 +33,69 @@ class VenueSpecExtractor:
         os.makedirs(PDF_CACHE_DIR, exist_ok=True)
         os.makedirs(LOGS_DIR, exist_ok=True)
         self.setup_logging()
-        self.web_scraper = VenueWebScraper()
-        self.pdf_processor = PDFProcessor()
-        self.data_extractor = DataExtractor()
-        self.data_standardizer = DataStandardizer()
-        self.data_exporter = DataExporter()
+    
+    # Collaborators (and their heavy dependencies) are imported and created on first use,
+    # so paths such as equipment search only pay for the components they actually touch
+    @cached_property
+    def web_scraper(self):
+        from web_scraper import VenueWebScraper
+        return VenueWebScraper()
+    
+    @cached_property
+    def pdf_processor(self):
+        from pdf_processor import PDFProcessor
+        return PDFProcessor()
+    
+    @cached_property
+    def data_extractor(self):
+        from data_extractor import DataExtractor
+        return DataExtractor()
+    
+    @cached_property
+    def data_standardizer(self):
+        from data_standardizer import DataStandardizer
+        return DataStandardizer()
+    
+    @cached_property
+    def data_exporter(self):
+        from data_exporter import DataExporter
+        return DataExporter()
     
     def setup_logging(self):
+        """
+        Send log records through a queue to a background thread that writes the log file and stdout.
+        
+        Like logging.basicConfig, this does nothing when the root logger already has handlers,
+        so creating several extractors configures logging only once.
+        """
+        root_logger = logging.getLogger()
+        if root_logger.handlers:
+            logging.info("Venue Specification Extractor initialized")
+            return
+        
         log_filename = f"venue_extraction_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
         log_filepath = os.path.join(LOGS_DIR, log_filename)
         
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_filepath),
-                logging.StreamHandler(sys.stdout)
-            ]
-        )
+        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+        handlers = [logging.FileHandler(log_filepath), logging.StreamHandler(sys.stdout)]
+        for handler in handlers:
+            handler.setFormatter(formatter)
+        
+        log_queue = queue.Queue(-1)
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        listener = logging.handlers.QueueListener(log_queue, *handlers)
+        listener.start()
+        atexit.register(listener.stop)
+        
+        root_logger.setLevel(logging.INFO)
+        root_logger.addHandler(queue_handler)
+        
+        # Forked worker processes have no listener thread draining the queue, so they write directly
+        def log_directly_in_child():
+            root_logger.removeHandler(queue_handler)
+            for handler in handlers:
+                root_logger.addHandler(handler)
+        os.register_at_fork(after_in_child=log_directly_in_child)
         
         logging.info("Venue Specification Extractor initialized")
     
@@ -49,38 +106,61 @@ class VenueSpecExtractor:
         logging.info(f"Starting extraction process for {len(venue_names)} venues")
         
         try:
-            # Step 1: Discover venue websites (unless skipped)
+            # Create the AI extractor now, so a missing OpenAI API key fails the run before any
+            # searching, crawling, downloading or parsing is spent on it
+            self.data_extractor
+            
+            # Provided PDF paths replace website discovery (step 1-2) and downloading (step 3)
             if skip_web_search and pdf_paths:
                 logging.info("Skipping web search, using provided PDF paths")
                 venue_pdfs = self._create_pdf_info_from_paths(venue_names, pdf_paths)
+                stages = []
             else:
-                logging.info("Step 1: Discovering venue websites...")
-                venue_websites = self.web_scraper.search_venues(venue_names)
-                
-                # Step 2: Find PDFs on websites
-                logging.info("Step 2: Locating technical specification PDFs...")
-                venue_pdfs = self.web_scraper.find_pdfs_on_websites(venue_websites)
-                
-                # Step 3: Download PDFs
-                logging.info("Step 3: Downloading PDFs...")
-                venue_pdfs = await self.web_scraper.download_pdfs(venue_pdfs)
+                venue_pdfs = None
+                stages = [self._download_venue_pdfs]
+            
+            # Steps 1-6 run as a pipeline: each venue moves on as soon as its stage is done, so
+            # downloading one venue overlaps parsing and AI extraction of the ones before it.
+            # Bounded queues keep only a few venues buffered between stages.
+            logging.info("Steps 1-6: Discovering, downloading, processing, extracting and standardizing per venue...")
+            # One process pool parses the PDFs of every venue, so workers are started once per run
+            pdf_pool = ProcessPoolExecutor(max_workers=os.cpu_count(),
+                                           mp_context=multiprocessing.get_context(PROCESS_START_METHOD))
+            stages += [partial(self._process_venue_pdfs, pdf_pool=pdf_pool)]
+            # AI extraction takes every venue already waiting (up to EXTRACTION_VENUE_BATCH_SIZE)
+            # in one call, so their blocks are packed into shared, concurrently sent requests.
+            # Standardization takes each extracted batch together too, so large multi-venue
+            # batches can be standardized in parallel processes
+            runners = [partial(self._run_pipeline_stage, stage) for stage in stages] + [
+                partial(self._run_batched_pipeline_stage, self._extract_venues_equipment, EXTRACTION_VENUE_BATCH_SIZE),
+                partial(self._run_batched_pipeline_stage, self._standardize_venues_equipment, EXTRACTION_VENUE_BATCH_SIZE),
+            ]
+            queues = [asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE) for _ in stages] + [
+                asyncio.Queue(maxsize=max(PIPELINE_QUEUE_SIZE, EXTRACTION_VENUE_BATCH_SIZE)),
+                asyncio.Queue(maxsize=max(PIPELINE_QUEUE_SIZE, EXTRACTION_VENUE_BATCH_SIZE)),
+                asyncio.Queue()
+            ]
+            pdf_counts = {}
+            
+            try:
+                async with asyncio.TaskGroup() as task_group:
+                    task_group.create_task(self._discover_venue_pdfs(venue_names, venue_pdfs, pdf_counts, queues[0]))
+                    for runner, inbox, outbox in zip(runners, queues, queues[1:]):
+                        task_group.create_task(runner(inbox, outbox))
+            except ExceptionGroup as group:
+                raise group.exceptions[0]
+            finally:
+                pdf_pool.shutdown(cancel_futures=True)
             
             # Check if we found any PDFs - fail if none found
-            total_pdfs = sum(len(pdfs) for pdfs in venue_pdfs.values())
+            total_pdfs = sum(pdf_counts.values())
             if total_pdfs == 0:
                 raise Exception("No PDFs found for any venues. System requires actual venue PDFs to function.")
             
-            # Step 4: Process PDFs
-            logging.info("Step 4: Processing PDFs and extracting content...")
-            processed_content = self.pdf_processor.process_pdfs(venue_pdfs)
-            
-            # Step 5: Extract equipment data using AI
-            logging.info("Step 5: Extracting equipment data using AI...")
-            extracted_data = self.data_extractor.extract_equipment_data(processed_content)
-            
-            # Step 6: Standardize and normalize data
-            logging.info("Step 6: Standardizing and normalizing data...")
-            standardized_data = self.data_standardizer.standardize_equipment_data(extracted_data)
+            standardized_data = {}
+            while (entry := queues[-1].get_nowait()) is not None:
+                venue_name, standardized_items = entry
+                standardized_data[venue_name] = standardized_items
             
             # Step 7: Validate data
             logging.info("Step 7: Validating standardized data...")
@@ -91,8 +171,8 @@ class VenueSpecExtractor:
             exported_files = self.data_exporter.export_all_formats(standardized_data, validation_report)
             
             # Log summary
-            total_equipment = sum(len(items) for items in standardized_data.values())
-            total_issues = sum(len(issues) for issues in validation_report.values())
+            total_equipment = sum(map(len, standardized_data.values()))
+            total_issues = sum(map(len, validation_report.values()))
             
             logging.info(f"Extraction completed successfully!")
             logging.info(f"Total venues processed: {len(standardized_data)}")
@@ -107,8 +187,89 @@ class VenueSpecExtractor:
             raise
         
         finally:
-            # Cleanup
-            self.web_scraper.close()
+            # Cleanup (the scraper is never created when web search is skipped)
+            if 'web_scraper' in self.__dict__:
+                await self.web_scraper.close_async()
+    
+    async def _discover_venue_pdfs(self, venue_names: List[str], venue_pdfs: Optional[Dict[str, List[Dict]]],
+                                   pdf_counts: Dict[str, int], outbox: asyncio.Queue):
+        """
+        Pipeline source: find each venue's PDFs (or take the given ones) and pass them on, then end the stream.
+        
+        PDF discovery for all venues runs concurrently; results are still passed on in venue order.
+        """
+        if venue_pdfs is not None:
+            for venue_name in venue_names:
+                pdfs = venue_pdfs.get(venue_name, [])
+                pdf_counts[venue_name] = len(pdfs)
+                await outbox.put((venue_name, pdfs))
+        else:
+            discoveries = self.web_scraper.iter_venue_pdfs(venue_names)
+            try:
+                async for venue_name, pdfs in discoveries:
+                    pdf_counts[venue_name] = len(pdfs)
+                    await outbox.put((venue_name, pdfs))
+            finally:
+                await discoveries.aclose()
+        await outbox.put(None)
+
+    
+    async def _run_pipeline_stage(self, stage, inbox: asyncio.Queue, outbox: asyncio.Queue):
+        """Apply a stage to each (venue_name, data) entry in order; None marks the end of the stream."""
+        while (entry := await inbox.get()) is not None:
+            venue_name, data = entry
+            await outbox.put((venue_name, await stage(venue_name, data)))
+        await outbox.put(None)
+    
+    async def _run_batched_pipeline_stage(self, stage, batch_size: int, inbox: asyncio.Queue, outbox: asyncio.Queue):
+        """
+        Apply a stage to batches of entries: each call gets the next entry plus any others
+        already waiting, up to batch_size, as a {venue_name: data} dict.
+        """
+        end_of_stream = False
+        while not end_of_stream:
+            entry = await inbox.get()
+            if entry is None:
+                break
+            batch = dict([entry])
+            while len(batch) < batch_size and not inbox.empty():
+                entry = inbox.get_nowait()
+                if entry is None:
+                    end_of_stream = True
+                    break
+                batch[entry[0]] = entry[1]
+            
+            results = await stage(batch)
+            for venue_name in batch:
+                await outbox.put((venue_name, results.get(venue_name, [])))
+        await outbox.put(None)
+    
+    async def _download_venue_pdfs(self, venue_name: str, pdfs: List[Dict]) -> List[Dict]:
+        """Step 3: Download one venue's PDFs."""
+        if not pdfs:
+            return pdfs
+        return (await self.web_scraper.download_pdfs({venue_name: pdfs}))[venue_name]
+    
+    async def _process_venue_pdfs(self, venue_name: str, pdfs: List[Dict],
+                                  pdf_pool: Optional[ProcessPoolExecutor] = None) -> List:
+        """Step 4: Extract text and tables from one venue's PDFs."""
+        if not pdfs:
+            return []
+        return (await self.pdf_processor.process_pdfs_async({venue_name: pdfs}, executor=pdf_pool))[venue_name]
+    
+    async def _extract_venues_equipment(self, venue_contents: Dict[str, List]) -> Dict[str, List]:
+        """Step 5: Extract equipment data for a batch of venues using AI, in a single extraction run."""
+        venue_contents = {venue_name: contents for venue_name, contents in venue_contents.items() if contents}
+        if not venue_contents:
+            return {}
+        return await self.data_extractor.extract_equipment_data_async(venue_contents)
+    
+    async def _standardize_venues_equipment(self, venue_items: Dict[str, List]) -> Dict[str, List]:
+        """Step 6: Standardize and normalize equipment data for a batch of venues, in a single call."""
+        venue_items = {venue_name: items for venue_name, items in venue_items.items() if items}
+        if not venue_items:
+            return {}
+        return await asyncio.to_thread(self.data_standardizer.standardize_equipment_data, venue_items)
     
     def _create_pdf_info_from_paths(self, venue_names: List[str], pdf_paths: List[str]) -> Dict[str, List[Dict]]:
         venue_pdfs = {}
@@ -117,39 +278,36 @@ class VenueSpecExtractor:
         if len(venue_names) == len(pdf_paths):
             for venue_name, pdf_path in zip(venue_names, pdf_paths):
                 if os.path.exists(pdf_path):
-                    venue_pdfs[venue_name] = [{
-                        'url': f'file://{pdf_path}',
-                        'title': os.path.basename(pdf_path),
-                        'venue': venue_name,
-                        'source_page': 'local_file',
-                        'local_path': pdf_path,
-                        'downloaded': True
-                    }]
+                    venue_pdfs[venue_name] = [self._local_pdf_info(pdf_path, venue_name)]
                 else:
                     logging.warning(f"PDF file not found: {pdf_path}")
                     venue_pdfs[venue_name] = []
         else:
-            # Assign all PDFs to the first venue or distribute evenly
+            # Distribute the PDFs round-robin so no single venue ends up with all of them
             for venue_name in venue_names:
                 venue_pdfs[venue_name] = []
             
+            venue_cycle = cycle(venue_names)
             for pdf_path in pdf_paths:
                 if os.path.exists(pdf_path):
-                    # Assign to first venue for simplicity
-                    first_venue = venue_names[0]
-                    venue_pdfs[first_venue].append({
-                        'url': f'file://{pdf_path}',
-                        'title': os.path.basename(pdf_path),
-                        'venue': first_venue,
-                        'source_page': 'local_file',
-                        'local_path': pdf_path,
-                        'downloaded': True
-                    })
+                    venue_name = next(venue_cycle)
+                    venue_pdfs[venue_name].append(self._local_pdf_info(pdf_path, venue_name))
                 else:
                     logging.warning(f"PDF file not found: {pdf_path}")
         
         return venue_pdfs
     
+    def _local_pdf_info(self, pdf_path: str, venue_name: str) -> Dict:
+        """Build the PDF info record for a local file, marked as already downloaded."""
+        return {
+            'url': f'file://{pdf_path}',
+            'title': os.path.basename(pdf_path),
+            'venue': venue_name,
+            'source_page': 'local_file',
+            'local_path': pdf_path,
+            'downloaded': True
+        }
+    
     def search_equipment(self, database_path: str, manufacturer: str = None, 
                         model: str = None, category: str = None) -> List[Dict]:
        
@@ -164,98 +322,128 @@ class VenueSpecExtractor:
         return {
             "last_run": "Not available",
             "status": "Ready",
-            "cache_size": len(os.listdir(PDF_CACHE_DIR)) if os.path.exists(PDF_CACHE_DIR) else 0
+            "cache_size": self._count_directory_entries(PDF_CACHE_DIR)
         }
+    
+    @staticmethod
+    def _count_directory_entries(path: str) -> int:
+        """Count the entries in a directory without building a list of names (0 if it is missing)."""
+        try:
+            with os.scandir(path) as entries:
+                return sum(1 for _ in entries)
+        except FileNotFoundError:
+            return 0
+
+# Exclude links/names with these substrings (case-insensitive)
+EXCLUDE_SUBSTRINGS = [
+    "list", "category", "portal", "article", "commons", "main page", "current events",
+    "random article", "disambiguation", "template", "help:", "special:", "wikipedia:", "file:"
+]
+# Matched against lower-cased text; the substrings also cover the /wiki/List_of, Category:, Portal:,
+# Template:, Special:, Wikipedia: and File: namespaces, so no separate prefix checks are needed
+_EXCLUDE_RE = re.compile("|".join(map(re.escape, EXCLUDE_SUBSTRINGS)))
+
+# Tables whose class list contains "wikitable"
+_WIKITABLE_XPATH = '//table[contains(concat(" ", normalize-space(@class), " "), " wikitable ")]'
+
+async def _fetch_discovery_page(wiki_url: str) -> bytes:
+    """
+    Fetch the venue list page, reusing the copy on disk while it is younger than the TTL.
+    
+    A stale copy is revalidated with If-Modified-Since, so an unchanged page is not downloaded again.
+    """
+    cache_path = VENUE_DISCOVERY_CACHE_PATH
+    headers = {}
+    if os.path.exists(cache_path):
+        cached_at = os.path.getmtime(cache_path)
+        if time.time() - cached_at < VENUE_DISCOVERY_CACHE_TTL_HOURS * 3600:
+            with open(cache_path, 'rb') as f:
+                return f.read()
+        headers['If-Modified-Since'] = formatdate(cached_at, usegmt=True)
+    
+    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=15)) as session:
+        async with session.get(wiki_url, headers=headers) as response:
+            if response.status == 304:
+                os.utime(cache_path)
+                with open(cache_path, 'rb') as f:
+                    return f.read()
+            response.raise_for_status()
+            content = await response.read()
+    
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    with open(cache_path, 'wb') as f:
+        f.write(content)
+    return content
 
-def auto_discover_venues():
+async def auto_discover_venues():
     """
     Automatically discover a list of real venue names by scraping a Wikipedia list page.
     Only returns actual venues, not categories, lists, or meta pages.
     """
-    import requests
-    from bs4 import BeautifulSoup
+    import lxml.html
 
     # Example: Wikipedia list of concert halls in the United States
     wiki_url = "https://en.wikipedia.org/wiki/List_of_concert_halls"
 
     try:
-        response = requests.get(wiki_url, timeout=15)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, "html.parser")
+        content = await _fetch_discovery_page(wiki_url)
+        doc = lxml.html.fromstring(content)
         venue_names = set()
 
-        # Exclude links/names with these substrings (case-insensitive)
-        EXCLUDE_SUBSTRINGS = [
-            "list", "category", "portal", "article", "commons", "main page", "current events",
-            "random article", "disambiguation", "template", "help:", "special:", "wikipedia:", "file:"
-        ]
-
         # Prefer extracting from the main venue table if present
-        tables = soup.find_all("table", class_="wikitable")
+        tables = doc.xpath(_WIKITABLE_XPATH)
         if tables:
-            for table in tables:
-                for row in table.find_all("tr"):
-                    cells = row.find_all("td")
-                    if cells:
-                        a = cells[0].find("a")
-                        if a and a.get("href", "").startswith("/wiki/"):
-                            href = a.get("href", "").lower()
-                            name = a.get_text(strip=True)
-                            lname = name.lower()
-                            if (
-                                len(name) > 4
-                                and not any(ex in href for ex in EXCLUDE_SUBSTRINGS)
-                                and not any(ex in lname for ex in EXCLUDE_SUBSTRINGS)
-                                and not href.startswith("/wiki/list_of")
-                                and not href.startswith("/wiki/category:")
-                                and not href.startswith("/wiki/portal:")
-                                and not href.startswith("/wiki/template:")
-                                and not href.startswith("/wiki/special:")
-                                and not href.startswith("/wiki/wikipedia:")
-                                and not href.startswith("/wiki/file:")
-                            ):
-                                venue_names.add(name)
+            # The first link in the first cell of each row names the venue
+            for cell in doc.xpath(f'{_WIKITABLE_XPATH}//tr/td[1]'):
+                a = cell.find('.//a')
+                if a is not None and a.get("href", "").startswith("/wiki/"):
+                    href = a.get("href", "").lower()
+                    name = a.text_content().strip()
+                    if (
+                        len(name) > 4
+                        and _EXCLUDE_RE.search(href) is None
+                        and _EXCLUDE_RE.search(name.lower()) is None
+                    ):
+                        venue_names.add(name)
         else:
             # No table found - fail instead of using fallback
             raise Exception("No venue table found on Wikipedia page. Cannot auto-discover venues.")
 
-        # Post-process: Exclude names with meta/list/category/portal/template/special/file substrings
-        EXCLUDE_SUBSTRINGS = [
-            "list", "category", "portal", "article", "commons", "main page", "current events",
-            "random article", "disambiguation", "template", "help:", "special:", "wikipedia:", "file:"
-        ]
-        filtered_venue_names = [
-            name for name in venue_names
-            if not any(ex in name.lower() for ex in EXCLUDE_SUBSTRINGS)
-        ]
-        filtered_venue_names = sorted(filtered_venue_names)
+        filtered_venue_names = sorted(venue_names)
         if not filtered_venue_names:
             logging.warning("No venues found from Wikipedia list after filtering.")
-        return list(filtered_venue_names)
+        return filtered_venue_names
 
     except Exception as e:
         logging.error(f"Error during venue auto-discovery from Wikipedia: {e}")
         return []
 
+ARTIST_VENUE_KEYWORDS = [
+    "theatre", "theater", "hall", "center", "centre", "auditorium", "music", "arts", "arena", "stadium",
+    "opera", "concert", "performing", "club", "jazz", "philharmonic", "orchestra", "cultural", "amphitheatre",
+    "amphitheater", "recital", "event space", "event hall", "event center", "event centre"
+]
+# Keywords must start a word ("Marshall" is not a "hall"), but may run on into plurals
+# and compounds such as "Theatres" or "Concertgebouw"
+_ARTIST_VENUE_RE = re.compile(r"\b(?:" + "|".join(map(re.escape, ARTIST_VENUE_KEYWORDS)) + ")", re.IGNORECASE)
+
 def filter_artist_venues(venue_names):
     """
     Filter venue names to only include those likely to be artist/event venues.
+    
+    Returns a lazy iterator, so callers that only need the first few matches stop scanning early.
     """
-    keywords = [
-        "theatre", "theater", "hall", "center", "centre", "auditorium", "music", "arts", "arena", "stadium",
-        "opera", "concert", "performing", "club", "jazz", "philharmonic", "orchestra", "cultural", "amphitheatre",
-        "amphitheater", "recital", "auditorium", "event space", "event hall", "event center", "event centre"
-    ]
-    filtered = []
-    for name in venue_names:
-        lname = name.lower()
-        if any(kw in lname for kw in keywords):
-            filtered.append(name)
-    return filtered
+    return (name for name in venue_names if _ARTIST_VENUE_RE.search(name))
 
 MAX_VENUES_PER_RUN = 20  # Limit the number of venues processed per run
 
-def main():
+def _run_async(coro):
+    """Run a coroutine to completion, on uvloop's libuv-based event loop when it is installed."""
+    if uvloop is not None:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description='AI-powered venue specification extractor')
     
     parser.add_argument('venues', nargs='*', help='Venue names to process')
@@ -273,35 +461,18 @@ def main():
                        help='Model to search for')
     parser.add_argument('--category', type=str,
                        help='Category to filter by (lighting, sound, video)')
+    return parser
 
-    args = parser.parse_args()
-
-    # If no venues provided, auto-discover
-    if not args.venues or len(args.venues) == 0:
-        print("No venues provided. Automatically discovering venues...")
-        args.venues = auto_discover_venues()
-        print(f"Discovered venues: {args.venues}")
-
-    # Filter for artist/event venues only
-    filtered_venues = filter_artist_venues(args.venues)
-    if not filtered_venues:
-        print("No artist/event venues found after filtering.")
-        return
-    # Limit the number of venues processed per run
-    limited_venues = filtered_venues[:MAX_VENUES_PER_RUN]
-    if len(filtered_venues) > MAX_VENUES_PER_RUN:
-        print(f"Limiting to first {MAX_VENUES_PER_RUN} venues for speed.")
-    args.venues = limited_venues
-    print(f"Filtered venues: {args.venues}")
+def main():
+    args = _build_parser().parse_args()
 
-    extractor = VenueSpecExtractor()
-    
+    # Equipment search only reads an existing database, so it skips venue discovery entirely
     if args.search_equipment:
         if not args.database_path:
             print("Error: --database-path required for equipment search")
             return
         
-        results = extractor.search_equipment(
+        results = VenueSpecExtractor().search_equipment(
             args.database_path, 
             args.manufacturer, 
             args.model, 
@@ -314,26 +485,45 @@ def main():
             print(f"  Found in venues: {', '.join(result['venues_found_in'])}")
             print(f"  Total quantity: {result['total_quantity_across_venues']}")
             print()
+        return
+
+    # If no venues provided, auto-discover
+    if not args.venues or len(args.venues) == 0:
+        print("No venues provided. Automatically discovering venues...")
+        args.venues = _run_async(auto_discover_venues())
+        print(f"Discovered venues: {args.venues}")
+
+    # Filter for artist/event venues only, stopping one past the per-run limit
+    filtered_venues = list(islice(filter_artist_venues(args.venues), MAX_VENUES_PER_RUN + 1))
+    if not filtered_venues:
+        print("No artist/event venues found after filtering.")
+        return
+    # Limit the number of venues processed per run
+    if len(filtered_venues) > MAX_VENUES_PER_RUN:
+        print(f"Limiting to first {MAX_VENUES_PER_RUN} venues for speed.")
+    args.venues = filtered_venues[:MAX_VENUES_PER_RUN]
+    print(f"Filtered venues: {args.venues}")
+
+    extractor = VenueSpecExtractor()
     
-    else:
-        # Run extraction
-        try:
-            exported_files = asyncio.run(
-                extractor.extract_venue_specifications(
-                    args.venues,
-                    args.skip_web_search,
-                    args.pdf_paths
-                )
+    # Run extraction
+    try:
+        exported_files = _run_async(
+            extractor.extract_venue_specifications(
+                args.venues,
+                args.skip_web_search,
+                args.pdf_paths
             )
+        )
+        
+        print("\nExtraction completed successfully!")
+        print("Exported files:")
+        for format_name, file_path in exported_files.items():
+            print(f"  {format_name.upper()}: {file_path}")
             
-            print("\nExtraction completed successfully!")
-            print("Exported files:")
-            for format_name, file_path in exported_files.items():
-                print(f"  {format_name.upper()}: {file_path}")
-                
-        except Exception as e:
-            print(f"Error during extraction: {e}")
-            logging.error(f"Extraction failed: {e}")
+    except Exception as e:
+        print(f"Error during extraction: {e}")
+        logging.error(f"Extraction failed: {e}")
 
 if __name__ == "__main__":
     main()
@@ -2,64 +2,283 @@
 Web scraping module for discovering venue websites and technical specification PDFs.
 """
 import asyncio
+import hashlib
+import os
 import aiohttp
-import requests
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin, urlparse
+import lxml.etree
+import lxml.html
+import orjson
+from urllib.parse import parse_qsl, urlencode, urljoin, urlparse, urlsplit, urlunsplit
 import re
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 import logging
-from typing import List, Dict, Set, Optional
+import multiprocessing
+from typing import Any, AsyncIterator, List, Dict, Optional, Tuple
 import time
 import random
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
-from config import *
+import zlib
+try:
+    import aiodns
+except ImportError:
+    aiodns = None
+from config import (
+    SERPER_API_KEY, SERPER_MAX_CONCURRENT_REQUESTS, SERPER_MAX_RETRIES,
+    MAX_CONCURRENT_REQUESTS, REQUEST_DELAY_SECONDS, CRAWL_MAX_DEPTH, CRAWL_WORKERS, MAX_PDFS_PER_SITE,
+    HTML_MAX_BYTES, HTML_PARSE_POOL_MIN_BYTES, HTML_PARSE_WORKERS, SITEMAP_MAX_FILES, SITEMAP_MAX_BYTES,
+    VALIDATION_MAX_BYTES,
+    MAX_CONCURRENT_DOWNLOADS, DOWNLOAD_CONNECTION_LIMIT, DOWNLOAD_CONNECTIONS_PER_HOST, HTTP_KEEPALIVE_SECONDS,
+    MAX_DOWNLOADS_PER_HOST, DOWNLOAD_MAX_RETRIES, MAX_HOST_DELAY_SECONDS, MAX_REQUESTS_PER_HOST_PER_SECOND,
+    MAX_PDF_SIZE_MB, PDF_TIMEOUT_SECONDS, PDF_CACHE_DIR,
+    WEB_CACHE_ENABLED, WEB_CACHE_DIR, WEB_CACHE_TTL_HOURS, PROCESS_START_METHOD,
+    PDF_KEYWORDS, USER_AGENTS
+)
+
+SERPER_SEARCH_URL = "https://google.serper.dev/search"
+# Most queries Serper accepts in one batch request
+SERPER_BATCH_SIZE = 100
+# Page fetches give up quickly on hosts that do not accept a connection
+PAGE_TIMEOUT = aiohttp.ClientTimeout(total=10, sock_connect=5)
+
+
+def _keyword_pattern(keywords: List[str]) -> re.Pattern:
+    """Compile keywords into one case-insensitive pattern matching any of them as a substring."""
+    return re.compile('|'.join(re.escape(keyword) for keyword in keywords), re.IGNORECASE)
+
+
+def _canonical_url(url: str) -> str:
+    """
+    Normalize a URL so variants of the same address compare equal: lowercase scheme
+    and host, no fragment or default port, sorted query parameters and no trailing slash.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    netloc = parts.netloc.lower()
+    try:
+        if (scheme, parts.port) in (('http', 80), ('https', 443)):
+            netloc = netloc.rsplit(':', 1)[0]
+    except ValueError:
+        pass
+    path = parts.path.rstrip('/') or '/'
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, netloc, path, query, ''))
+
+
+@lru_cache(maxsize=4096)
+def _cached_netloc(url: str) -> str:
+    """Return a URL's lowercased host (and port); links repeat often enough during a crawl to memoize this."""
+    return urlparse(url).netloc.lower()
+
+
+def _visited_key(url: str) -> bytes:
+    """Return a compact key for a visited page: an 8-byte digest of its canonical URL."""
+    return hashlib.blake2b(_canonical_url(url).encode(), digest_size=8).digest()
+
+
+def _venue_name_pattern(venue_name: str) -> Optional[re.Pattern]:
+    """Compile a venue's distinctive name words (longer than 3 characters) into one pattern, or None if it has none."""
+    words = [word for word in venue_name.lower().split() if len(word) > 3]
+    if not words:
+        return None
+    return re.compile('|'.join(re.escape(word) for word in words))
+
+
+# Content types a PDF may be served with (many servers send a generic binary type)
+PDF_CONTENT_TYPES = {'application/pdf', 'application/x-pdf', 'application/octet-stream', 'binary/octet-stream'}
+# Content types worth parsing for links while crawling
+HTML_CONTENT_TYPES = {'text/html', 'application/xhtml+xml'}
+
+# Sitemap directives in robots.txt
+_ROBOTS_SITEMAP_RE = re.compile(rb'^\s*sitemap:\s*(\S+)', re.IGNORECASE | re.MULTILINE)
+# Sitemaps are parsed as data only: no entity expansion or network access, and libxml2's size limits kept
+_SITEMAP_PARSER = lxml.etree.XMLParser(resolve_entities=False, no_network=True)
+
+# Characters dropped from, and whitespace runs collapsed in, venue names used in filenames
+_NON_ALNUM_RE = re.compile(r'[^a-zA-Z0-9\s]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Links to PDF files, with or without a query string
+_PDF_HREF_RE = re.compile(r'\.pdf(?:$|\?)', re.IGNORECASE)
+# Link text or URLs suggesting a PDF holds technical specifications
+_RELEVANT_PDF_RE = _keyword_pattern(PDF_KEYWORDS + ['spec', 'technical', 'equipment', 'av', 'audio', 'visual'])
+# Navigation links worth following to find specification PDFs
+_RELEVANT_PAGE_RE = _keyword_pattern(['technical', 'specs', 'specifications', 'equipment', 'av', 'audio', 'visual', 'production'])
+# Domain words typical of venue websites
+_VENUE_DOMAIN_RE = _keyword_pattern(['center', 'centre', 'theatre', 'theater', 'hall', 'arts', 'opera', 'auditorium'])
+# Domain or page words that mark a search result as a venue website
+_VENUE_CONTENT_RE = _keyword_pattern([
+    "center", "centre", "theatre", "theater", "hall", "arts", "opera", "auditorium", "stadium", "arena", "philharmonic", "orchestra"
+])
+# The same words, for scanning raw page bytes without decoding them
+_VENUE_CONTENT_BYTES_RE = re.compile(_VENUE_CONTENT_RE.pattern.encode('ascii'), re.IGNORECASE)
+# Search results from these sites are never venue websites
+_EXCLUDED_DOMAIN_RE = _keyword_pattern([
+    "dictionary.cambridge.org", "thesaurus", "wikipedia.org", "wikidata.org", "wikimedia.org", "youtube.com", "facebook.com", "twitter.com", "linkedin.com", "tripadvisor.com"
+])
+
+def _is_html(content_type: Optional[str]) -> bool:
+    """Check if a Content-Type header is HTML; a missing header is given the benefit of the doubt."""
+    return not content_type or content_type.split(';')[0].strip().lower() in HTML_CONTENT_TYPES
+
+
+def _is_same_domain(url: str, netloc: str) -> bool:
+    """Check if a URL is on the given (lowercased) host, as returned by _cached_netloc."""
+    try:
+        return _cached_netloc(url) == netloc
+    except ValueError:  # Malformed URL, e.g. an unterminated IPv6 host
+        return False
+
+
+def _parse_page_links(content: bytes, page_url: str) -> Tuple[List[Tuple[str, str]], List[str]]:
+    """
+    Parse a page (lxml detects the encoding from the raw bytes) and find what to follow up.
+    
+    Kept at module level so large pages can be parsed in a worker process.
+    
+    Returns:
+        The relevant PDF links as (url, title) pairs, and the same-site pages
+        that might contain technical specifications
+    """
+    pdf_links = []
+    relevant_pages = []
+    # isspace() checks for a blank page without copying it, as strip() would
+    if not content or content.isspace():
+        return pdf_links, relevant_pages
+    
+    # The page's own host is compared against every candidate link, so it is looked up once
+    page_netloc = _cached_netloc(page_url)
+    tree = lxml.html.fromstring(content)
+    for link in tree.xpath('//a[@href]'):
+        href = link.get('href')
+        if not href:
+            continue
+        link_text = link.text_content().strip()
+        
+        if _PDF_HREF_RE.search(href):
+            # Direct PDF links, kept when they look like technical specifications
+            # (they are downloaded later, never crawled as pages)
+            if _RELEVANT_PDF_RE.search(link_text) or _RELEVANT_PDF_RE.search(href):
+                pdf_links.append((urljoin(page_url, href), link_text or 'Unknown'))
+        elif _RELEVANT_PAGE_RE.search(href) or _RELEVANT_PAGE_RE.search(link_text):
+            # Navigation links with relevant keywords
+            full_url = urljoin(page_url, href)
+            if _is_same_domain(full_url, page_netloc):
+                relevant_pages.append(full_url)
+    
+    return pdf_links, relevant_pages
+
+
+def _parse_sitemap(content: bytes) -> Tuple[bool, List[str]]:
+    """
+    Parse a sitemap (optionally gzipped) and return whether it is a sitemap index, and its <loc> URLs.
+    
+    Kept at module level so large sitemaps can be parsed in a worker process.
+    Gzipped sitemaps are rejected when they expand past SITEMAP_MAX_BYTES.
+    """
+    if content[:2] == b'\x1f\x8b':
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        content = decompressor.decompress(content, SITEMAP_MAX_BYTES)
+        if decompressor.unconsumed_tail:
+            raise Exception(f"Sitemap too large: more than {SITEMAP_MAX_BYTES} bytes decompressed")
+    root = lxml.etree.fromstring(content, _SITEMAP_PARSER)
+    is_index = lxml.etree.QName(root).localname == 'sitemapindex'
+    return is_index, [loc.strip() for loc in root.xpath("//*[local-name()='loc']/text()")]
+
 
 class VenueWebScraper:
     """Handles venue website discovery and PDF location."""
     
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': random.choice(USER_AGENTS)
-        })
-        self.found_pdfs = set()
+        # Session default (e.g. for Serper); website requests use one agent per host (see _user_agent)
+        self.user_agent = random.choice(USER_AGENTS)
+        self._host_user_agents = {}
+        # Visited pages as 8-byte digests of their canonical URLs (see _visited_key), which keeps
+        # long crawls' memory flat without the false positives of a Bloom filter
         self.visited_urls = set()
+        # Site crawls by canonical home page URL, so a site shared by several venues is crawled once
+        self._site_crawls = {}
+        # One pooled aiohttp session (and request limits) shared by every request of a run
+        self._http_session = None
+        self._request_semaphore = None
+        self._download_semaphore = None
+        self._host_semaphores = None
+        self._host_delays = {}
+        self._host_next_request = {}
+        self._serper_semaphore = None
+        self._serper_resume_at = 0.0
+        # Process pool for parsing large pages, created on first use
+        self._parse_pool = None
+        # Sitemap scans by host, so sites sharing a host read its sitemaps once
+        self._sitemap_scans = {}
+        # PDF downloads by canonical URL, so a document linked for several venues is fetched once
+        self._downloads = {}
         
-    def search_venues(self, venue_names: List[str]) -> Dict[str, List[str]]:
+    async def search_venues(self, venue_names: List[str]) -> Dict[str, List[str]]:
         """
         Search for official websites of venues.
         
+        All venues are looked up in batched Serper requests, then each venue's
+        candidate websites are validated concurrently over the shared session.
+        
         Args:
             venue_names: List of venue names to search for
             
         Returns:
             Dictionary mapping venue names to their potential website URLs
         """
-        venue_websites = {}
+        if not SERPER_API_KEY:
+            raise Exception("Serper API key is required for venue website search")
         
         for venue_name in venue_names:
             logging.info(f"Searching for websites for venue: {venue_name}")
-            websites = self._search_venue_websites(venue_name)
-            venue_websites[venue_name] = websites
-            time.sleep(REQUEST_DELAY_SECONDS)
-            
-        return venue_websites
+        serper_results = await self._serper_search(venue_names)
+        results = await asyncio.gather(*[
+            self._search_venue_websites(venue_name, serper_results[venue_name]) for venue_name in venue_names
+        ])
+        return dict(zip(venue_names, results))
     
-    def _search_venue_websites(self, venue_name: str) -> List[str]:
+    async def iter_venue_pdfs(self, venue_names: List[str]) -> AsyncIterator[Tuple[str, List[Dict]]]:
         """
-        Search for a specific venue's official website using Serper API.
-        Fails if Serper API is not available or returns no results.
+        Find each venue's websites and the PDFs on them, yielding them venue by venue.
+        
+        One batched Serper search covers every venue. After that, each venue is validated
+        and crawled on its own, so crawling starts as soon as that venue's websites are
+        validated and the caller can download early venues' PDFs while later ones are
+        still being discovered.
+        
+        Args:
+            venue_names: List of venue names to search for
+            
+        Yields:
+            (venue_name, pdfs) in the order of venue_names
         """
         if not SERPER_API_KEY:
             raise Exception("Serper API key is required for venue website search")
         
+        for venue_name in venue_names:
+            logging.info(f"Searching for websites for venue: {venue_name}")
+        serper_results = await self._serper_search(venue_names)
+        
+        async def discover(venue_name: str) -> List[Dict]:
+            websites = await self._search_venue_websites(venue_name, serper_results[venue_name])
+            return (await self.find_pdfs_on_websites({venue_name: websites}))[venue_name]
+        
+        discoveries = [asyncio.create_task(discover(venue_name)) for venue_name in venue_names]
+        try:
+            for venue_name, discovery in zip(venue_names, discoveries):
+                yield venue_name, await discovery
+        finally:
+            # A failed venue ends the search, so the remaining ones are abandoned
+            for discovery in discoveries:
+                discovery.cancel()
+    
+    async def _search_venue_websites(self, venue_name: str, serper_results) -> List[str]:
+        """
+        Validate the websites Serper found for a specific venue.
+        Fails if the Serper search failed or returned no results.
+        """
         websites = []
-        serper_results = self._serper_search(venue_name)
         if isinstance(serper_results, str) and serper_results == "error":
             raise Exception(f"Serper API search failed for venue: {venue_name}")
         
@@ -70,244 +289,531 @@ class VenueWebScraper:
         
         # Remove duplicates and validate
         unique_websites = list(set(websites))
-        validated_websites = self._validate_websites(unique_websites)
+        validated_websites = await self._validate_websites(unique_websites)
         
         if not validated_websites:
             raise Exception(f"No valid websites found for venue: {venue_name}")
         
         return validated_websites
     
-    def _serper_search(self, venue_name: str):
+    async def _serper_search(self, venue_names: List[str]) -> Dict[str, Any]:
         """
-        Search using Serper API for the official site and technical specification PDF,
+        Search using Serper API for each venue's official site and technical specification PDF,
         excluding Wikipedia and focusing on artist/event venues.
-        Returns "error" if the request fails.
+        
+        The official-site and PDF queries for all venues go out together as batched
+        requests, so the PDF search does not wait for the official-site results.
+        
+        Returns:
+            Dictionary mapping venue names to website URLs, or to "error" if their search failed
         """
-        try:
-            search_url = "https://google.serper.dev/search"
-            
-            # First search for the venue's official website
-            query = f'"{venue_name}" official website -wikipedia -tripadvisor'
-            headers = {
-                "X-API-KEY": SERPER_API_KEY,
-                "Content-Type": "application/json"
-            }
-            payload = {"q": query}
-            
-            # Add timeout and retry logic
-            response = requests.post(search_url, headers=headers, json=payload, timeout=15)
-            if response.status_code != 200:
-                logging.error(f"Serper search failed for {venue_name}: {response.status_code} {response.text}")
-                return "error"
-                
-            results = response.json()
-            websites = []
-            
+        official_queries = [
+            {"q": f'"{venue_name}" official website -wikipedia -tripadvisor'} for venue_name in venue_names
+        ]
+        pdf_queries = [
+            {"q": f'"{venue_name}" technical specifications OR equipment list filetype:pdf'} for venue_name in venue_names
+        ]
+        results = await self._serper_queries(official_queries + pdf_queries)
+        official_results, pdf_results = results[:len(venue_names)], results[len(venue_names):]
+        
+        venue_websites = {}
+        for venue_name, official, pdfs in zip(venue_names, official_results, pdf_results):
+            if official is None:
+                venue_websites[venue_name] = "error"
+                continue
             # Get organic results
-            for item in results.get('organic', []):
-                link = item.get('link')
-                if link and self._is_likely_venue_website(link, venue_name):
-                    websites.append(link)
-            
-            # If we found websites, also search specifically for PDFs
-            if websites:
-                time.sleep(1)  # Rate limiting
-                pdf_query = f'"{venue_name}" technical specifications OR equipment list filetype:pdf'
-                pdf_payload = {"q": pdf_query}
+            venue_name_re = _venue_name_pattern(venue_name)
+            websites = [
+                item['link'] for item in official.get('organic', [])
+                if item.get('link') and self._is_likely_venue_website(item['link'], venue_name_re)
+            ]
+            # If we found websites, also use the PDFs found for the venue
+            if websites and pdfs is not None:
+                websites.extend(
+                    item['link'] for item in pdfs.get('organic', [])
+                    if item.get('link') and item['link'].endswith('.pdf')
+                )
+            venue_websites[venue_name] = websites
+        
+        return venue_websites
+    
+    async def _serper_queries(self, queries: List[Dict]) -> List[Optional[Dict]]:
+        """
+        Run Serper queries as batch requests of up to SERPER_BATCH_SIZE queries each,
+        answering queries from the on-disk web cache where possible.
+        
+        Returns:
+            The results of each query, in order; None for queries whose request failed
+        """
+        async def run_batch(batch: List[Dict]) -> List[Optional[Dict]]:
+            try:
+                status, results = await self._serper_post(batch)
+            except asyncio.TimeoutError:
+                logging.error(f"Serper search timed out for {len(batch)} queries")
+                return [None] * len(batch)
+            except Exception as e:
+                logging.error(f"Serper search failed for {len(batch)} queries: {e}")
+                return [None] * len(batch)
+            if status != 200 or not isinstance(results, list) or len(results) != len(batch):
+                logging.error(f"Serper search failed for {len(batch)} queries: {status} {results}")
+                return [None] * len(batch)
+            return results
+        
+        # Queries answered within the cache TTL skip the API entirely
+        cache_paths = [self._web_cache_path('serper', orjson.dumps(query, option=orjson.OPT_SORT_KEYS).decode()) for query in queries]
+        cached = []
+        for cache_path in cache_paths:
+            entry, fresh = self._read_web_cache(cache_path)
+            cached.append(entry if fresh else None)
+        pending = [index for index, entry in enumerate(cached) if entry is None]
+        
+        batches = [pending[start:start + SERPER_BATCH_SIZE] for start in range(0, len(pending), SERPER_BATCH_SIZE)]
+        batch_results = await asyncio.gather(*[run_batch([queries[index] for index in batch]) for batch in batches])
+        for batch, results in zip(batches, batch_results):
+            for index, result in zip(batch, results):
+                cached[index] = result
+                if result is not None:
+                    self._write_web_cache(cache_paths[index], result)
+        return cached
+    
+    async def _serper_post(self, payload: Any) -> Tuple[int, Any]:
+        """
+        POST a query (or a list of queries) to Serper, respecting its rate limits.
+        
+        Queries are bounded by their own semaphore, wait out an exhausted
+        X-RateLimit window, and are retried with backoff after a 429.
+        
+        Returns:
+            The HTTP status and the decoded JSON (or the error text if the status is not 200)
+        """
+        session = self._get_http_session()
+        headers = {
+            "X-API-KEY": SERPER_API_KEY,
+            "Content-Type": "application/json"
+        }
+        delay = 0.0
+        async with self._serper_semaphore:
+            for attempt in range(SERPER_MAX_RETRIES + 1):
+                wait = self._serper_resume_at - time.monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
                 
-                try:
-                    pdf_response = requests.post(search_url, headers=headers, json=pdf_payload, timeout=15)
-                    if pdf_response.status_code == 200:
-                        pdf_results = pdf_response.json()
-                        for item in pdf_results.get('organic', []):
-                            link = item.get('link')
-                            if link and link.endswith('.pdf'):
-                                websites.append(link)
-                except Exception as e:
-                    logging.debug(f"PDF search failed for {venue_name}: {e}")
-            
-            return websites
-            
-        except requests.exceptions.Timeout:
-            logging.error(f"Serper search timed out for {venue_name}")
-            return "error"
-        except Exception as e:
-            logging.error(f"Serper search failed for {venue_name}: {e}")
-            return "error"
+                async with session.post(SERPER_SEARCH_URL, headers=headers, data=orjson.dumps(payload),
+                                        timeout=aiohttp.ClientTimeout(total=15)) as response:
+                    self._note_serper_rate_limit(response.headers)
+                    if response.status == 429 and attempt < SERPER_MAX_RETRIES:
+                        delay = self._throttle_delay(response, delay)
+                        self._serper_resume_at = max(self._serper_resume_at, time.monotonic() + delay)
+                        logging.warning(f"Serper rate limit hit, retrying in {delay:.1f}s")
+                        continue
+                    if response.status != 200:
+                        return response.status, await response.text()
+                    return response.status, orjson.loads(await response.read())
+    
+    def _note_serper_rate_limit(self, headers) -> None:
+        """Hold further Serper queries until the rate-limit window resets once no requests remain in it."""
+        reset = headers.get('X-RateLimit-Reset')
+        if headers.get('X-RateLimit-Remaining') != '0' or not reset:
+            return
+        try:
+            reset_value = float(reset)
+        except ValueError:
+            return
+        # The reset is either a Unix timestamp or a number of seconds from now
+        seconds = reset_value - time.time() if reset_value > 1e9 else reset_value
+        self._serper_resume_at = max(self._serper_resume_at, time.monotonic() + min(seconds, MAX_HOST_DELAY_SECONDS))
     
-    def _is_likely_venue_website(self, url: str, venue_name: str) -> bool:
-        """Check if a URL is likely to be the venue's official website."""
-        domain = urlparse(url).netloc.lower()
-        venue_words = venue_name.lower().split()
+    def _is_likely_venue_website(self, url: str, venue_name_re: Optional[re.Pattern]) -> bool:
+        """
+        Check if a URL is likely to be the venue's official website.
+        
+        Args:
+            url: Candidate URL
+            venue_name_re: The venue's name words, from _venue_name_pattern
+        """
+        domain = _cached_netloc(url)
         
         # Check if venue name appears in domain
-        for word in venue_words:
-            if len(word) > 3 and word in domain:
-                return True
+        if venue_name_re is not None and venue_name_re.search(domain):
+            return True
         
         # Check for venue-related keywords in domain
-        venue_keywords = ['center', 'centre', 'theatre', 'theater', 'hall', 'arts', 'opera', 'auditorium']
-        if any(keyword in domain for keyword in venue_keywords):
+        if _VENUE_DOMAIN_RE.search(domain):
             return True
             
         return False
     
     # Domain guessing removed as per user feedback.
     
-    def _validate_websites(self, websites: List[str]) -> List[str]:
+    async def _fetch_page(self, url: str, cache: bool = False, max_bytes: Optional[int] = None,
+                          html_only: bool = False, missing_ok: bool = False) -> bytes:
+        """
+        Fetch a page over the shared session and return its raw bytes.
+        
+        Pages are never decoded here: lxml detects the encoding itself and keyword
+        checks scan the bytes case-insensitively, so no text copies are made.
+        Requests are bounded per host and overall, so different hosts are fetched in
+        parallel without bursting any single one.
+        
+        Args:
+            url: Page URL
+            cache: Reuse the on-disk copy while it is fresh, and revalidate a stale one
+                with If-None-Match / If-Modified-Since instead of downloading it again
+            max_bytes: Stop reading the body after this many bytes
+            html_only: Return an empty body, without downloading it, for responses
+                announced as something other than HTML
+            missing_ok: Return (and cache) an empty body for a 404 or 410 instead of
+                raising, for optional files such as robots.txt and sitemaps
+        """
+        cached, cached_body, fresh = self._read_cached_page(url) if cache else (None, None, False)
+        if cached is not None and not cached.get('complete', True) and (max_bytes is None or len(cached_body) < max_bytes):
+            # Only the head of this page was cached (by validation), but more of it is needed now
+            cached = None
+        if cached is not None and cached.get('missing') and not missing_ok:
+            # Remembered as missing for an optional-file lookup; this caller needs the page itself
+            cached = None
+        if cached is not None and html_only and not _is_html(cached.get('content_type')):
+            return b''
+        headers = {}
+        if cached is not None:
+            if fresh:
+                return cached_body
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+        
+        session = self._get_http_session()
+        host = _cached_netloc(url)
+        headers['User-Agent'] = self._user_agent(host)
+        async with self._host_semaphores[host]:
+            await self._wait_for_host(host)
+            async with self._request_semaphore, session.get(url, headers=headers, timeout=PAGE_TIMEOUT) as response:
+                if response.status == 304 and cached is not None:
+                    self._touch_web_cache(self._web_cache_path('pages', url))
+                    return cached_body
+                if response.status in (404, 410) and missing_ok:
+                    # Remember missing optional files (robots.txt, sitemaps) as empty
+                    if cache:
+                        self._write_cached_page(url, {}, b'', complete=True, missing=True)
+                    return b''
+                response.raise_for_status()
+                if html_only and not _is_html(response.headers.get('Content-Type')):
+                    logging.debug(f"Skipping non-HTML page {url}")
+                    return b''
+                if max_bytes is None:
+                    body = await response.read()
+                else:
+                    body = await self._read_limited(response, max_bytes)
+                if cache:
+                    self._write_cached_page(url, response.headers, body, complete=max_bytes is None or len(body) < max_bytes)
+                return body
+    
+    async def _read_limited(self, response: aiohttp.ClientResponse, max_bytes: int) -> bytes:
+        """Read a response body up to max_bytes; the connection is dropped rather than drained past that."""
+        chunks = []
+        received = 0
+        async for chunk in response.content.iter_chunked(64 * 1024):
+            chunks.append(chunk)
+            received += len(chunk)
+            if received >= max_bytes:
+                break
+        return b''.join(chunks)[:max_bytes]
+    
+    def _read_cached_page(self, url: str) -> Tuple[Optional[Dict], Optional[bytes], bool]:
+        """Return a cached page's validators (None if missing), its body and whether it is fresh."""
+        cache_path = self._web_cache_path('pages', url)
+        cached, fresh = self._read_web_cache(cache_path)
+        if cached is None:
+            return None, None, False
+        try:
+            with open(f"{cache_path[:-len('.json')]}.html", 'rb') as f:
+                return cached, f.read(), fresh
+        except OSError:
+            return None, None, False
+    
+    def _write_cached_page(self, url: str, headers, body: bytes, complete: bool, missing: bool = False):
+        """Store a page body, then the validators that mark the entry complete."""
+        if not WEB_CACHE_ENABLED:
+            return
+        cache_path = self._web_cache_path('pages', url)
+        body_path = f"{cache_path[:-len('.json')]}.html"
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            temp_path = f"{body_path}.{id(body)}.tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(body)
+            os.replace(temp_path, body_path)
+        except OSError as e:
+            logging.warning(f"Could not write web cache {body_path}: {e}")
+            return
+        self._write_web_cache(cache_path, {
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+            'content_type': headers.get('Content-Type'),
+            'complete': complete,
+            'missing': missing
+        })
+    
+    def _web_cache_path(self, kind: str, key: str) -> str:
+        """Return the web cache file for a key (a URL or serialized query)."""
+        return os.path.join(WEB_CACHE_DIR, kind, f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json")
+    
+    def _read_web_cache(self, cache_path: str) -> Tuple[Optional[Any], bool]:
+        """
+        Return a cached entry (None if missing) and whether it is younger than the cache TTL.
+        """
+        if not WEB_CACHE_ENABLED:
+            return None, False
+        try:
+            fresh = time.time() - os.path.getmtime(cache_path) < WEB_CACHE_TTL_HOURS * 3600
+            with open(cache_path, 'rb') as f:
+                return orjson.loads(f.read()), fresh
+        except (OSError, ValueError):
+            return None, False
+    
+    def _write_web_cache(self, cache_path: str, entry: Any):
+        """Store a cache entry; cache failures never fail the search."""
+        if not WEB_CACHE_ENABLED:
+            return
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            temp_path = f"{cache_path}.{id(entry)}.tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(orjson.dumps(entry))
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            logging.warning(f"Could not write web cache {cache_path}: {e}")
+    
+    def _touch_web_cache(self, cache_path: str):
+        """Mark a revalidated cache entry as fresh again."""
+        try:
+            os.utime(cache_path)
+        except OSError:
+            pass
+    
+    async def _validate_websites(self, websites: List[str]) -> List[str]:
         """Validate that websites are accessible and likely to be official venue sites."""
-        validated = []
-        venue_keywords = [
-            "center", "centre", "theatre", "theater", "hall", "arts", "opera", "auditorium", "stadium", "arena", "philharmonic", "orchestra"
-        ]
-        exclude_domains = [
-            "dictionary.cambridge.org", "thesaurus", "wikipedia.org", "wikidata.org", "wikimedia.org", "youtube.com", "facebook.com", "twitter.com", "linkedin.com", "tripadvisor.com"
-        ]
-        for website in websites:
+        async def is_valid(website: str) -> bool:
             try:
-                domain = urlparse(website).netloc.lower()
-                if any(ex in domain for ex in exclude_domains):
-                    continue
-                response = self.session.get(website, timeout=10)
-                if response.status_code == 200:
-                    # Decode with errors="replace" to avoid decoding warnings
-                    try:
-                        content = response.content.decode(response.encoding or "utf-8", errors="replace").lower()
-                    except Exception:
-                        content = response.text.lower()
-                    # Must contain venue keywords in domain or content
-                    if (
-                        any(kw in domain for kw in venue_keywords)
-                        or any(kw in content for kw in venue_keywords)
-                    ):
-                        validated.append(website)
+                domain = _cached_netloc(website)
+                if _EXCLUDED_DOMAIN_RE.search(domain):
+                    return False
+                # The keywords are expected near the top of a venue's page, so the rest is not downloaded
+                content = await self._fetch_page(website, cache=True, max_bytes=VALIDATION_MAX_BYTES)
+                # Must contain venue keywords in domain or content
+                return bool(_VENUE_CONTENT_RE.search(domain) or _VENUE_CONTENT_BYTES_RE.search(content))
             except Exception as e:
                 logging.debug(f"Website validation failed for {website}: {e}")
-                continue
-        return validated
+                return False
+        
+        results = await asyncio.gather(*[is_valid(website) for website in websites])
+        return [website for website, valid in zip(websites, results) if valid]
     
-    def find_pdfs_on_websites(self, venue_websites: Dict[str, List[str]]) -> Dict[str, List[Dict]]:
+    async def find_pdfs_on_websites(self, venue_websites: Dict[str, List[str]]) -> Dict[str, List[Dict]]:
         """
         Find technical specification PDFs on venue websites.
         
+        All venues and websites are searched concurrently over the shared session.
+        
         Args:
             venue_websites: Dictionary mapping venue names to website URLs
             
         Returns:
             Dictionary mapping venue names to lists of PDF information
         """
-        venue_pdfs = {}
+        async def find_on_site(website: str, venue_name: str) -> List[Dict]:
+            try:
+                return await self._find_pdfs_on_site(website, venue_name)
+            except Exception as e:
+                logging.error(f"Error searching PDFs on {website}: {e}")
+                return []
         
-        for venue_name, websites in venue_websites.items():
+        async def find_for_venue(venue_name: str, websites: List[str]) -> List[Dict]:
             logging.info(f"Searching for PDFs on websites for venue: {venue_name}")
-            pdfs = []
-            
-            for website in websites:
-                try:
-                    site_pdfs = self._find_pdfs_on_site(website, venue_name)
-                    pdfs.extend(site_pdfs)
-                    time.sleep(REQUEST_DELAY_SECONDS)
-                    
-                except Exception as e:
-                    logging.error(f"Error searching PDFs on {website}: {e}")
-                    continue
-            
-            venue_pdfs[venue_name] = pdfs
-            
-        return venue_pdfs
+            site_pdfs = await asyncio.gather(*[find_on_site(website, venue_name) for website in websites])
+            # Sites on the same host share sitemaps, so the same PDF can be found through several of them
+            unique_pdfs = {}
+            for pdfs in site_pdfs:
+                for pdf in pdfs:
+                    unique_pdfs.setdefault(_canonical_url(pdf['url']), pdf)
+            return list(unique_pdfs.values())
+        
+        results = await asyncio.gather(*[
+            find_for_venue(venue_name, websites) for venue_name, websites in venue_websites.items()
+        ])
+        return dict(zip(venue_websites, results))
     
-    def _find_pdfs_on_site(self, base_url: str, venue_name: str) -> List[Dict]:
-        """Find PDFs on a specific website."""
-        if base_url in self.visited_urls:
+    async def _find_pdfs_on_site(self, base_url: str, venue_name: str) -> List[Dict]:
+        """
+        Find PDFs on a specific website.
+        
+        Each site is crawled once per scraper; later requests for the same site (by
+        canonical URL) reuse that crawl's PDFs for their venue.
+        """
+        site_key = _canonical_url(base_url)
+        crawl = self._site_crawls.get(site_key)
+        if crawl is None or crawl.cancelled():
+            crawl = asyncio.ensure_future(self._crawl_site(base_url, venue_name))
+            self._site_crawls[site_key] = crawl
+        pdfs = await crawl
+        return [dict(pdf_info, venue=venue_name) for pdf_info in pdfs]
+    
+    async def _crawl_site(self, base_url: str, venue_name: str) -> List[Dict]:
+        """
+        Crawl a website for PDFs.
+        
+        When the site's sitemaps list relevant PDFs under its path, those are used and no pages
+        are crawled. Otherwise the site is crawled breadth-first by CRAWL_WORKERS workers sharing
+        one frontier, following up to 5 relevant links per page and at most CRAWL_MAX_DEPTH links
+        deep. Either way at most MAX_PDFS_PER_SITE PDFs are returned.
+        Pages are only visited once per scraper, compared by canonical URL.
+        """
+        site_key = _visited_key(base_url)
+        if site_key in self.visited_urls:
             return []
             
-        self.visited_urls.add(base_url)
+        self.visited_urls.add(site_key)
+        
+        sitemap_pdfs = await self._find_pdfs_in_sitemaps(base_url)
+        if sitemap_pdfs:
+            return [{
+                'url': pdf_url,
+                'title': title,
+                'venue': venue_name,
+                'source_page': sitemap_url
+            } for pdf_url, title, sitemap_url in sitemap_pdfs]
+        
         pdfs = []
+        frontier = asyncio.Queue()
+        frontier.put_nowait((base_url, 0))
         
-        try:
-            # Get main page
-            response = self.session.get(base_url, timeout=10)
-            response.raise_for_status()
-
-            # Decode with errors="replace" to avoid decoding warnings
-            try:
-                html = response.content.decode(response.encoding or "utf-8", errors="replace")
-            except Exception:
-                html = response.text
-            soup = BeautifulSoup(html, 'html.parser')
-
-            # Find direct PDF links
-            pdf_links = soup.find_all('a', href=re.compile(r'\.pdf$', re.I))
-            
-            for link in pdf_links:
-                href = link.get('href')
-                if href:
-                    full_url = urljoin(base_url, href)
-                    if self._is_relevant_pdf(link, full_url):
-                        pdfs.append({
-                            'url': full_url,
-                            'title': link.get_text(strip=True) or 'Unknown',
-                            'venue': venue_name,
-                            'source_page': base_url
-                        })
-            
-            # Look for pages that might contain PDFs
-            relevant_pages = self._find_relevant_pages(soup, base_url)
-            
-            for page_url in relevant_pages[:5]:  # Limit depth
-                if page_url not in self.visited_urls:
-                    try:
-                        page_pdfs = self._find_pdfs_on_site(page_url, venue_name)
-                        pdfs.extend(page_pdfs)
-                    except Exception as e:
+        async def worker():
+            while True:
+                page_url, depth = await frontier.get()
+                try:
+                    page_pdfs, relevant_pages = await self._scan_page(page_url, venue_name)
+                    pdfs.extend(page_pdfs)
+                    if depth < CRAWL_MAX_DEPTH:
+                        for next_url in relevant_pages[:5]:  # Limit breadth
+                            page_key = _visited_key(next_url)
+                            if page_key not in self.visited_urls:
+                                self.visited_urls.add(page_key)
+                                frontier.put_nowait((next_url, depth + 1))
+                except Exception as e:
+                    if depth == 0:
+                        logging.error(f"Error processing site {page_url}: {e}")
+                    else:
                         logging.debug(f"Error searching page {page_url}: {e}")
-                        continue
-                        
-        except Exception as e:
-            logging.error(f"Error processing site {base_url}: {e}")
+                finally:
+                    frontier.task_done()
+        
+        workers = [asyncio.create_task(worker()) for _ in range(CRAWL_WORKERS)]
+        try:
+            await frontier.join()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
             
-        return pdfs
+        return pdfs[:MAX_PDFS_PER_SITE]
     
-    def _is_relevant_pdf(self, link_element, pdf_url: str) -> bool:
-        """Check if a PDF link is likely to contain technical specifications."""
-        link_text = link_element.get_text(strip=True).lower()
-        href = link_element.get('href', '').lower()
-        
-        # Check for relevant keywords
-        relevant_keywords = PDF_KEYWORDS + ['spec', 'technical', 'equipment', 'av', 'audio', 'visual']
+    async def _find_pdfs_in_sitemaps(self, base_url: str) -> List[Tuple[str, str, str]]:
+        """
+        Return the relevant PDFs listed in the sitemaps of a site's host, scanning each host once.
         
-        for keyword in relevant_keywords:
-            if keyword in link_text or keyword in href:
-                return True
-                
-        return False
+        Only PDFs under the site's own path directory are kept (a venue on a shared host, such
+        as a city portal, does not get every venue's documents), at most MAX_PDFS_PER_SITE.
+        """
+        host = _cached_netloc(base_url)
+        scan = self._sitemap_scans.get(host)
+        if scan is None or scan.cancelled():
+            scan = asyncio.ensure_future(self._scan_sitemaps(base_url))
+            self._sitemap_scans[host] = scan
+        path = urlsplit(base_url).path
+        path_prefix = path[:path.rfind('/') + 1] or '/'
+        pdfs = [pdf for pdf in await scan if urlsplit(pdf[0]).path.startswith(path_prefix)]
+        return pdfs[:MAX_PDFS_PER_SITE]
     
-    def _find_relevant_pages(self, soup: BeautifulSoup, base_url: str) -> List[str]:
-        """Find pages that might contain technical specifications."""
-        relevant_pages = []
+    async def _scan_sitemaps(self, base_url: str) -> List[Tuple[str, str, str]]:
+        """
+        Read a host's sitemaps (those named in robots.txt, else /sitemap.xml) for relevant PDFs.
         
-        # Look for navigation links with relevant keywords
-        nav_keywords = ['technical', 'specs', 'specifications', 'equipment', 'av', 'audio', 'visual', 'production']
+        Sitemap indexes are followed up to SITEMAP_MAX_FILES sitemaps in total, to sitemaps on
+        the same host only. Missing or unparsable sitemaps simply yield nothing, leaving the
+        site to be crawled.
         
-        for link in soup.find_all('a', href=True):
-            link_text = link.get_text(strip=True).lower()
-            href = link.get('href').lower()
+        Returns:
+            (pdf_url, title, sitemap_url) for each relevant PDF on the host, titled by its filename
+        """
+        host = _cached_netloc(base_url)
+        sitemap_urls = []
+        try:
+            robots = await self._fetch_page(urljoin(base_url, '/robots.txt'), cache=True, missing_ok=True,
+                                           max_bytes=SITEMAP_MAX_BYTES)
+            sitemap_urls = [match.group(1).decode('utf-8', 'replace') for match in _ROBOTS_SITEMAP_RE.finditer(robots)]
+        except Exception as e:
+            logging.debug(f"No robots.txt for {base_url}: {e}")
+        if not sitemap_urls:
+            sitemap_urls = [urljoin(base_url, '/sitemap.xml')]
+        
+        pdfs = []
+        seen = set()
+        while sitemap_urls and len(seen) < SITEMAP_MAX_FILES:
+            sitemap_url = sitemap_urls.pop(0)
+            if sitemap_url in seen:
+                continue
+            seen.add(sitemap_url)
+            try:
+                content = await self._fetch_page(sitemap_url, cache=True, missing_ok=True, max_bytes=SITEMAP_MAX_BYTES)
+                if len(content) >= HTML_PARSE_POOL_MIN_BYTES:
+                    is_index, locs = await asyncio.get_running_loop().run_in_executor(
+                        self._get_parse_pool(), _parse_sitemap, content
+                    )
+                else:
+                    is_index, locs = _parse_sitemap(content)
+            except Exception as e:
+                logging.debug(f"No usable sitemap at {sitemap_url}: {e}")
+                continue
             
-            if any(keyword in link_text or keyword in href for keyword in nav_keywords):
-                full_url = urljoin(base_url, link.get('href'))
-                if self._is_same_domain(base_url, full_url):
-                    relevant_pages.append(full_url)
-                    
-        return relevant_pages
+            if is_index:
+                sitemap_urls.extend(loc for loc in locs if _is_same_domain(loc, host))
+                continue
+            for loc in locs:
+                if _PDF_HREF_RE.search(loc) and _RELEVANT_PDF_RE.search(loc) and _is_same_domain(loc, host):
+                    title = os.path.basename(urlsplit(loc).path) or 'Unknown'
+                    pdfs.append((loc, title, sitemap_url))
+        
+        if pdfs:
+            logging.info(f"Found {len(pdfs)} PDFs in sitemaps for {base_url}")
+        return pdfs
     
-    def _is_same_domain(self, url1: str, url2: str) -> bool:
-        """Check if two URLs are from the same domain."""
-        try:
-            domain1 = urlparse(url1).netloc
-            domain2 = urlparse(url2).netloc
-            return domain1 == domain2
-        except:
-            return False
+    async def _scan_page(self, page_url: str, venue_name: str) -> Tuple[List[Dict], List[str]]:
+        """Fetch a page and return the relevant PDFs it links to and the pages worth crawling next."""
+        # Only links are needed, so pages are read up to HTML_MAX_BYTES and non-HTML responses skipped
+        content = await self._fetch_page(page_url, cache=True, max_bytes=HTML_MAX_BYTES, html_only=True)
+        if len(content) >= HTML_PARSE_POOL_MIN_BYTES:
+            # Large pages are parsed in worker processes so the event loop keeps serving fetches
+            pdf_links, relevant_pages = await asyncio.get_running_loop().run_in_executor(
+                self._get_parse_pool(), _parse_page_links, content, page_url
+            )
+        else:
+            pdf_links, relevant_pages = _parse_page_links(content, page_url)
+        
+        pdfs = [{
+            'url': pdf_url,
+            'title': title,
+            'venue': venue_name,
+            'source_page': page_url
+        } for pdf_url, title in pdf_links]
+        return pdfs, relevant_pages
+    
+    def _get_parse_pool(self) -> ProcessPoolExecutor:
+        """Return the HTML parsing process pool, creating it on first use."""
+        if self._parse_pool is None:
+            self._parse_pool = ProcessPoolExecutor(max_workers=HTML_PARSE_WORKERS,
+                                                   mp_context=multiprocessing.get_context(PROCESS_START_METHOD))
+        return self._parse_pool
     
     async def download_pdfs(self, venue_pdfs: Dict[str, List[Dict]]) -> Dict[str, List[Dict]]:
         """
@@ -320,39 +826,95 @@ class VenueWebScraper:
             Updated dictionary with local file paths
         """
         os.makedirs(PDF_CACHE_DIR, exist_ok=True)
+        session = self._get_http_session()
         
-        async with aiohttp.ClientSession() as session:
-            tasks = []
-            
-            for venue_name, pdfs in venue_pdfs.items():
-                for pdf_info in pdfs:
-                    task = self._download_pdf(session, pdf_info, venue_name)
-                    tasks.append(task)
-            
-            # Limit concurrent downloads
-            semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
-            
-            async def bounded_download(task):
-                async with semaphore:
-                    return await task
-            
-            results = await asyncio.gather(*[bounded_download(task) for task in tasks], return_exceptions=True)
-            
-            # Update PDF info with download results
-            result_index = 0
-            for venue_name, pdfs in venue_pdfs.items():
-                for pdf_info in pdfs:
-                    result = results[result_index]
-                    if isinstance(result, str):  # Success - file path returned
-                        pdf_info['local_path'] = result
-                        pdf_info['downloaded'] = True
-                    else:  # Exception or failure
-                        pdf_info['downloaded'] = False
-                        pdf_info['error'] = str(result) if result else 'Download failed'
-                    result_index += 1
+        # The same document linked for several venues or from several pages is downloaded once
+        downloads = {}
+        for venue_name, pdfs in venue_pdfs.items():
+            for pdf_info in pdfs:
+                url_key = _canonical_url(pdf_info['url'])
+                if url_key not in downloads:
+                    downloads[url_key] = self._shared_download(session, url_key, pdf_info, venue_name)
+        
+        results = dict(zip(downloads, await asyncio.gather(*downloads.values(), return_exceptions=True)))
+        
+        # Update PDF info with download results
+        for venue_name, pdfs in venue_pdfs.items():
+            for pdf_info in pdfs:
+                result = results[_canonical_url(pdf_info['url'])]
+                if isinstance(result, str):  # Success - file path returned
+                    pdf_info['local_path'] = result
+                    pdf_info['downloaded'] = True
+                else:  # Exception or failure
+                    pdf_info['downloaded'] = False
+                    pdf_info['error'] = str(result) if result else 'Download failed'
         
         return venue_pdfs
     
+    async def _shared_download(self, session: aiohttp.ClientSession, url_key: str, pdf_info: Dict, venue_name: str) -> Optional[str]:
+        """
+        Download a PDF once per scraper, keyed by its canonical URL.
+        
+        Calls for a URL that is already being downloaded (e.g. for another venue) join that
+        download, and later calls reuse its file. Completed downloads are also recorded in the
+        web cache, so a later run finds the file even when it comes up for a different venue.
+        """
+        download = self._downloads.get(url_key)
+        if download is None or download.cancelled() or (download.done() and download.result() is None):
+            download = asyncio.ensure_future(self._bounded_download(session, url_key, pdf_info, venue_name))
+            self._downloads[url_key] = download
+        # One caller being cancelled must not cancel the download for the others
+        return await asyncio.shield(download)
+    
+    async def _bounded_download(self, session: aiohttp.ClientSession, url_key: str, pdf_info: Dict, venue_name: str) -> Optional[str]:
+        """Download a PDF within the per-host and global download limits, reusing a file recorded in the web cache."""
+        cache_path = self._web_cache_path('download', url_key)
+        entry, _ = self._read_web_cache(cache_path)
+        if entry and os.path.exists(entry['path']):
+            return entry['path']
+        
+        # Bounded per host first so a busy host does not hold global slots that downloads
+        # from other hosts could use
+        async with self._host_semaphores[_cached_netloc(pdf_info['url'])], self._download_semaphore:
+            filepath = await self._download_pdf(session, pdf_info, venue_name)
+        if filepath:
+            self._write_web_cache(cache_path, {'path': filepath})
+        return filepath
+    
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        """
+        Return the pooled HTTP session, creating it (and the request limits) on first use.
+        
+        Idle connections are kept alive long enough to be reused across a venue's pages,
+        Serper queries and downloads, so each host pays its TCP and TLS handshakes once.
+        Responses are requested compressed (aiohttp sends Accept-Encoding and decodes),
+        including brotli when the Brotli package is installed.
+        Connecting is capped separately from the overall timeout, so an unreachable
+        host fails in seconds instead of holding a download slot for the full timeout.
+        """
+        if self._http_session is None or self._http_session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=DOWNLOAD_CONNECTION_LIMIT,
+                limit_per_host=DOWNLOAD_CONNECTIONS_PER_HOST,
+                keepalive_timeout=HTTP_KEEPALIVE_SECONDS,
+                ttl_dns_cache=300,
+                # c-ares lookups on the event loop instead of getaddrinfo in a thread, when aiodns is installed
+                resolver=aiohttp.AsyncResolver() if aiodns else None
+            )
+            self._http_session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=PDF_TIMEOUT_SECONDS, sock_connect=10),
+                headers={'User-Agent': self.user_agent}
+            )
+            self._request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+            self._download_semaphore = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
+            self._host_semaphores = defaultdict(lambda: asyncio.Semaphore(MAX_DOWNLOADS_PER_HOST))
+            self._host_delays = {}
+            self._host_next_request = {}
+            self._serper_semaphore = asyncio.Semaphore(SERPER_MAX_CONCURRENT_REQUESTS)
+            self._serper_resume_at = 0.0
+        return self._http_session
+    
     async def _download_pdf(self, session: aiohttp.ClientSession, pdf_info: Dict, venue_name: str) -> Optional[str]:
         """Download a single PDF file."""
         try:
@@ -362,52 +924,131 @@ class VenueWebScraper:
             filename = self._generate_pdf_filename(pdf_info, venue_name)
             filepath = os.path.join(PDF_CACHE_DIR, filename)
             
-            # Skip if already downloaded
+            # Skip if this URL was already downloaded (filenames are keyed by URL)
             if os.path.exists(filepath):
                 return filepath
             
-            async with session.get(url, timeout=PDF_TIMEOUT_SECONDS) as response:
-                if response.status == 200:
-                    content_length = response.headers.get('content-length')
-                    if content_length and int(content_length) > MAX_PDF_SIZE_MB * 1024 * 1024:
-                        raise Exception(f"PDF too large: {content_length} bytes")
+            # Check type and size up front, so pages and oversized files are never streamed
+            await self._precheck_pdf(session, url)
+            
+            host = _cached_netloc(url)
+            for attempt in range(DOWNLOAD_MAX_RETRIES + 1):
+                await self._wait_for_host(host)
+                
+                async with session.get(url, headers={'User-Agent': self._user_agent(host)}) as response:
+                    if response.status == 429 and attempt < DOWNLOAD_MAX_RETRIES:
+                        self._host_delays[host] = self._throttle_delay(response, self._host_delays.get(host, 0))
+                        # The host's next request (from any download or page fetch) waits out the backoff
+                        self._host_next_request[host] = max(self._host_next_request.get(host, 0.0),
+                                                            time.monotonic() + self._host_delays[host])
+                        logging.warning(f"Throttled by {host}, retrying in {self._host_delays[host]:.1f}s")
+                        continue
+                    if response.status != 200:
+                        raise Exception(f"HTTP {response.status}")
                     
-                    content = await response.read()
+                    self._check_pdf_headers(response.headers)
+                    max_bytes = MAX_PDF_SIZE_MB * 1024 * 1024
                     
-                    with open(filepath, 'wb') as f:
-                        f.write(content)
+                    # Stream to a temporary file so a failed download never looks like a cached PDF
+                    temp_path = f"{filepath}.{id(pdf_info)}.part"
+                    try:
+                        received = 0
+                        with open(temp_path, 'wb') as f:
+                            async for chunk in response.content.iter_chunked(64 * 1024):
+                                received += len(chunk)
+                                if received > max_bytes:
+                                    raise Exception(f"PDF too large: more than {max_bytes} bytes")
+                                f.write(chunk)
+                        os.replace(temp_path, filepath)
+                    finally:
+                        if os.path.exists(temp_path):
+                            os.remove(temp_path)
                     
                     logging.info(f"Downloaded PDF: {filename}")
                     return filepath
-                else:
-                    raise Exception(f"HTTP {response.status}")
                     
         except Exception as e:
             logging.error(f"Failed to download PDF {pdf_info['url']}: {e}")
             return None
     
+    async def _precheck_pdf(self, session: aiohttp.ClientSession, url: str):
+        """
+        Send a HEAD request and raise if it shows the URL is not a PDF or is too large.
+        
+        Servers that reject or fail the HEAD request are given the benefit of the doubt;
+        the GET response is checked again anyway.
+        """
+        try:
+            host = _cached_netloc(url)
+            await self._wait_for_host(host)
+            async with session.head(url, headers={'User-Agent': self._user_agent(host)}, allow_redirects=True,
+                                    timeout=aiohttp.ClientTimeout(total=10)) as response:
+                if response.status != 200:
+                    return
+                self._check_pdf_headers(response.headers)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logging.debug(f"HEAD request failed for {url}: {e}")
+    
+    def _check_pdf_headers(self, headers):
+        """Raise if response headers announce a non-PDF content type or a file over MAX_PDF_SIZE_MB."""
+        content_type = headers.get('content-type', '').split(';')[0].strip().lower()
+        if content_type and content_type not in PDF_CONTENT_TYPES:
+            raise Exception(f"Not a PDF: {content_type}")
+        content_length = headers.get('content-length')
+        if content_length and content_length.isdigit() and int(content_length) > MAX_PDF_SIZE_MB * 1024 * 1024:
+            raise Exception(f"PDF too large: {content_length} bytes")
+    
+    async def _wait_for_host(self, host: str):
+        """
+        Pace requests to a website host by reserving its next free start time.
+        
+        Starts are spaced 1 / MAX_REQUESTS_PER_HOST_PER_SECOND apart, and a 429 from the
+        host pushes its next start back by the backoff delay; other hosts are never held up.
+        """
+        interval = 1 / MAX_REQUESTS_PER_HOST_PER_SECOND if MAX_REQUESTS_PER_HOST_PER_SECOND > 0 else 0.0
+        now = time.monotonic()
+        start = max(now, self._host_next_request.get(host, 0.0))
+        self._host_next_request[host] = start + interval
+        if start > now:
+            await asyncio.sleep(start - now)
+    
+    def _user_agent(self, host: str) -> str:
+        """
+        Return the User-Agent for a website host, picked at random on first use.
+        
+        Agents rotate across hosts, but each host always sees the same one, as a
+        returning browser would, and its pooled connections stay reusable.
+        """
+        return self._host_user_agents.setdefault(host, random.choice(USER_AGENTS))
+    
+    def _throttle_delay(self, response: aiohttp.ClientResponse, previous_delay: float) -> float:
+        """Delay before the next request to a host that answered 429: its Retry-After, else double the last delay."""
+        retry_after = response.headers.get('Retry-After', '')
+        if retry_after.isdigit():
+            delay = float(retry_after)
+        else:
+            delay = max(REQUEST_DELAY_SECONDS, previous_delay * 2)
+        return min(delay, MAX_HOST_DELAY_SECONDS)
+    
     def _generate_pdf_filename(self, pdf_info: Dict, venue_name: str) -> str:
-        """Generate a safe filename for the PDF."""
-        # Clean venue name and title
-        clean_venue = re.sub(r'[^a-zA-Z0-9\s]', '', venue_name)
-        clean_venue = re.sub(r'\s+', '_', clean_venue.strip())
-        
-        clean_title = re.sub(r'[^a-zA-Z0-9\s]', '', pdf_info.get('title', 'spec'))
-        clean_title = re.sub(r'\s+', '_', clean_title.strip())
-        
-        # Create filename
-        filename = f"{clean_venue}_{clean_title}.pdf"
-        
-        # Ensure unique filename
-        counter = 1
-        base_filename = filename
-        while os.path.exists(os.path.join(PDF_CACHE_DIR, filename)):
-            name, ext = os.path.splitext(base_filename)
-            filename = f"{name}_{counter}{ext}"
-            counter += 1
-            
-        return filename
+        """
+        Generate a safe filename for the PDF.
+        
+        The name is derived from the venue and a hash of the URL, so the same
+        document maps to the same file on every run and is only downloaded once.
+        """
+        # Clean venue name
+        clean_venue = _NON_ALNUM_RE.sub('', venue_name)
+        clean_venue = _WHITESPACE_RE.sub('_', clean_venue.strip())
+        
+        url_key = hashlib.blake2b(_canonical_url(pdf_info['url']).encode(), digest_size=16).hexdigest()
+        return f"{clean_venue}_{url_key}.pdf"
     
-    def close(self):
-        """Clean up resources."""
-        self.session.close()
+    async def close_async(self):
+        """Clean up resources, closing the pooled HTTP session and the parsing pool."""
+        if self._http_session is not None and not self._http_session.closed:
+            await self._http_session.close()
+        self._http_session = None
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown(cancel_futures=True)
+            self._parse_pool = None